@@ -0,0 +1,246 @@
+import math
+import os
+
+from PyQt6.QtCore import QElapsedTimer, QEvent, QObject, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QGuiApplication
+
+BASE_INTERVAL_MS = 20  # the blob speeds are tuned per 20 ms step
+IDLE_INTERVAL_MS = 250
+MAX_STEPS = 5
+
+FULL = "full"
+LOW_POWER = "low_power"
+REDUCED = "reduced"
+MOTION_MODES = (FULL, LOW_POWER, REDUCED)
+
+# (fps, blob frame edge in px) from best to cheapest; the governor walks this
+# list to keep background painting within PAINT_BUDGET. The blobs drift a few
+# pixels per frame, so every other refresh at 60 Hz is enough at the top.
+LEVELS = [(30, 480), (30, 320), (20, 320), (15, 240), (10, 160)]
+LOW_POWER_LEVEL = 3
+PAINT_BUDGET = 0.10  # fraction of one core
+GOVERNOR_WINDOW_MS = 1000
+HOLD_MS = 30_000  # how long backgrounds stay still when even the cheapest level is over budget
+IDLE_TIMEOUT_MS = 120_000
+
+INPUT_EVENTS = {
+    QEvent.Type.MouseMove, QEvent.Type.MouseButtonPress, QEvent.Type.KeyPress,
+    QEvent.Type.Wheel, QEvent.Type.TouchBegin, QEvent.Type.HoverMove,
+}
+
+_motion_mode = os.environ.get("NUTRIFIT_MOTION", FULL)
+if _motion_mode not in MOTION_MODES:
+    _motion_mode = FULL
+
+
+def motion_mode():
+    """The app-wide motion setting: FULL, LOW_POWER or REDUCED (no decorative motion)."""
+    return _motion_mode
+
+
+def reduced_motion():
+    return _motion_mode == REDUCED
+
+
+def set_motion_mode(mode):
+    global _motion_mode
+    if mode not in MOTION_MODES:
+        raise ValueError(f"unknown motion mode {mode!r}")
+    _motion_mode = mode
+    if AnimationClock._instance is not None:
+        AnimationClock._instance.apply_motion_mode()
+
+
+def frame_interval(max_fps):
+    """Tick interval in ms: the display refresh period, or a whole multiple of it above ``max_fps``."""
+    screen = QGuiApplication.primaryScreen()
+    refresh = screen.refreshRate() if screen is not None else 0
+    if not refresh or refresh <= 0:
+        refresh = max_fps
+    divisor = max(1, math.ceil(refresh / max_fps))
+    return max(1, round(1000 * divisor / refresh))
+
+
+def on_screen(widget):
+    """True when some part of ``widget`` can actually be seen."""
+    if not widget.isVisible():
+        return False
+    window = widget.window()
+    if window.isMinimized():
+        return False
+    handle = window.windowHandle()
+    if handle is not None and not handle.isExposed():
+        return False
+    return not widget.visibleRegion().isEmpty()
+
+
+class AnimationClock(QObject):
+    """Drives every animated background from one process-wide timer.
+
+    Widgets ``register`` themselves and get ``animate_blobs(steps)`` called
+    once per tick, where ``steps`` is the elapsed time in 20 ms units, so
+    animation speed does not depend on the tick rate. Widgets that are hidden,
+    covered or in a minimized window are skipped. When none is on screen the
+    clock drops to a slow poll, and showing a registered widget wakes it.
+
+    Painters report their paint time with ``report_paint``; once a second the
+    governor compares it against PAINT_BUDGET and moves one step along
+    LEVELS, trading frame rate and blob resolution for CPU. If the cheapest
+    level is still over budget the backgrounds hold their last frame for
+    HOLD_MS before that level is tried again. With no user input for
+    IDLE_TIMEOUT_MS the clock pauses until the next input; input is watched
+    through an event filter on the windows that show registered widgets. In
+    REDUCED motion mode the backgrounds stay still, and LOW_POWER starts at
+    and never goes above LOW_POWER_LEVEL.
+    """
+    _instance = None
+    level_changed = pyqtSignal(int)
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.widgets = {}
+        self.ticks = 0
+        self.idle = False
+        self.paused = False
+        self.held = False
+        self.paint_time = 0.0
+        self.elapsed = QElapsedTimer()
+        self.window = QElapsedTimer()
+        self.window.start()
+        self.last_input = QElapsedTimer()
+        self.last_input.start()
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+        self.hold_timer = QTimer(self)
+        self.hold_timer.setSingleShot(True)
+        self.hold_timer.timeout.connect(self.release)
+        self.level = None
+        self.set_level(self.min_level)
+
+    @property
+    def min_level(self):
+        return LOW_POWER_LEVEL if motion_mode() == LOW_POWER else 0
+
+    @property
+    def frame_max_edge(self):
+        return LEVELS[self.level][1]
+
+    def set_level(self, level):
+        level = max(self.min_level, min(len(LEVELS) - 1, level))
+        if level == self.level:
+            return
+        self.level = level
+        self.interval = frame_interval(LEVELS[level][0])
+        if self.timer.isActive() and not self.idle:
+            self.timer.setInterval(self.interval)
+        self.level_changed.emit(level)
+
+    def apply_motion_mode(self):
+        self.set_level(self.level)
+        for widget in self.widgets.values():
+            widget.update()
+        self.hold_timer.stop()
+        self.release()
+
+    def register(self, widget):
+        key = id(widget)
+        if key in self.widgets:
+            return
+        self.widgets[key] = widget
+        widget.destroyed.connect(lambda _=None, key=key: self.widgets.pop(key, None))
+        widget.installEventFilter(self)
+        self.watch_window(widget)
+        self.wake()
+
+    def unregister(self, widget):
+        self.widgets.pop(id(widget), None)
+        widget.removeEventFilter(self)
+
+    def watch_window(self, widget):
+        """Filters the input of the window showing ``widget``; it has no native window until first shown."""
+        handle = widget.window().windowHandle()
+        if handle is not None:
+            handle.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        kind = event.type()
+        if kind in INPUT_EVENTS:
+            self.last_input.restart()
+            if self.paused:
+                self.paused = False
+                self.wake()
+        elif kind == QEvent.Type.Show and id(watched) in self.widgets:
+            self.watch_window(watched)
+            self.wake()
+        return False
+
+    def report_paint(self, seconds):
+        self.paint_time += seconds
+
+    def hold(self):
+        self.held = True
+        self.timer.stop()
+        self.hold_timer.start(HOLD_MS)
+
+    def release(self):
+        self.held = False
+        self.paint_time = 0.0
+        self.window.restart()
+        self.wake()
+
+    def wake(self):
+        if not self.widgets or self.paused or self.held or reduced_motion():
+            self.timer.stop()
+            return
+        if not self.timer.isActive() or self.timer.interval() != self.interval:
+            self.elapsed.start()
+            self.timer.start(self.interval)
+
+    def tick(self):
+        if reduced_motion():
+            self.timer.stop()
+            return
+        if self.last_input.elapsed() > IDLE_TIMEOUT_MS:
+            self.paused = True
+            self.timer.stop()
+            return
+        self.ticks += 1
+        elapsed = self.elapsed.restart()
+        active = [widget for widget in self.widgets.values() if on_screen(widget)]
+        if active:
+            # Coming back from the idle poll, step once instead of jumping ahead.
+            steps = 1.0 if self.idle else min(MAX_STEPS, elapsed / BASE_INTERVAL_MS)
+            for widget in active:
+                widget.animate_blobs(steps)
+        self.idle = not active
+        if not self.widgets:
+            self.timer.stop()
+            return
+        self.govern()
+        interval = IDLE_INTERVAL_MS if self.idle else self.interval
+        if self.timer.interval() != interval:
+            self.timer.setInterval(interval)
+
+    def govern(self):
+        window_ms = self.window.elapsed()
+        if window_ms < GOVERNOR_WINDOW_MS:
+            return
+        load = self.paint_time * 1000 / window_ms
+        self.paint_time = 0.0
+        self.window.restart()
+        if self.idle:
+            return
+        if load > PAINT_BUDGET:
+            if self.level == len(LEVELS) - 1:
+                self.hold()
+            else:
+                self.set_level(self.level + 1)
+        elif load < PAINT_BUDGET / 2:
+            self.set_level(self.level - 1)
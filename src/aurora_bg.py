@@ -1,22 +1,9 @@
 import sys
-import random
 from PyQt6.QtWidgets import QApplication, QWidget
-from PyQt6.QtGui import QPainter, QRadialGradient, QColor, QBrush
-from PyQt6.QtCore import QTimer, Qt, QPoint 
-
-class Blob:
-    def __init__(self, color, x_speed, y_speed):
-        self.x = random.random()
-        self.y = random.random()
-        self.dx = x_speed
-        self.dy = y_speed
-        self.color = color
-
-    def move(self):
-        self.x += self.dx
-        self.y += self.dy
-        if self.x <= 0 or self.x >= 1: self.dx *= -1
-        if self.y <= 0 or self.y >= 1: self.dy *= -1
+from PyQt6.QtGui import QPainter, QColor
+from PyQt6.QtCore import Qt, QPoint 
+from animation_clock import AnimationClock
+from blob_painter import Blob, BlobPainter
 
 class AuroraBackground(QWidget):
     def __init__(self, parent=None):
@@ -31,9 +18,10 @@ class AuroraBackground(QWidget):
             Blob(QColor(255, 212, 247), 0.004, -0.003),
             Blob(QColor(255, 200, 150, 140), -0.003, -0.001)
         ]
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate_blobs)
-        self.timer.start(20)
+        self.blob_painter = BlobPainter("#fff0f5")
+        # White glow that follows the cursor, tighter than the blobs
+        self.spotlight_color = QColor(255, 255, 255, 120)
+        AnimationClock.instance().register(self)
 
     def mouseMoveEvent(self, event):
         self.cursor_pos = event.position().toPoint()
@@ -41,57 +29,18 @@ class AuroraBackground(QWidget):
     def leaveEvent(self, event):
         self.cursor_pos = None 
 
-    def animate_blobs(self):
+    def animate_blobs(self, steps=1.0):
         for blob in self.blobs:
-            blob.move()
+            blob.move(steps)
         self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setPen(Qt.PenStyle.NoPen)
-        rect = self.rect()
-        radius = 10.0  
-        
-        # 1. Draw Base Background
-        painter.setBrush(QColor("#fff0f5"))
-        painter.drawRoundedRect(rect, radius, radius)
-        
-        w = self.width()
-        h = self.height()
-        
-        # 2. Draw Moving Blobs
-        for blob in self.blobs:
-            center_x = blob.x * w
-            center_y = blob.y * h
-            grad_radius = w * 0.6  
-            gradient = QRadialGradient(center_x, center_y, grad_radius)
-            gradient.setColorAt(0.0, blob.color)
-            transparent = QColor(blob.color)
-            transparent.setAlpha(0)
-            gradient.setColorAt(1.0, transparent)
-            painter.setBrush(QBrush(gradient))
-            painter.drawRoundedRect(rect, radius, radius)
-
-        # --- CHANGE 4: Draw Cursor Spotlight ---
-        if self.cursor_pos:
-            # Create a White/Bright glow at cursor position
-            # We use a smaller radius (w * 0.4) for a tighter spotlight feel
-            # Pass x and y separately as floats
-            spotlight_gradient = QRadialGradient(self.cursor_pos.x(), self.cursor_pos.y(), w * 0.4)
-            
-            # Color: White with 120 alpha (semi-transparent)
-            spotlight_gradient.setColorAt(0.0, QColor(255, 255, 255, 120))
-            
-            # Fade to transparent
-            spotlight_gradient.setColorAt(1.0, QColor(255, 255, 255, 0))
-            
-            painter.setBrush(QBrush(spotlight_gradient))
-            painter.drawRoundedRect(rect, radius, radius)
+        self.blob_painter.paint(painter, self.rect(), self.blobs, self.cursor_pos, self.spotlight_color)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = AuroraBackground()
     window.resize(600, 400)
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
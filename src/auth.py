@@ -1,18 +1,28 @@
 from PyQt6.QtWidgets import QMainWindow, QWidget, QListView, QFrame, QMessageBox
-from PyQt6 import uic
+from PyQt6 import sip
 import sqlite3
-import sys
-from sqlite3 import Error
 
 # Imports
 from ui_components import HoverButton
-from main_window import MainWindow
-from utils import resource_path,get_db_path
+from ui_cache import load_ui
+from db import get_connection
 
 class Profile(QMainWindow):
+    _shared = None
+
+    @classmethod
+    def shared(cls):
+        """The app's one new-profile form, emptied; built on first use."""
+        form = cls._shared
+        if form is None or sip.isdeleted(form):
+            form = cls._shared = cls()
+        else:
+            form.clear_form()
+        return form
+
     def __init__(self):
         super().__init__()
-        uic.loadUi(resource_path("Profile.ui"),self)
+        load_ui("Profile.ui", self)
         self.active_profile_id = None
         view1 = QListView()
         view2 = QListView()
@@ -27,7 +37,6 @@ class Profile(QMainWindow):
         self.profile_btn.setCursor(profile_btn.cursor())        
         profile_btn.hide()
         self.profile_btn.clicked.connect(self.save_and_open_main)
-        self.init_db()
         #self.save_db()
         self.line_name.returnPressed.connect(self.save_db)
         self.line_goal.returnPressed.connect(self.save_db)
@@ -47,31 +56,11 @@ class Profile(QMainWindow):
         self.existing_profile_btn.clicked.connect(self.show_saved_profiles)
         #self.profile_btn.clicked.connect(self.save_db)
 
-            
-    def init_db(self):
-        connection = sqlite3.connect(get_db_path("entries.db"))
-        if connection:
-            try:
-                cursor = connection.cursor()
-                cursor.execute("""
-                           CREATE TABLE IF NOT EXISTS entries(
-                                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                                name TEXT,
-                                age INTEGER,
-                                weight INTEGER,
-                                goal_weight INTEGER,
-                                height INTEGER,
-                                cal_goal INTEGER,
-                                prot_goal INTEGER,
-                                carb_goal INTEGER,
-                                fat_goal INTEGER)
-                           """)
-                connection.commit()
-            except Error as e:
-                print(e)
-                sys.exit(1)
-            finally:
-                connection.close()
+    def clear_form(self):
+        self.active_profile_id = None
+        for line in (self.line_name, self.line_age, self.line_goal, self.line_weight, self.line_height,
+                     self.cal_goal_line, self.prot_goal_line, self.carb_goal_line, self.fat_goal_line):
+            line.clear()
 
     def save_db(self):
         try:
@@ -88,13 +77,10 @@ class Profile(QMainWindow):
             if not any([ipn, ipa, ipg, ipw, iph]):
                 print("All fields empty, not inserting.")
                 return False
-            connection = sqlite3.connect(get_db_path("entries.db"))
-            cursor = connection.cursor()
-            cursor.execute("""INSERT INTO entries (name, age, goal_weight, weight, height, cal_goal, prot_goal, carb_goal, fat_goal)
+            with get_connection("entries.db") as connection:
+                cursor = connection.execute("""INSERT INTO entries (name, age, goal_weight, weight, height, cal_goal, prot_goal, carb_goal, fat_goal)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""", (ipn, ipa, ipg, ipw, iph, cal, prot, carb, fat))
-            self.active_profile_id = cursor.lastrowid
-            connection.commit()
-            connection.close()
+                self.active_profile_id = cursor.lastrowid
             print('Inserted')
             return True
         except sqlite3.Error as e:
@@ -110,7 +96,8 @@ class Profile(QMainWindow):
         success = self.save_db()
         if success and self.active_profile_id is not None:
             print(f"Opening{self.active_profile_id}")
-            self.win = MainWindow(self.active_profile_id)
+            from main_window import MainWindow
+            self.win = MainWindow.shared(self.active_profile_id)
             self.win.show()
             self.hide()
         else:
@@ -119,7 +106,7 @@ class Profile(QMainWindow):
 class SavedProfiles(QWidget):
     def __init__(self):
         super().__init__()
-        uic.loadUi(resource_path("showProfile.ui"),self)
+        load_ui("showProfile.ui", self)
         self.load_saved_profiles()
         self.profile_changed()
         take_to_main_btn = self.take_to_main_btn
@@ -134,8 +121,7 @@ class SavedProfiles(QWidget):
         self.take_to_main_btn.clicked.connect(self.take_main)
 
     def load_saved_profiles(self):
-        connection = sqlite3.connect(get_db_path("entries.db"))
-        curr = connection.cursor()
+        curr = get_connection("entries.db").cursor()
         curr.execute("SELECT DISTINCT id, name FROM entries")
         profile = curr.fetchall()
         for pid,pname in profile:
@@ -148,7 +134,8 @@ class SavedProfiles(QWidget):
         self.profile_id = selected_id 
     
     def take_main(self):
-        self.win = MainWindow(self.profile_id)
+        from main_window import MainWindow
+        self.win = MainWindow.shared(self.profile_id)
        #self.win.setParent(None)
         self.win.show()
         self.hide()
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""Wakeups per second and CPU use of the animated backgrounds.
+
+Shows one window with each background widget and keeps a second window of
+them hidden, like stacked pages. "per-widget timers" gives every widget its
+own 20 ms QTimer, started out of phase as before; "shared clock" uses AnimationClock. A wakeup is
+a timer callback more than half a millisecond after the previous one, so
+timers that happen to fire together count once.
+
+Run from src/:  python -m benchmarks.bench_animation_clock [seconds]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication, QHBoxLayout, QWidget
+
+from animation_clock import AnimationClock
+from arora_bg import AuroraBackgroundLabel
+from aurora_bg import AuroraBackground
+from gradient_background import AuroraBackgroundScreen
+from gradient_label import GradientBackgroundLabel
+
+WIDGETS = [GradientBackgroundLabel, AuroraBackgroundLabel, AuroraBackground, AuroraBackgroundScreen]
+
+
+class WakeupCounter:
+    def __init__(self):
+        self.last = None
+        self.wakeups = 0
+
+    def hit(self):
+        now = time.perf_counter()
+        if self.last is None or now - self.last > 0.0005:
+            self.wakeups += 1
+        self.last = now
+
+
+def build_window():
+    window = QWidget()
+    layout = QHBoxLayout(window)
+    widgets = [cls() for cls in WIDGETS]
+    for widget in widgets:
+        widget.setMinimumSize(200, 200)
+        layout.addWidget(widget)
+    window.resize(900, 260)
+    return window, widgets
+
+
+def run_for(seconds):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+def measure(seconds, setup, minimized=False):
+    clock = AnimationClock.instance()
+    visible, visible_widgets = build_window()
+    hidden, hidden_widgets = build_window()
+    counter = WakeupCounter()
+    cleanup = setup(clock, visible_widgets + hidden_widgets, counter)
+    visible.showMinimized() if minimized else visible.show()
+    run_for(0.3)
+    counter.wakeups = 0
+    clock.ticks = 0
+    cpu, wall = time.process_time(), time.perf_counter()
+    run_for(seconds)
+    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    wakeups = counter.wakeups
+    cleanup()
+    for widget in visible_widgets + hidden_widgets:
+        clock.unregister(widget)
+    visible.close()
+    hidden.close()
+    return wakeups / wall, cpu / wall
+
+
+def per_widget_timers(clock, widgets, counter):
+    timers = []
+    for widget in widgets:
+        clock.unregister(widget)
+        timer = QTimer(widget)
+        timer.timeout.connect(counter.hit)
+        timer.timeout.connect(widget.animate_blobs)
+        # Widgets are created at different moments, so their timers run out of phase.
+        QTimer.singleShot(len(timers) * 20 // len(widgets), lambda timer=timer: timer.start(20))
+        timers.append(timer)
+    return lambda: [timer.stop() for timer in timers]
+
+
+def shared_clock(clock, widgets, counter):
+    clock.timer.timeout.connect(counter.hit)
+    return lambda: clock.timer.timeout.disconnect(counter.hit)
+
+
+def main(seconds):
+    app = QApplication(sys.argv)
+    print(f"4 visible + 4 hidden backgrounds, {seconds:.0f}s per mode, "
+          f"clock interval {AnimationClock.instance().interval} ms")
+    modes = [("per-widget timers", per_widget_timers, False), ("shared clock", shared_clock, False),
+             ("minimized, timers", per_widget_timers, True), ("minimized, clock", shared_clock, True)]
+    for name, setup, minimized in modes:
+        wakeups, cpu = measure(seconds, setup, minimized)
+        print(f"{name:>18}: {wakeups:6.1f} wakeups/s, CPU {cpu:6.1%}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 3.0)
@@ -0,0 +1,72 @@
+"""How the animation governor settles for a large background, per motion mode.
+
+Shows one AuroraBackground at the given size and lets AnimationClock run.
+Once a second it prints the governor level (fps, blob frame edge), whether
+the background is held still because even the cheapest level is over
+budget, the share of one core spent painting backgrounds and the process
+CPU use.
+
+Run from src/:  python -m benchmarks.bench_animation_governor [seconds] [width] [height]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+
+import animation_clock
+from animation_clock import AnimationClock, FULL, LEVELS, LOW_POWER, REDUCED, set_motion_mode
+from aurora_bg import AuroraBackground
+
+
+class PaintMeter:
+    """Wraps the clock's report_paint to keep its own running total."""
+
+    def __init__(self, clock):
+        self.total = 0.0
+        report = clock.report_paint
+
+        def counted(seconds):
+            self.total += seconds
+            report(seconds)
+
+        clock.report_paint = counted
+
+
+def run_mode(mode, seconds, width, height):
+    set_motion_mode(mode)
+    clock = AnimationClock.instance()
+    clock.set_level(clock.min_level)
+    widget = AuroraBackground()
+    widget.resize(width, height)
+    widget.show()
+    meter = PaintMeter(clock)
+    print(f"{mode}:")
+    for second in range(int(seconds)):
+        paint, cpu, wall = meter.total, time.process_time(), time.perf_counter()
+        loop = QEventLoop()
+        QTimer.singleShot(1000, loop.quit)
+        loop.exec()
+        wall = time.perf_counter() - wall
+        fps, edge = LEVELS[clock.level]
+        state = "held " if clock.held else ""
+        print(f"  {second + 1:2d}s  {state:5s}level {clock.level} ({fps:2d} fps, {edge:3d} px)  "
+              f"painting {(meter.total - paint) / wall:6.1%}  CPU {(time.process_time() - cpu) / wall:6.1%}")
+    widget.close()
+    clock.unregister(widget)
+    del clock.report_paint
+
+
+def main(seconds, width, height):
+    app = QApplication(sys.argv)
+    print(f"{width}x{height} background, paint budget {animation_clock.PAINT_BUDGET:.0%} of a core")
+    for mode in (FULL, LOW_POWER, REDUCED):
+        run_mode(mode, seconds, width, height)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(float(args[0]) if args else 6, int(args[1]) if len(args) > 1 else 3840, int(args[2]) if len(args) > 2 else 2160)
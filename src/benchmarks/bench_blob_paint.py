@@ -0,0 +1,98 @@
+"""Paint time of one background frame, old per-blob gradient fills vs BlobPainter.
+
+Paints into an ARGB32 premultiplied image, like a translucent widget's
+backing store, at each size. "gradients" fills the rounded rect once per
+blob with a fresh QRadialGradient like the old paintEvents; "sprites" uses
+BlobPainter with the shared sprite cache. The last column is the mean
+per-channel difference between the two images.
+
+Run from src/:  python -m benchmarks.bench_blob_paint [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PyQt6.QtCore import QPoint, Qt
+from PyQt6.QtGui import QBrush, QColor, QImage, QPainter, QRadialGradient
+from PyQt6.QtWidgets import QApplication
+
+from blob_painter import Blob, BlobPainter, sprites
+
+SIZES = [(800, 600), (1920, 1080), (3840, 2160)]
+
+
+def make_blobs():
+    blobs = [
+        Blob(QColor(255, 105, 180, 180), 0.003, 0.002),
+        Blob(QColor(0, 200, 255, 160), -0.002, 0.004),
+        Blob(QColor(255, 212, 247), 0.004, -0.003),
+        Blob(QColor(255, 200, 150, 140), -0.003, -0.001),
+    ]
+    for i, blob in enumerate(blobs):
+        blob.x, blob.y = 0.2 + 0.2 * i, 0.8 - 0.2 * i
+    return blobs
+
+
+def paint_gradients(painter, rect, blobs, cursor):
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor("#fff0f5"))
+    painter.drawRoundedRect(rect, 10.0, 10.0)
+    w, h = rect.width(), rect.height()
+    for blob in blobs:
+        gradient = QRadialGradient(blob.x * w, blob.y * h, w * 0.6)
+        gradient.setColorAt(0.0, blob.color)
+        transparent = QColor(blob.color)
+        transparent.setAlpha(0)
+        gradient.setColorAt(1.0, transparent)
+        painter.setBrush(QBrush(gradient))
+        painter.drawRoundedRect(rect, 10.0, 10.0)
+    spotlight = QRadialGradient(cursor.x(), cursor.y(), w * 0.4)
+    spotlight.setColorAt(0.0, QColor(255, 255, 255, 120))
+    spotlight.setColorAt(1.0, QColor(255, 255, 255, 0))
+    painter.setBrush(QBrush(spotlight))
+    painter.drawRoundedRect(rect, 10.0, 10.0)
+
+
+def time_frames(paint, image, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        paint(painter)
+        painter.end()
+    return (time.perf_counter() - start) / frames
+
+
+def pixels(image):
+    ptr = image.constBits()
+    ptr.setsize(image.sizeInBytes())
+    return np.frombuffer(ptr, np.uint8).reshape(image.height(), image.bytesPerLine())[:, :image.width() * 4]
+
+
+def main(frames):
+    app = QApplication(sys.argv)
+    blobs = make_blobs()
+    print(f"{frames} frames per size, 4 blobs + cursor spotlight")
+    print(f"{'size':>10} {'gradients ms':>13} {'sprites ms':>11} {'speedup':>8} {'mean diff':>10}")
+    for w, h in SIZES:
+        old = QImage(w, h, QImage.Format.Format_ARGB32_Premultiplied)
+        new = QImage(w, h, QImage.Format.Format_ARGB32_Premultiplied)
+        rect = old.rect()
+        cursor = QPoint(w // 3, h // 2)
+        blob_painter = BlobPainter("#fff0f5")
+        spotlight = QColor(255, 255, 255, 120)
+        sprites.clear()
+        old_ms = time_frames(lambda p: paint_gradients(p, rect, blobs, cursor), old, frames) * 1e3
+        new_ms = time_frames(lambda p: blob_painter.paint(p, rect, blobs, cursor, spotlight), new, frames) * 1e3
+        diff = np.abs(pixels(old).astype(np.int16) - pixels(new)).mean()
+        print(f"{w:>5}x{h:<4} {old_ms:13.2f} {new_ms:11.2f} {old_ms / new_ms:7.1f}x {diff:10.2f}")
+    print(f"sprite cache: {len(sprites.sprites)} sprites, {sprites.bytes / 1024:.0f} KiB, "
+          f"{sprites.hits} hits / {sprites.misses} misses")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30)
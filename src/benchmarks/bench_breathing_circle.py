@@ -0,0 +1,121 @@
+"""Frames per second and CPU of the breathing circle and colour label animations.
+
+"stylesheet" reproduces the old Stopwatch circle: an AuroraBackgroundLabel
+whose geometry is animated, with a qradialgradient stylesheet rebuilt on
+every frame, and a ColorLabel that calls setStyleSheet for every colour.
+"paint" uses BreathingCircle's ``radius`` property and the paint-based
+ColorLabel. Both circles sit under a 0.7 opacity effect like the Stopwatch.
+
+Run from src/:  python -m benchmarks.bench_breathing_circle [seconds]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEasingCurve, QEventLoop, QPoint, QPropertyAnimation, QRect, QTimer, pyqtProperty
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QApplication, QGraphicsOpacityEffect, QLabel, QWidget
+
+from arora_bg import AuroraBackgroundLabel
+from breathing_circle import BreathingCircle
+from label_animation import ColorLabel
+
+CENTER = QPoint(445, 295)
+STYLE = ("background-color: qradialgradient(spread:pad, cx:0.5, cy:0.5, radius:0.8, fx:0.5, fy:0.5, "
+         "stop:0 #FFD5D5, stop:0.26 #FFB5B5, stop:1 #FFD5F6); border:0px; border-radius: {}px;")
+
+
+class CountingMixin:
+    paints = 0
+
+    def paintEvent(self, event):
+        type(self).paints += 1
+        super().paintEvent(event)
+
+
+class OldCircle(CountingMixin, AuroraBackgroundLabel):
+    pass
+
+
+class NewCircle(CountingMixin, BreathingCircle):
+    pass
+
+
+class OldColorLabel(QLabel):
+    def __init__(self, text):
+        super().__init__(text)
+        self._color = QColor(255, 0, 0)
+        self.setStyleSheet(f"font-size: 30px; font-weight: bold; color: {self._color.name()}")
+
+    @pyqtProperty(QColor)
+    def color(self):
+        return self._color
+
+    @color.setter
+    def color(self, value):
+        self._color = value
+        self.setStyleSheet(f"font-size: 30px; font-weight: bold; color: {self._color.name()}")
+
+
+def looping(animation, start, end, ms=2000):
+    animation.setDuration(ms)
+    animation.setStartValue(start)
+    animation.setEndValue(end)
+    animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
+    animation.setLoopCount(-1)
+    return animation
+
+
+def measure(seconds, build):
+    window = QWidget()
+    window.resize(900, 700)
+    circle, circle_anim, label, label_anim = build(window)
+    effect = QGraphicsOpacityEffect()
+    effect.setOpacity(0.7)
+    circle.setGraphicsEffect(effect)
+    window.show()
+    type(circle).paints = 0
+    circle_anim.start()
+    label_anim.start()
+    cpu, wall = time.process_time(), time.perf_counter()
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    circle_anim.stop()
+    label_anim.stop()
+    window.close()
+    return type(circle).paints / wall, cpu / wall
+
+
+def build_old(window):
+    circle = OldCircle(window)
+    anim = looping(QPropertyAnimation(circle, b"geometry"),
+                   QRect(CENTER.x() - 25, CENTER.y() - 25, 50, 50), QRect(CENTER.x() - 150, CENTER.y() - 150, 300, 300))
+    anim.valueChanged.connect(lambda rect: circle.setStyleSheet(STYLE.format(min(rect.width(), rect.height()) // 2)))
+    label = OldColorLabel("Breathe in")
+    label.setParent(window)
+    return circle, anim, label, looping(QPropertyAnimation(label, b"color"), QColor(255, 0, 0), QColor(0, 0, 255))
+
+
+def build_new(window):
+    circle = NewCircle(window)
+    circle.place(CENTER)
+    anim = looping(QPropertyAnimation(circle, b"radius"), 25.0, 150.0)
+    label = ColorLabel("Breathe in")
+    label.setParent(window)
+    return circle, anim, label, looping(QPropertyAnimation(label, b"color"), QColor(255, 0, 0), QColor(0, 0, 255))
+
+
+def main(seconds):
+    app = QApplication(sys.argv)
+    print(f"{seconds:.0f}s of a looping 2 s breathing animation plus a colour-morphing label")
+    for name, build in (("stylesheet", build_old), ("paint", build_new)):
+        fps, cpu = measure(seconds, build)
+        print(f"{name:>11}: circle {fps:6.1f} fps, CPU {cpu:6.1%}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 4.0)
@@ -0,0 +1,116 @@
+"""Dashboard panel refresh time with 10, 100 and 1000 logged entries.
+
+"labels" reproduces the old load_today_meals: every refresh removes all
+children of the panel and adds a new QLabel with an inline stylesheet per
+entry. "model" is the DashboardListModel behind a QListView with the shared
+delegate, where a refresh diffs the names. Each refresh is timed after one
+entry was saved (one row appended) and with nothing changed, including
+processing the resulting events and repainting the panel.
+
+Run from src/:  python -m benchmarks.bench_dashboard_refresh [entries ...]
+"""
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QLabel, QListView, QScrollArea, QVBoxLayout, QWidget
+
+from ui_components import DashboardItemDelegate, DashboardListModel
+
+REPEATS = 5
+STYLE = """
+    QWidget{
+font: 400 20px "Epilogue";
+color:#1d1d1d;
+border-radius:10px;
+background-color:rgb(242, 242, 242);
+border:1px solid #c0c0c0
+}
+"""
+
+
+class LabelPanel:
+    def __init__(self):
+        self.widget = QWidget()
+        self.layout = QVBoxLayout(self.widget)
+        self.scroll = QScrollArea()
+        self.scroll.setWidgetResizable(True)
+        self.scroll.setWidget(self.widget)
+        self.scroll.resize(760, 330)
+        self.scroll.show()
+
+    def refresh(self, names):
+        layout = self.layout
+        for i in reversed(range(layout.count())):
+            item = layout.itemAt(i)
+            widget = item.widget()
+            if widget is not None:
+                widget.setParent(None)
+            else:
+                layout.removeItem(item)
+        for name in names:
+            label = QLabel(name)
+            label.setStyleSheet(STYLE)
+            layout.addWidget(label)
+
+    def settle(self):
+        QApplication.processEvents()
+        self.scroll.viewport().repaint()
+
+
+class ModelPanel:
+    def __init__(self):
+        self.model = DashboardListModel("No recipes logged today")
+        self.delegate = DashboardItemDelegate()
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setItemDelegate(self.delegate)
+        self.view.setUniformItemSizes(True)
+        self.view.setSpacing(5)
+        self.view.resize(760, 330)
+        self.view.show()
+
+    def refresh(self, names):
+        self.model.set_items(names)
+
+    def settle(self):
+        # The view lays out inserted rows on a zero timer; run that now so it is timed.
+        QApplication.processEvents()
+        self.view.doItemsLayout()
+        self.view.viewport().repaint()
+
+
+def timed(panel, names):
+    start = time.perf_counter()
+    panel.refresh(names)
+    panel.settle()
+    return (time.perf_counter() - start) * 1e3
+
+
+def measure(panel, entries):
+    names = [f"recipe {i}" for i in range(entries)]
+    panel.refresh(names)
+    panel.settle()
+    saved, unchanged = [], []
+    for repeat in range(REPEATS):
+        names = names + [f"new recipe {repeat}"]
+        saved.append(timed(panel, names))
+        unchanged.append(timed(panel, names))
+    return statistics.median(saved), statistics.median(unchanged)
+
+
+def main(sizes):
+    app = QApplication(sys.argv)
+    print(f"{'entries':>7} {'labels save ms':>15} {'model save ms':>14} {'labels same ms':>15} {'model same ms':>14}")
+    for entries in sizes:
+        old_saved, old_same = measure(LabelPanel(), entries)
+        new_saved, new_same = measure(ModelPanel(), entries)
+        print(f"{entries:>7} {old_saved:>15.2f} {new_saved:>14.2f} {old_same:>15.2f} {new_same:>14.2f}")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10, 100, 1000])
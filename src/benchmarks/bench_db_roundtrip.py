@@ -0,0 +1,88 @@
+"""Save/load round-trips: connect-per-call (old code paths) vs the pooled WAL connection.
+
+Each round-trip inserts one recipe_ingredients row and reloads today's totals,
+which is what MainWindow does per saved ingredient.
+
+Run from src/:  python -m benchmarks.bench_db_roundtrip [round_trips]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date
+
+import db
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS recipe_ingredients (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        profile_id INTEGER,
+        recipe_name TEXT,
+        ingredient TEXT,
+        calories REAL,
+        protein REAL,
+        carbs REAL,
+        fat REAL,
+        date TEXT DEFAULT (DATE('now'))
+    )
+"""
+INSERT = """
+    INSERT INTO recipe_ingredients
+              (recipe_name, ingredient, calories, protein, carbs, fat, date, profile_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+TOTALS = """
+    SELECT SUM(calories), SUM(protein), SUM(carbs), SUM(fat)
+    FROM recipe_ingredients
+    WHERE date = ? AND profile_id = ?
+"""
+
+
+def row(i):
+    return ("bench", f"ingredient {i}", 100.0, 5.0, 12.0, 3.0, date.today().isoformat(), 1)
+
+
+def legacy(path, n):
+    conn = sqlite3.connect(path)
+    conn.execute(SCHEMA)
+    conn.commit()
+    conn.close()
+    for i in range(n):
+        conn = sqlite3.connect(path)
+        conn.execute(INSERT, row(i))
+        conn.commit()
+        conn.close()
+        conn = sqlite3.connect(path)
+        conn.execute(TOTALS, (date.today().isoformat(), 1)).fetchone()
+        conn.close()
+
+
+def pooled(n):
+    with db.get_connection("recipes.db") as conn:
+        conn.execute(SCHEMA)
+    for i in range(n):
+        with db.get_connection("recipes.db") as conn:
+            conn.execute(INSERT, row(i))
+        db.get_connection("recipes.db").execute(TOTALS, (date.today().isoformat(), 1)).fetchone()
+
+
+def main(n):
+    with tempfile.TemporaryDirectory() as tmp:
+        # get_db_path() resolves ~/nutrifit, so point HOME at the scratch directory.
+        os.environ["HOME"] = tmp
+        start = time.perf_counter()
+        legacy(os.path.join(tmp, "legacy.db"), n)
+        before = time.perf_counter() - start
+        start = time.perf_counter()
+        pooled(n)
+        after = time.perf_counter() - start
+        db.close_all()
+    print(f"{n} save/load round-trips")
+    print(f"  connect per call : {before * 1e3:9.1f} ms  ({before / n * 1e6:8.1f} us/round-trip)")
+    print(f"  pooled WAL       : {after * 1e3:9.1f} ms  ({after / n * 1e6:8.1f} us/round-trip)")
+    print(f"  speedup          : {before / after:9.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,72 @@
+"""Streaming export throughput and memory against history size.
+
+Seeds a scratch profile with meal ingredient rows spread over several years
+(plus one workout set per four meal rows) and exports it as CSV and JSON
+Lines, and as Parquet when pyarrow is installed. Reports rows/sec and the
+process's peak RSS after each export, which should stay flat as the history
+grows, and the time for a one-month export, which uses the date index
+instead of reading the whole history.
+
+Run from src/:  python -m benchmarks.bench_export [rows ...]
+"""
+import os
+import resource
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import db
+import exporter
+import store
+
+FIRST_DAY = date(2018, 1, 1)
+DAYS = 2000
+
+
+def seed(profile_id, rows):
+    day = [(FIRST_DAY + timedelta(days=i)).isoformat() for i in range(DAYS)]
+    with db.get_connection("recipes.db") as conn:
+        conn.executemany(store.INSERT_RECIPE_ROW, (
+            (f"meal {i % 5}", f"ingredient {i % 300}", 120.0, 8.0, 14.0, 4.0, day[i % DAYS], profile_id)
+            for i in range(rows)))
+    with db.get_connection("workout_data.db") as conn:
+        conn.executemany(store.INSERT_WORKOUT_ROW, (
+            (f"workout {i % 3}", f"exercise {i % 20}", 3, 10, 40.0 + i % 30, day[i % DAYS], profile_id)
+            for i in range(rows // 4)))
+
+
+def peak_rss_mib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def formats():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return [exporter.CSV, exporter.JSONL]
+    return list(exporter.FORMATS)
+
+
+def main(sizes):
+    with tempfile.TemporaryDirectory() as tmp:
+        # get_db_path() resolves ~/nutrifit, so point HOME at the scratch directory.
+        os.environ["HOME"] = tmp
+        out_dir = os.path.join(tmp, "export")
+        print(f"{'rows':>9} {'format':>8} {'seconds':>8} {'rows/sec':>9} {'peak RSS MiB':>13} {'1 month ms':>11}")
+        for rows in sizes:
+            with db.get_connection("entries.db") as conn:
+                profile_id = conn.execute("INSERT INTO entries (name) VALUES ('bench')").lastrowid
+            seed(profile_id, rows)
+            for fmt in formats():
+                stats = exporter.export_profile(profile_id, out_dir, fmt)
+                start = time.perf_counter()
+                exporter.export_profile(profile_id, out_dir, fmt, start="2019-03-01", end="2019-03-31")
+                month = (time.perf_counter() - start) * 1e3
+                print(f"{rows:>9} {fmt:>8} {stats['seconds']:>8.1f} {stats['rows_per_sec']:>9,.0f} "
+                      f"{peak_rss_mib():>13.0f} {month:>11.1f}")
+        db.close_all()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
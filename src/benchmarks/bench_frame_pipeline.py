@@ -0,0 +1,93 @@
+"""Per-frame cost of the Scanner preview: old copy/convert/rescale path vs the capture-thread path.
+
+Frames come from a synthetic capture (no webcam needed). The new path is the
+code the Scanner runs: CaptureThread.grab reads into the thread's rotating
+buffers, take_latest hands the frame over and PreviewRenderer draws it. The
+grab is called inline rather than on the thread so both paths are timed the
+same way. Each tick includes the repaint of the preview label.
+
+Run from src/:  python -m benchmarks.bench_frame_pipeline [frames]
+"""
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import cv2
+import numpy as np
+from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtWidgets import QApplication, QLabel
+
+from frame_pipeline import CaptureThread, FrameStats, PreviewRenderer
+
+RESOLUTIONS = [(640, 480), (1280, 720), (1920, 1080)]
+LABEL_SIZE = (811, 321)
+
+
+class SyntheticCapture:
+    """Mimics cv2.VideoCapture.read: fills the given buffer, or allocates a new frame."""
+
+    def __init__(self, width, height):
+        self.frame = np.random.default_rng(0).integers(0, 255, (height, width, 3), dtype=np.uint8)
+
+    def read(self, image=None):
+        if image is None or image.shape != self.frame.shape:
+            return True, self.frame.copy()
+        np.copyto(image, self.frame)
+        return True, image
+
+
+def legacy_tick(cap, label):
+    ret, frame = cap.read()
+    last_frame = frame.copy()
+    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    h, w, ch = frame_rgb.shape
+    img_qt = QImage(frame_rgb.data, w, h, ch * w, QImage.Format.Format_RGB888)
+    label.setPixmap(QPixmap.fromImage(img_qt).scaled(label.width(), label.height()))
+    label.repaint()
+    return last_frame
+
+
+def capture_tick(cap, label, capture, renderer):
+    capture.grab(cap)
+    frame = capture.take_latest()
+    label.setPixmap(renderer.render(frame, label.size()))
+    label.repaint()
+
+
+def measure(tick, frames, trace):
+    stats = FrameStats(trace_allocations=trace)
+    for _ in range(5):
+        tick()
+    stats.reset()
+    for _ in range(frames):
+        stats.begin()
+        tick()
+        stats.end()
+    return stats
+
+
+def main(frames):
+    app = QApplication(sys.argv)
+    legacy_label = QLabel()
+    legacy_label.resize(*LABEL_SIZE)
+    legacy_label.show()
+    capture_label = QLabel()
+    capture_label.resize(*LABEL_SIZE)
+    capture_label.show()
+
+    for width, height in RESOLUTIONS:
+        cap = SyntheticCapture(width, height)
+        capture = CaptureThread()
+        renderer = PreviewRenderer()
+        print(f"{width}x{height}")
+        for name, tick in (("old path", lambda: legacy_tick(cap, legacy_label)),
+                           ("capture path", lambda: capture_tick(cap, capture_label, capture, renderer))):
+            timing = measure(tick, frames, trace=False)
+            allocations = measure(tick, max(10, frames // 10), trace=True)
+            print(f"  {name:<12}: {timing.total_time / timing.frames * 1e3:6.2f} ms/frame, "
+                  f"{allocations.total_allocated / allocations.frames / 1024:8.0f} KiB allocated/frame")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,56 @@
+"""Bulk import throughput and memory for meal history exports.
+
+Writes a synthetic CSV export of each size, half the rows with macros and
+half only naming an ingredient to resolve against the nutrition table, and
+imports it into a scratch profile. Reports rows/sec and the process's peak
+RSS after each import, which should stay flat as the export grows.
+
+Run from src/:  python -m benchmarks.bench_import [rows ...]
+"""
+import csv
+import os
+import resource
+import sys
+import tempfile
+
+import db
+import importer
+from nutrition_table import get_nutrition_table
+
+
+def write_export(path, rows, names):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["date", "meal", "food", "servings", "calories", "protein", "carbs", "fat"])
+        for i in range(rows):
+            day = f"20{18 + i % 6}-{i % 12 + 1:02d}-{i % 28 + 1:02d}"
+            if i % 2:
+                writer.writerow([day, f"meal {i % 5}", names[i % len(names)].lower(), 1 + i % 3, "", "", "", ""])
+            else:
+                writer.writerow([day, f"meal {i % 5}", f"custom food {i % 50}", "", 250, 12, 30, 8])
+
+
+def peak_rss_mib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(sizes):
+    with tempfile.TemporaryDirectory() as tmp:
+        # get_db_path() resolves ~/nutrifit, so point HOME at the scratch directory.
+        os.environ["HOME"] = tmp
+        table = get_nutrition_table()
+        with db.get_connection("entries.db") as conn:
+            profile_id = conn.execute("INSERT INTO entries (name) VALUES ('bench')").lastrowid
+        print(f"{'rows':>9} {'imported':>9} {'seconds':>8} {'rows/sec':>9} {'peak RSS MiB':>13}")
+        for rows in sizes:
+            path = os.path.join(tmp, f"meals_{rows}.csv")
+            write_export(path, rows, table.names)
+            stats = importer.import_file(path, importer.MEALS, profile_id, table=table)
+            print(f"{rows:>9} {stats['imported']:>9} {stats['seconds']:>8.1f} {stats['rows_per_sec']:>9,.0f} "
+                  f"{peak_rss_mib():>13.0f}")
+            os.remove(path)
+        db.close_all()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,62 @@
+"""Ingredient lookup latency: pandas scan in the old fetch_data vs IngredientIndex.
+
+Run from src/:  python -m benchmarks.bench_ingredient_index [rows ...]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from ingredient_index import IngredientIndex
+from utils import resource_path
+
+QUERIES = ["paneer", "chai", "dal", "rice", "aloo gobi", "lemon", "zz-missing", "ch", "zq", "~"]
+
+
+def synthetic_table(base, rows):
+    reps = -(-rows // len(base))
+    df = pd.concat([base] * reps, ignore_index=True).iloc[:rows].copy()
+    df["Ingredient"] = df["Ingredient"] + " #" + pd.Series(np.arange(rows) // len(base)).astype(str)
+    return df
+
+
+def legacy_lookup(df, name):
+    df["Ingredient_clean"] = (
+        df["Ingredient"]
+        .str.replace('"', '', regex=False)
+        .str.strip()
+        .str.lower()
+    )
+    data = df[df["Ingredient_clean"].str.contains(name, regex=False)]
+    if data.empty:
+        return None
+    return data.iloc[0]
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes):
+    base = pd.read_csv(resource_path("cleaned_indian_food_nutrition.csv"))
+    print(f"{'rows':>9} {'build ms':>9} {'legacy ms':>10} {'index ms':>9} {'speedup':>8}")
+    for rows in sizes:
+        df = synthetic_table(base, rows)
+        start = time.perf_counter()
+        index = IngredientIndex.from_dataframe(df)
+        build = time.perf_counter() - start
+
+        legacy_repeat = 3 if rows <= 100_000 else 1
+        legacy = sum(timed(lambda q=q: legacy_lookup(df, q), legacy_repeat) for q in QUERIES) / len(QUERIES)
+        fast = sum(timed(lambda q=q: index.find(q), 200) for q in QUERIES) / len(QUERIES)
+        print(f"{rows:>9} {build * 1e3:>9.1f} {legacy * 1e3:>10.3f} {fast * 1e3:>9.4f} {legacy / fast:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,48 @@
+"""Nutrition table load time: pd.read_csv + index build vs the compiled binary cache.
+
+cold   - cache directory empty, CSV is parsed and compiled
+warm   - compiled cache reused by a new loader (what a fresh launch sees)
+shared - get_nutrition_table() after the first window already loaded it
+
+Run from src/:  python -m benchmarks.bench_nutrition_load [rows ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+import nutrition_table
+from ingredient_index import IngredientIndex
+from benchmarks.bench_ingredient_index import synthetic_table
+from utils import resource_path
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(sizes):
+    base = pd.read_csv(resource_path(nutrition_table.CSV_NAME))
+    print(f"{'rows':>9} {'csv ms':>9} {'cold ms':>9} {'warm ms':>9} {'shared ms':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            csv_path = os.path.join(tmp, f"table_{rows}.csv")
+            synthetic_table(base, rows).to_csv(csv_path, index=False)
+            cache_dir = os.path.join(tmp, f"cache_{rows}")
+
+            legacy, _ = timed(lambda: IngredientIndex.from_dataframe(pd.read_csv(csv_path)))
+            cold, _ = timed(lambda: nutrition_table.load_nutrition_table(csv_path, cache_dir))
+            warm = min(timed(lambda: nutrition_table.load_nutrition_table(csv_path, cache_dir))[0] for _ in range(3))
+
+            nutrition_table._shared.clear()
+            nutrition_table._shared[os.path.abspath(csv_path)] = nutrition_table.load_nutrition_table(csv_path, cache_dir)
+            shared, _ = timed(lambda: nutrition_table.get_nutrition_table(csv_path))
+            print(f"{rows:>9} {legacy * 1e3:>9.1f} {cold * 1e3:>9.1f} {warm * 1e3:>9.1f} {shared * 1e3:>10.4f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 100_000, 1_000_000])
@@ -0,0 +1,97 @@
+"""Profile switch latency: a new MainWindow per profile vs MainWindow.set_profile on one window.
+
+Profiles get a few meals and workouts logged today, then the dashboard is
+switched between them round-robin. "rebuild" is what take_main did before,
+building and showing a new MainWindow and closing the old one; "set_profile"
+reuses the shared window. Times include processing the resulting events.
+
+Run from src/:  python -m benchmarks.bench_profile_switch [switches]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+import db
+import store
+
+PROFILES = 5
+MEALS = 3
+WORKOUTS = 2
+
+
+def seed():
+    ids = []
+    with db.get_connection("entries.db") as conn:
+        for i in range(PROFILES):
+            cursor = conn.execute(
+                "INSERT INTO entries (name, age, goal_weight, weight, height, cal_goal, prot_goal, carb_goal, fat_goal) "
+                "VALUES (?, 30, 70, 75, 175, 2000, 120, 250, 60)", (f"profile {i}",))
+            ids.append(cursor.lastrowid)
+    macros = {"cal": 120.0, "prot": 6.0, "carbs": 15.0, "fat": 4.0}
+    for pid in ids:
+        for meal in range(MEALS):
+            store.save_recipe_rows(pid, f"meal {meal}", [(f"ingredient {n}", macros) for n in range(4)])
+    with db.get_connection("workout_data.db") as conn:
+        for pid in ids:
+            for workout in range(WORKOUTS):
+                conn.executemany(
+                    "INSERT INTO workouts (workout_name, exercise_name, sets, reps, weight, date, profile_id) "
+                    "VALUES (?, ?, 3, 10, 50, ?, ?)",
+                    [(f"workout {workout}", f"exercise {n}", date.today().isoformat(), pid) for n in range(5)])
+    return ids
+
+
+def timed(switch, ids, switches):
+    times = []
+    for n in range(switches):
+        start = time.perf_counter()
+        switch(ids[n % len(ids)])
+        QApplication.processEvents()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    switches = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    app = QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        # get_db_path() resolves ~/nutrifit, so point HOME at the scratch directory.
+        os.environ["HOME"] = tmp
+        os.makedirs(os.path.join(tmp, "nutrifit"))
+        from main_window import MainWindow
+        ids = seed()
+        MainWindow(ids[0]).close()  # load the nutrition table and UI code outside the timed runs
+
+        current = []
+
+        def rebuild(pid):
+            window = MainWindow(pid)
+            window.show()
+            if current:
+                current.pop().close()
+            current.append(window)
+
+        def switch(pid):
+            MainWindow.shared(pid).show()
+
+        before = timed(rebuild, ids, switches)
+        after = timed(switch, ids, switches)
+        print(f"{switches} switches between {PROFILES} profiles ({MEALS} meals, {WORKOUTS} workouts each today)")
+        print(f"{'':<12}{'median ms':>10}{'p95 ms':>9}")
+        for name, times in (("rebuild", before), ("set_profile", after)):
+            times = sorted(times)
+            print(f"{name:<12}{statistics.median(times) * 1e3:>10.2f}{times[int(len(times) * 0.95) - 1] * 1e3:>9.2f}")
+        print(f"speedup: {statistics.median(before) / statistics.median(after):.1f}x")
+        db.close_all()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
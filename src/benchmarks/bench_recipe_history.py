@@ -0,0 +1,83 @@
+"""Recipe history open time against history size.
+
+"eager" reproduces the old RecipeLoad: every (recipe, ingredient) row of the
+profile is fetched, grouped in Python and added as a QListWidgetItem before
+the window shows. "paged" opens RecipeLoad, which groups in SQL and fetches
+one page into a lazily populated model. Times run until the list has painted.
+
+Run from src/:  python -m benchmarks.bench_recipe_history [recipes ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QListWidget, QListWidgetItem
+
+import db
+import store
+
+INGREDIENTS = 4
+
+
+def seed(profile_id, recipes):
+    with db.get_connection("recipes.db") as conn:
+        conn.executemany(store.INSERT_RECIPE_ROW, [
+            (f"recipe {r:06d}", f"ingredient {i}", 100.0, 5.0, 12.0, 3.0, "2024-01-01", profile_id)
+            for r in range(recipes) for i in range(INGREDIENTS)])
+
+
+def eager(profile_id):
+    widget = QListWidget()
+    widget.resize(881, 561)
+    curr = db.get_connection("recipes.db").cursor()
+    curr.execute("""SELECT DISTINCT recipe_name, ingredient FROM recipe_ingredients
+                 WHERE profile_id=? ORDER BY recipe_name""", (profile_id,))
+    recipes_dict = {}
+    for recipe_name, ingredient in curr.fetchall():
+        recipes_dict.setdefault(recipe_name, []).append(ingredient)
+    for recipe_name, ingredient_list in recipes_dict.items():
+        widget.addItem(QListWidgetItem(f"{recipe_name}:\n{', '.join(ingredient_list)}"))
+    widget.show()
+    return widget
+
+
+def paged(profile_id):
+    from existing_recipes import RecipeLoad
+    window = RecipeLoad(profile_id)
+    window.show()
+    return window
+
+
+def timed(open_window, profile_id):
+    start = time.perf_counter()
+    window = open_window(profile_id)
+    QApplication.processEvents()
+    elapsed = (time.perf_counter() - start) * 1e3
+    window.close()
+    window.deleteLater()
+    QApplication.processEvents()
+    return elapsed
+
+
+def main(sizes):
+    app = QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        # get_db_path() resolves ~/nutrifit, so point HOME at the scratch directory.
+        os.environ["HOME"] = tmp
+        os.makedirs(os.path.join(tmp, "nutrifit"))
+        timed(paged, 0)  # import and build the form outside the timed runs
+        print(f"{'recipes':>8} {'eager ms':>10} {'paged ms':>10}")
+        for profile_id, recipes in enumerate(sizes, start=1):
+            seed(profile_id, recipes)
+            before = min(timed(eager, profile_id) for _ in range(3))
+            after = min(timed(paged, profile_id) for _ in range(3))
+            print(f"{recipes:>8} {before:>10.1f} {after:>10.1f}")
+        db.close_all()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000, 50000])
@@ -0,0 +1,55 @@
+"""Recipe save time: one connect/insert/commit per ingredient vs one batched transaction.
+
+Run from src/:  python -m benchmarks.bench_recipe_save [ingredients ...]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date
+
+import db
+import store
+from benchmarks.bench_db_roundtrip import SCHEMA
+
+
+def recipe(n):
+    return [(f"ingredient {i}", {"cal": 100.0, "prot": 5.0, "carbs": 12.0, "fat": 3.0}) for i in range(n)]
+
+
+def per_row(path, rows):
+    for name, macros in rows:
+        conn = sqlite3.connect(path)
+        conn.execute(store.INSERT_RECIPE_ROW, ("bench", name, macros["cal"], macros["prot"], macros["carbs"],
+                                               macros["fat"], date.today().isoformat(), 1))
+        conn.commit()
+        conn.close()
+
+
+def main(sizes):
+    with tempfile.TemporaryDirectory() as tmp:
+        # get_db_path() resolves ~/nutrifit, so point HOME at the scratch directory.
+        os.environ["HOME"] = tmp
+        legacy_path = os.path.join(tmp, "legacy.db")
+        conn = sqlite3.connect(legacy_path)
+        conn.execute(SCHEMA)
+        conn.close()
+        with db.get_connection("recipes.db") as conn:
+            conn.execute(SCHEMA)
+
+        print(f"{'ingredients':>11} {'per-row ms':>11} {'batched ms':>11} {'speedup':>8}")
+        for n in sizes:
+            rows = recipe(n)
+            start = time.perf_counter()
+            per_row(legacy_path, rows)
+            before = time.perf_counter() - start
+            start = time.perf_counter()
+            store.save_recipe_rows(1, "bench", rows)
+            after = time.perf_counter() - start
+            print(f"{n:>11} {before * 1e3:>11.1f} {after * 1e3:>11.2f} {before / after:>7.0f}x")
+        db.close_all()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10, 100, 1000])
@@ -0,0 +1,64 @@
+"""Scan throughput for a meal of several frames, using the offline FakeModel.
+
+The fake model takes ``latency`` seconds per request plus ``per_image``
+seconds per attached photo. "one by one" is the old single-frame path; the
+other rows send the meal through RecognitionService.submit_batch with
+different chunk sizes and concurrency.
+
+Run from src/:  python -m benchmarks.bench_scan_batching [items] [latency] [per_image]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PyQt6.QtCore import QEventLoop
+from PyQt6.QtWidgets import QApplication
+
+from recognition import FakeModel, RecognitionService
+
+MODES = [
+    ("one by one", 1, 1),
+    ("one request", None, 1),
+    ("chunks of 4 x2", 4, 2),
+    ("chunks of 3 x4", 3, 4),
+]
+
+
+def run(frames, latency, per_image, batch_size, max_workers):
+    model = FakeModel(latency, per_image=per_image)
+    service = RecognitionService(model, batch_size=batch_size or len(frames), max_workers=max_workers,
+                                 max_pending=len(frames))
+    loop = QEventLoop()
+    done = []
+
+    def finished(request_id, text):
+        done.append(text)
+        if len(done) == len(frames):
+            loop.quit()
+
+    service.recognized.connect(finished)
+    service.failed.connect(finished)
+    start = time.perf_counter()
+    service.submit_batch(frames)
+    loop.exec()
+    return time.perf_counter() - start, model.calls, sum(text is not None for text in done)
+
+
+def main(items, latency, per_image):
+    app = QApplication(sys.argv)
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 255, (480, 640, 3), dtype=np.uint8) for _ in range(items)]
+    print(f"{items} items, fake model {latency:.2f}s per request + {per_image:.2f}s per image")
+    print(f"{'mode':>15} {'requests':>9} {'seconds':>8} {'items/s':>8}")
+    for name, batch_size, max_workers in MODES:
+        seconds, calls, answered = run(frames, latency, per_image, batch_size, max_workers)
+        assert answered == items
+        print(f"{name:>15} {calls:9d} {seconds:8.2f} {items / seconds:8.2f}")
+
+
+if __name__ == "__main__":
+    args = [float(arg) for arg in sys.argv[1:]]
+    main(int(args[0]) if args else 10, args[1] if len(args) > 1 else 1.0, args[2] if len(args) > 2 else 0.1)
@@ -0,0 +1,58 @@
+"""Bytes sent and encode time per camera resolution for a Scanner upload.
+
+"full frame" encodes the whole frame at quality 75, like the old PIL path;
+"prepared" crops to the plate, downscales to MAX_EDGE and encodes under the
+MAX_UPLOAD_BYTES budget with prepare_image. Both go through the offline
+FakeModel, which counts the bytes it received. The upload column estimates
+transfer time at the given link speed.
+
+Run from src/:  python -m benchmarks.bench_scan_upload [mbit_per_second]
+"""
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from recognition import FakeModel, PROMPT, encode_jpeg, prepare_image
+
+RESOLUTIONS = [(640, 480), (1280, 720), (1920, 1080), (3840, 2160)]
+REPEATS = 10
+
+
+def synthetic_plate(width, height, seed=0):
+    """A textured plate on a table: a noisy ellipse on a gradient with sensor noise."""
+    rng = np.random.default_rng(seed)
+    gradient = np.linspace(60, 140, width, dtype=np.float32)
+    frame = np.repeat(np.tile(gradient, (height, 1))[:, :, None], 3, axis=2)
+    mask = np.zeros((height, width), dtype=np.uint8)
+    cv2.ellipse(mask, (width * 3 // 5, height // 2), (width // 5, height // 4), 0, 0, 360, 255, -1)
+    food = rng.normal(150, 45, (height, width, 3)).astype(np.float32)
+    food = cv2.GaussianBlur(food, (5, 5), 0)
+    frame[mask > 0] = food[mask > 0]
+    frame += rng.normal(0, 6, frame.shape).astype(np.float32)
+    return np.clip(frame, 0, 255).astype(np.uint8)
+
+
+def measure(encode, frame):
+    model = FakeModel(latency=0)
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        data = encode(frame)
+        model.generate_content([PROMPT, {"mime_type": "image/jpeg", "data": data}])
+    return (time.perf_counter() - start) / REPEATS, model.bytes_received // REPEATS
+
+
+def main(mbit):
+    print(f"{REPEATS} encodes per row, upload estimated at {mbit:g} Mbit/s")
+    print(f"{'resolution':>11} {'mode':>11} {'KiB sent':>9} {'encode ms':>10} {'upload ms':>10}")
+    for width, height in RESOLUTIONS:
+        frame = synthetic_plate(width, height)
+        for name, encode in (("full frame", lambda f: encode_jpeg(f, 75)), ("prepared", prepare_image)):
+            seconds, sent = measure(encode, frame)
+            upload = sent * 8 / (mbit * 1e6)
+            print(f"{width:>5}x{height:<5} {name:>11} {sent / 1024:9.1f} {seconds * 1e3:10.2f} {upload * 1e3:10.1f}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0)
@@ -0,0 +1,81 @@
+"""GUI event-loop stalls while a scan is recognized, using the offline FakeModel.
+
+A 10 ms heartbeat timer runs on the GUI thread; the longest gap between two
+beats is how long the window was frozen. "blocking" runs encode + model call
+on the GUI thread like the old Scanner.recognize_object, "worker" goes
+through RecognitionService.
+
+Run from src/:  python -m benchmarks.bench_scanner_responsiveness [latency_seconds]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PyQt6.QtCore import QTimer, QEventLoop
+from PyQt6.QtWidgets import QApplication
+
+from recognition import FakeModel, RecognitionService, PROMPT, encode_jpeg
+
+HEARTBEAT_MS = 10
+
+
+class Heartbeat:
+    def __init__(self):
+        self.last = None
+        self.max_gap = 0.0
+        self.beats = 0
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.beat)
+
+    def beat(self):
+        now = time.perf_counter()
+        if self.last is not None:
+            self.max_gap = max(self.max_gap, now - self.last)
+        self.last = now
+        self.beats += 1
+
+    def start(self):
+        self.last = None
+        self.max_gap = 0.0
+        self.beats = 0
+        self.timer.start(HEARTBEAT_MS)
+
+
+def run_for(app, seconds):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+def main(latency):
+    app = QApplication(sys.argv)
+    frame = np.random.default_rng(0).integers(0, 255, (1080, 1920, 3), dtype=np.uint8)
+    heartbeat = Heartbeat()
+    window = latency + 0.5
+
+    model = FakeModel(latency)
+    heartbeat.start()
+    QTimer.singleShot(100, lambda: model.generate_content(
+        [PROMPT, {"mime_type": "image/jpeg", "data": encode_jpeg(frame)}]))
+    run_for(app, window)
+    blocking = (heartbeat.max_gap, heartbeat.beats)
+
+    service = RecognitionService(FakeModel(latency))
+    done = []
+    service.recognized.connect(lambda request_id, text: done.append(time.perf_counter()))
+    heartbeat.start()
+    QTimer.singleShot(100, lambda: service.submit(frame))
+    run_for(app, window)
+    worker = (heartbeat.max_gap, heartbeat.beats)
+
+    expected = int(window * 1000 / HEARTBEAT_MS)
+    print(f"fake model latency {latency:.1f}s, 1080p frame, {expected} heartbeats expected")
+    print(f"  blocking : longest stall {blocking[0] * 1e3:8.1f} ms, {blocking[1]:4d} heartbeats")
+    print(f"  worker   : longest stall {worker[0] * 1e3:8.1f} ms, {worker[1]:4d} heartbeats, result delivered: {bool(done)}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 2.0)
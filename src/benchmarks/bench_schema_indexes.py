@@ -0,0 +1,114 @@
+"""Dashboard and history query latency on synthetic data, before and after the index migration.
+
+Run from src/:  python -m benchmarks.bench_schema_indexes [rows ...]
+"""
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from migrations import migrate
+
+PROFILES = 200
+DAYS = 3 * 365
+PROBES = 50
+CHUNK = 50_000
+START = date(2023, 1, 1)
+
+QUERIES = {
+    "recipes.db": {
+        "today's recipes": ("SELECT DISTINCT recipe_name FROM recipe_ingredients WHERE date = ? AND profile_id = ?", "day"),
+        "today's totals": ("""SELECT SUM(calories), SUM(protein), SUM(carbs), SUM(fat)
+                              FROM recipe_ingredients WHERE date = ? AND profile_id = ?""", "day"),
+        "recipe history": ("""SELECT DISTINCT recipe_name, ingredient FROM recipe_ingredients
+                              WHERE profile_id=? ORDER BY recipe_name""", "profile"),
+    },
+    "workout_data.db": {
+        "today's workouts": ("SELECT DISTINCT workout_name FROM workouts WHERE date=? AND profile_id=?", "day"),
+        "workout history": ("""SELECT exercise_name, sets, reps, weight, date FROM workouts
+                               WHERE workout_name=? AND profile_id=? ORDER BY date DESC""", "workout"),
+    },
+}
+
+
+def day(i):
+    return (START + timedelta(days=i % DAYS)).isoformat()
+
+
+def recipe_rows(n):
+    for i in range(n):
+        yield (i % PROFILES, f"recipe {i % 37}", f"ingredient {i % 1000}", 120.0, 6.0, 15.0, 4.0, day(i // PROFILES))
+
+
+def workout_rows(n):
+    for i in range(n):
+        yield (i % PROFILES, f"workout {i % 11}", f"exercise {i % 90}", 3, 10, 40.0, day(i // PROFILES))
+
+
+INSERTS = {
+    "recipes.db": ("""INSERT INTO recipe_ingredients
+                      (profile_id, recipe_name, ingredient, calories, protein, carbs, fat, date)
+                      VALUES (?, ?, ?, ?, ?, ?, ?, ?)""", recipe_rows),
+    "workout_data.db": ("""INSERT INTO workouts
+                           (profile_id, workout_name, exercise_name, sets, reps, weight, date)
+                           VALUES (?, ?, ?, ?, ?, ?, ?)""", workout_rows),
+}
+
+
+def populate(conn, db_filename, rows):
+    sql, generate = INSERTS[db_filename]
+    source = generate(rows)
+    while True:
+        chunk = [row for _, row in zip(range(CHUNK), source)]
+        if not chunk:
+            break
+        with conn:
+            conn.executemany(sql, chunk)
+
+
+def probe_params(kind, rows, rng):
+    profile = rng.randrange(PROFILES)
+    if kind == "day":
+        return (day(rng.randrange(max(1, min(DAYS, rows // PROFILES)))), profile)
+    if kind == "workout":
+        return (f"workout {rng.randrange(11)}", profile)
+    return (profile,)
+
+
+def time_queries(conn, db_filename, rows):
+    results = {}
+    for label, (sql, kind) in QUERIES[db_filename].items():
+        rng = random.Random(7)
+        params = [probe_params(kind, rows, rng) for _ in range(PROBES)]
+        start = time.perf_counter()
+        for p in params:
+            conn.execute(sql, p).fetchall()
+        results[label] = (time.perf_counter() - start) / PROBES
+    return results
+
+
+def main(sizes):
+    print(f"{'rows':>10} {'query':<18} {'scan ms':>10} {'indexed ms':>11} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            for db_filename in QUERIES:
+                conn = sqlite3.connect(os.path.join(tmp, f"{rows}_{db_filename}"))
+                migrate(conn, db_filename, target=1)
+                populate(conn, db_filename, rows)
+                before = time_queries(conn, db_filename, rows)
+                start = time.perf_counter()
+                migrate(conn, db_filename)
+                build = time.perf_counter() - start
+                after = time_queries(conn, db_filename, rows)
+                conn.close()
+                for label in before:
+                    print(f"{rows:>10} {label:<18} {before[label] * 1e3:>10.3f} {after[label] * 1e3:>11.3f} "
+                          f"{before[label] / after[label]:>7.0f}x")
+                print(f"{rows:>10} {'(index build)':<18} {build * 1e3:>10.0f} ms")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 1_000_000, 10_000_000])
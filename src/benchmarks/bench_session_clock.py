@@ -0,0 +1,120 @@
+"""Drift and wakeups of the meditation session clock under a loaded event loop.
+
+"simulated" drives SessionClock from a fake millisecond source. Every
+timeout fires late by a random amount, and the session is paused and
+resumed a few times. It asserts that the shown second, breath phase and
+cycle count always match the true running time, worked out from the fake
+source rather than by the clock (tests/test_session_clock.py runs the same
+check). The old Stopwatch added
+10 ms per tick of a 10 ms timer; the same late ticks are replayed against
+that scheme for comparison.
+
+"real" runs both schemes in a live Qt event loop for a few seconds while
+other callbacks block the GUI thread, and reports their error and wakeups.
+
+Run from src/:  python -m benchmarks.bench_session_clock [real_seconds]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from session_clock import SessionClock
+
+
+class FakeTime:
+    def __init__(self):
+        self.ms = 0
+
+    def __call__(self):
+        return self.ms
+
+
+def simulate(minutes=30, seed=0):
+    rng = random.Random(seed)
+    now = FakeTime()
+    clock = SessionClock(now=now)
+    shown = {}
+    clock.second_changed.connect(lambda value: shown.__setitem__("second", value))
+    clock.phase_changed.connect(lambda value: shown.__setitem__("phase", value))
+    clock.cycle_changed.connect(lambda value: shown.__setitem__("cycle", value))
+    shown.update(second=0, phase=0, cycle=0)
+
+    clock.start()
+    running_ms = 0
+    old_ms = 0
+    checks = 0
+    while running_ms < minutes * 60_000:
+        if rng.random() < 0.01:
+            clock.pause()
+            now.ms += rng.randint(500, 20_000)
+            clock.resume()
+        late = rng.choice([0, 0, 0, rng.randint(1, 50), rng.randint(50, 700)])
+        step = clock.timer.interval() + late
+        now.ms += step
+        running_ms += step
+        # The old 10 ms timer fires once for this stretch plus once per 10 ms it gets to run on time.
+        old_ms += 10 * max(1, (step - late) // 10)
+        clock._on_timeout()
+        expected = (running_ms // 1000, running_ms // clock.phase_ms % clock.phases, running_ms // clock.cycle_ms)
+        actual = (shown["second"], shown["phase"], shown["cycle"])
+        assert actual == expected, f"drift at {running_ms} ms: shown {actual}, expected {expected}"
+        checks += 1
+    return running_ms, old_ms, clock.wakeups, checks
+
+
+def run_real(app, seconds):
+    clock = SessionClock()
+    old = {"ms": 0, "wakeups": 0}
+
+    def old_tick():
+        old["ms"] += 10
+        old["wakeups"] += 1
+
+    old_timer = QTimer()
+    old_timer.setInterval(10)
+    old_timer.timeout.connect(old_tick)
+
+    rng = random.Random(1)
+    load = QTimer()
+    load.setInterval(100)
+    load.timeout.connect(lambda: time.sleep(rng.uniform(0.02, 0.25)))
+
+    start = time.perf_counter()
+    clock.start()
+    old_timer.start()
+    load.start()
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+    true_ms = (time.perf_counter() - start) * 1000
+    new_ms = clock.elapsed()
+    for timer in (old_timer, load):
+        timer.stop()
+    clock.pause()
+    return true_ms, old["ms"], old["wakeups"], new_ms, clock.wakeups
+
+
+def main(seconds):
+    app = QApplication(sys.argv)
+    running_ms, old_ms, wakeups, checks = simulate()
+    print(f"simulated {running_ms / 60000:.0f} min with late ticks and pauses: {checks} checks, no drift")
+    print(f"  old 10 ms accumulation would show {old_ms / 1000:.0f}s for {running_ms / 1000:.0f}s "
+          f"({(old_ms - running_ms) / 1000:+.0f}s drift); session clock woke {wakeups} times")
+
+    true_ms, old_ms, old_wakeups, new_ms, new_wakeups = run_real(app, seconds)
+    true_s = true_ms / 1000
+    print(f"real event loop, {true_s:.1f}s with the GUI thread blocked 20-250 ms every 100 ms:")
+    print(f"  old 10 ms timer : {old_ms / 1000:6.2f}s shown, error {(old_ms - true_ms) / 1000:+6.2f}s, "
+          f"{old_wakeups / true_s:6.1f} wakeups/s")
+    print(f"  session clock   : {new_ms / 1000:6.2f}s shown, error {(new_ms - true_ms) / 1000:+6.2f}s, "
+          f"{new_wakeups / true_s:6.1f} wakeups/s")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0)
@@ -0,0 +1,93 @@
+"""Cold-start profile of the main.py launch path up to the first paint of StartScreen.
+
+Each run starts a fresh interpreter with ``-X importtime`` that builds the
+QApplication and StartScreen the way main.py does and exits on the window's
+first paint. The report gives the median time from process spawn to that
+paint, the median import time, and the slowest imports by cumulative time.
+It also lists which heavy modules were already loaded when the window
+painted; none of them should be.
+
+Run from src/:  python -m benchmarks.bench_startup [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ["pandas", "cv2", "google.generativeai", "numpy", "main_window", "scanner", "stopwatch"]
+TOP_IMPORTS = 12
+
+
+def probe():
+    """Child process: show StartScreen and report as soon as it first paints."""
+    from PyQt6.QtCore import QEvent, QObject
+    from PyQt6.QtWidgets import QApplication
+
+    class FirstPaint(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Type.Paint and watched is window:
+                print(json.dumps({
+                    "painted_at": time.time(),
+                    "heavy": [name for name in HEAVY_MODULES if name in sys.modules],
+                    "modules": len(sys.modules),
+                }), flush=True)
+                os._exit(0)
+            return False
+
+    app = QApplication(sys.argv)
+    first_paint = FirstPaint()
+    app.installEventFilter(first_paint)
+    from start_screen import StartScreen
+    window = StartScreen()
+    app.exec()
+
+
+def parse_importtime(stderr):
+    """Returns {module: cumulative microseconds} for -X importtime output; nested imports keep their indent."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name[1:].rstrip()
+        times[name] = max(times.get(name, 0), int(cumulative))
+    return times
+
+
+def run_once():
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    spawned = time.time()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-m", "benchmarks.bench_startup", "--probe"],
+                            capture_output=True, text=True, env=env, timeout=120)
+    report = None
+    for line in result.stdout.splitlines():
+        if line.startswith("{"):
+            report = json.loads(line)
+    if report is None:
+        raise RuntimeError(f"probe did not paint:\n{result.stderr[-2000:]}")
+    imports = parse_importtime(result.stderr)
+    top_level = sum(us for line, us in imports.items() if not line.startswith(" "))
+    return report["painted_at"] - spawned, top_level / 1e6, imports, report
+
+
+def main(runs):
+    samples = [run_once() for _ in range(runs)]
+    paint = statistics.median(sample[0] for sample in samples)
+    imports = statistics.median(sample[1] for sample in samples)
+    last_imports, last_report = samples[-1][2], samples[-1][3]
+    print(f"{runs} cold starts: first paint of StartScreen after {paint * 1e3:.0f} ms (median), "
+          f"{imports * 1e3:.0f} ms in imports, {last_report['modules']} modules loaded")
+    print(f"heavy modules loaded before first paint: {', '.join(last_report['heavy']) or 'none'}")
+    print(f"slowest imports (cumulative ms, last run):")
+    ranked = sorted(last_imports.items(), key=lambda item: item[1], reverse=True)
+    for name, us in [item for item in ranked if not item[0].startswith(" ")][:TOP_IMPORTS]:
+        print(f"  {us / 1e3:8.1f}  {name}")
+
+
+if __name__ == "__main__":
+    if "--probe" in sys.argv:
+        probe()
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
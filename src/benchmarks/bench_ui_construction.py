@@ -0,0 +1,69 @@
+"""Form construction time per window: runtime uic.loadUi vs the cached generated code.
+
+Each window's form is built onto a fresh widget of its base class, so only
+the .ui part of construction is timed. "loadUi" parses the XML every time,
+"cached" runs the generated setupUi that ui_cache.load_ui uses, and
+"compile" is the one-off cost of regenerating the code after a .ui change.
+
+Run from src/:  python -m benchmarks.bench_ui_construction [runs]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6 import uic
+from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget
+
+import ui_cache
+from utils import resource_path
+
+WINDOWS = [
+    ("StartScreen", "HomeScreen.ui", QMainWindow),
+    ("Profile", "Profile.ui", QMainWindow),
+    ("SavedProfiles", "showProfile.ui", QWidget),
+    ("MainWindow", "Main.ui", QMainWindow),
+    ("Scanner", "Scanner.ui", QMainWindow),
+    ("Stopwatch", "meditation.ui", QWidget),
+    ("RecipeLoad", "existing_recipes.ui", QWidget),
+    ("DisplayWorkout", "workouts.ui", QWidget),
+]
+
+
+def median_ms(build, base, runs):
+    times = []
+    for _ in range(runs):
+        widget = base()
+        start = time.perf_counter()
+        build(widget)
+        times.append(time.perf_counter() - start)
+        widget.deleteLater()
+        QApplication.processEvents()
+    return statistics.median(times) * 1e3
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    app = QApplication(sys.argv)
+    print(f"{'window':<16}{'loadUi ms':>11}{'cached ms':>11}{'speedup':>9}{'compile ms':>12}")
+    total_old = total_new = 0.0
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, filename, base in WINDOWS:
+            start = time.perf_counter()
+            ui_cache.compile_form(resource_path(filename), tmp)
+            compile_ms = (time.perf_counter() - start) * 1e3
+            ui_cache.load_ui(filename, base())  # generate and import outside the timed runs
+            old = median_ms(lambda widget: uic.loadUi(resource_path(filename), widget), base, runs)
+            new = median_ms(lambda widget: ui_cache.load_ui(filename, widget), base, runs)
+            total_old += old
+            total_new += new
+            print(f"{name:<16}{old:>11.2f}{new:>11.2f}{old / new:>8.1f}x{compile_ms:>12.1f}")
+    print(f"{'all windows':<16}{total_old:>11.2f}{total_new:>11.2f}{total_old / total_new:>8.1f}x")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
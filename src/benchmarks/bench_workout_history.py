@@ -0,0 +1,98 @@
+"""Workout history open and switch time with 100k+ logged sets.
+
+"eager" reproduces the old DisplayWorkout: workout names from SELECT DISTINCT
+over the workouts table and, on every switch, every set of the workout added
+to a QListWidget. "paged" is DisplayWorkout with names from workout_catalog
+and history paged by (date, id) cursor under per-session headers. Times run
+until the list has painted.
+
+Run from src/:  python -m benchmarks.bench_workout_history [sets]
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QComboBox, QListWidget
+
+import db
+
+WORKOUTS = 4
+EXERCISES = 25
+PROFILE_ID = 1
+
+
+def seed(total_sets):
+    days = total_sets // (WORKOUTS * EXERCISES)
+    rows = [(PROFILE_ID, f"workout {w}", f"exercise {e}", 3, 10, 40.0 + e, f"day {d:05d}")
+            for w in range(WORKOUTS) for d in range(days) for e in range(EXERCISES)]
+    with db.get_connection("workout_data.db") as conn:
+        conn.executemany("""INSERT INTO workouts (profile_id, workout_name, exercise_name, sets, reps, weight, date)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)""", rows)
+    return len(rows)
+
+
+class EagerHistory:
+    def __init__(self):
+        self.combo = QComboBox()
+        self.list = QListWidget()
+        self.list.resize(661, 321)
+        curr = db.get_connection("workout_data.db").cursor()
+        curr.execute("SELECT DISTINCT workout_name FROM workouts WHERE profile_id=?", (PROFILE_ID,))
+        for (name,) in curr.fetchall():
+            self.combo.addItem(name)
+        self.list.show()
+        self.switch(0)
+
+    def switch(self, index):
+        self.combo.setCurrentIndex(index)
+        curr = db.get_connection("workout_data.db").cursor()
+        curr.execute("""SELECT exercise_name, sets, reps, weight, date FROM workouts
+                        WHERE workout_name=? AND profile_id=? ORDER BY date DESC""",
+                     (self.combo.currentText(), PROFILE_ID))
+        self.list.clear()
+        for exercise, sets, reps, weight, date_str in curr.fetchall():
+            self.list.addItem(f"{date_str} | {exercise}: {sets} sets x {reps} reps ({weight} kg)")
+
+
+class PagedHistory:
+    def __init__(self):
+        from workout_display import DisplayWorkout
+        self.window = DisplayWorkout(PROFILE_ID)
+        self.window.show()
+
+    def switch(self, index):
+        self.window.workout_name_list.setCurrentIndex(index)
+
+
+def timed(action):
+    start = time.perf_counter()
+    result = action()
+    QApplication.processEvents()
+    return result, (time.perf_counter() - start) * 1e3
+
+
+def main():
+    total_sets = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    app = QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        # get_db_path() resolves ~/nutrifit, so point HOME at the scratch directory.
+        os.environ["HOME"] = tmp
+        os.makedirs(os.path.join(tmp, "nutrifit"))
+        logged = seed(total_sets)
+        from workout_display import DisplayWorkout
+        DisplayWorkout(0).close()  # import and build the form outside the timed runs
+        print(f"{logged} sets across {WORKOUTS} workouts")
+        print(f"{'':<8}{'open ms':>10}{'switch ms':>11}")
+        for name, history in (("eager", EagerHistory), ("paged", PagedHistory)):
+            view, open_ms = timed(history)
+            switches = [timed(lambda index=index: view.switch(index))[1] for index in (1, 2, 3, 0)]
+            print(f"{name:<8}{open_ms:>10.1f}{sum(switches) / len(switches):>11.1f}")
+        db.close_all()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import collections
+import math
+import random
+import time
+
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import QBrush, QColor, QPainter, QPainterPath, QPixmap, QRadialGradient, QTransform
+
+from animation_clock import AnimationClock
+
+ROUNDED_RECT = "rounded_rect"
+ELLIPSE = "ellipse"
+SPRITE_CACHE_BYTES = 16 * 1024 * 1024
+
+
+class Blob:
+    def __init__(self, color, x_speed, y_speed):
+        self.x = random.random()
+        self.y = random.random()
+        self.dx = x_speed
+        self.dy = y_speed
+        self.color = color
+
+    def move(self, steps=1.0):
+        self.x += self.dx * steps
+        self.y += self.dy * steps
+        if self.x <= 0: self.dx = abs(self.dx)
+        elif self.x >= 1: self.dx = -abs(self.dx)
+        if self.y <= 0: self.dy = abs(self.dy)
+        elif self.y >= 1: self.dy = -abs(self.dy)
+
+
+class SpriteCache:
+    """LRU cache of radial gradient sprites keyed by (diameter, rgba), bounded in bytes."""
+
+    def __init__(self, max_bytes=SPRITE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.sprites = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, diameter, color):
+        key = (diameter, color.rgba())
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+        self.misses += 1
+        sprite = render_sprite(diameter, color)
+        self.sprites[key] = sprite
+        self.bytes += diameter * diameter * 4
+        while self.bytes > self.max_bytes and len(self.sprites) > 1:
+            (old_diameter, _), _ = self.sprites.popitem(last=False)
+            self.bytes -= old_diameter * old_diameter * 4
+        return sprite
+
+    def clear(self):
+        self.sprites.clear()
+        self.bytes = 0
+
+
+def render_sprite(diameter, color):
+    """A ``color`` to transparent radial gradient filling a ``diameter`` square pixmap."""
+    sprite = QPixmap(diameter, diameter)
+    sprite.fill(Qt.GlobalColor.transparent)
+    center = diameter / 2
+    gradient = QRadialGradient(center, center, center)
+    gradient.setColorAt(0.0, color)
+    transparent = QColor(color)
+    transparent.setAlpha(0)
+    gradient.setColorAt(1.0, transparent)
+    painter = QPainter(sprite)
+    painter.fillRect(sprite.rect(), QBrush(gradient))
+    painter.end()
+    return sprite
+
+
+sprites = SpriteCache()
+
+
+class BlobPainter:
+    """Paints a base colour plus moving gradient blobs inside a rounded rect or ellipse.
+
+    Blobs are soft radial gradients, so they are drawn as cached sprites into
+    a frame buffer of at most ``AnimationClock.frame_max_edge`` pixels per
+    edge, which then fills the widget's shape in one antialiased, scaled
+    draw. The buffer and the shape path are rebuilt when the widget size or
+    that limit changes. Paint time is reported to the clock's governor.
+
+    ``target`` paints the same picture scaled into a smaller rect, so a shape
+    can grow and shrink without rebuilding anything.
+    """
+
+    def __init__(self, base_color, shape=ROUNDED_RECT, corner_radius=10.0, blob_radius=0.6, spotlight_radius=0.4):
+        self.base_color = QColor(base_color)
+        self.shape = shape
+        self.corner_radius = corner_radius
+        self.blob_radius = blob_radius
+        self.spotlight_radius = spotlight_radius
+        self.size = None
+        self.path = None
+        self.frame = None
+        self.scale = 1.0
+
+    def invalidate(self):
+        self.size = None
+
+    def _prepare(self, rect, max_edge):
+        size = (rect.width(), rect.height(), max_edge)
+        if size == self.size:
+            return
+        self.size = size
+        w, h = max(1, size[0]), max(1, size[1])
+        self.scale = min(1.0, max_edge / max(w, h))
+        self.frame = QPixmap(max(1, math.ceil(w * self.scale)), max(1, math.ceil(h * self.scale)))
+        self.path = QPainterPath()
+        if self.shape == ELLIPSE:
+            self.path.addEllipse(QRectF(rect))
+        else:
+            self.path.addRoundedRect(QRectF(rect), self.corner_radius, self.corner_radius)
+
+    def _composite(self, blobs, w, spotlight, spotlight_color):
+        """Draws the base colour, blobs and spotlight (a point in rect coordinates) into the frame buffer."""
+        self.frame.fill(self.base_color)
+        painter = QPainter(self.frame)
+        fw, fh = self.frame.width(), self.frame.height()
+        radius = max(1, round(w * self.blob_radius * self.scale))
+        for blob in blobs:
+            sprite = sprites.get(2 * radius, blob.color)
+            painter.drawPixmap(QPointF(blob.x * fw - radius, blob.y * fh - radius), sprite)
+        if spotlight is not None:
+            radius = max(1, round(w * self.spotlight_radius * self.scale))
+            sprite = sprites.get(2 * radius, spotlight_color)
+            painter.drawPixmap(QPointF(spotlight.x() * self.scale - radius, spotlight.y() * self.scale - radius), sprite)
+        painter.end()
+
+    def paint(self, painter, rect, blobs, spotlight=None, spotlight_color=None, target=None):
+        clock = AnimationClock.instance()
+        start = time.perf_counter()
+        self._prepare(rect, clock.frame_max_edge)
+        area = QRectF(rect) if target is None else QRectF(target)
+        kx, ky = area.width() / max(1, rect.width()), area.height() / max(1, rect.height())
+        if spotlight is not None:
+            spotlight = QPointF((spotlight.x() - area.x()) / kx, (spotlight.y() - area.y()) / ky)
+        self._composite(blobs, rect.width(), spotlight, spotlight_color)
+        brush = QBrush(self.frame)
+        brush.setTransform(QTransform.fromTranslate(area.x(), area.y()).scale(kx / self.scale, ky / self.scale))
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(brush)
+        if target is None:
+            painter.drawPath(self.path)
+        elif self.shape == ELLIPSE:
+            painter.drawEllipse(area)
+        else:
+            painter.drawRoundedRect(area, self.corner_radius, self.corner_radius)
+        clock.report_paint(time.perf_counter() - start)
@@ -0,0 +1,44 @@
+from PyQt6.QtCore import QPointF, QRectF, pyqtProperty
+from PyQt6.QtGui import QPainter
+from arora_bg import AuroraBackgroundLabel
+
+
+class BreathingCircle(AuroraBackgroundLabel):
+    """Aurora circle whose size is the animatable ``radius`` property.
+
+    The widget keeps the geometry of the largest circle (``place``), so
+    animating ``radius`` only repaints; animating the geometry moved and
+    resized the widget on every frame. Until a radius is set the circle
+    fills the widget.
+    """
+
+    def __init__(self, parent=None, max_radius=150):
+        super().__init__(parent)
+        self.max_radius = max_radius
+        self._radius = None
+
+    def place(self, center):
+        """Centres the largest circle on ``center``."""
+        side = 2 * self.max_radius
+        self.setGeometry(center.x() - self.max_radius, center.y() - self.max_radius, side, side)
+
+    @pyqtProperty(float)
+    def radius(self):
+        if self._radius is None:
+            return min(self.width(), self.height()) / 2
+        return self._radius
+
+    @radius.setter
+    def radius(self, value):
+        self._radius = value
+        self.update()
+
+    def circle_rect(self):
+        r = self.radius
+        center = QPointF(self.rect().center()) + QPointF(0.5, 0.5)
+        return QRectF(center.x() - r, center.y() - r, 2 * r, 2 * r)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        self.blob_painter.paint(painter, self.rect(), self.blobs, self.cursor_pos, self.spotlight_color,
+                                target=self.circle_rect())
@@ -0,0 +1,97 @@
+"""Maintenance commands for the NutriFit databases.
+
+Run from src/:  python cli.py <command> [options]
+"""
+import argparse
+import sys
+
+import exporter
+import importer
+import store
+import ui_cache
+
+
+def backfill_totals(args):
+    days = store.backfill_daily_totals()
+    print(f"Rebuilt daily totals for {days} profile-days")
+
+
+def import_history(args):
+    def report(stats):
+        print(f"  {stats['resumed_from'] + stats['rows']} rows read, {stats['rows_per_sec']:,.0f} rows/sec", flush=True)
+
+    try:
+        stats = importer.import_file(args.path, args.kind, args.profile, fmt=args.format,
+                                     chunk_size=args.chunk_size, restart=args.restart,
+                                     progress=None if args.quiet else report)
+    except (OSError, ValueError) as e:
+        print("Import failed:", e)
+        return 1
+    if stats["rows"] == 0 and stats["resumed_from"]:
+        print(f"{args.path} was already imported ({stats['resumed_from']} rows); use --restart to import it again")
+        return 0
+    if stats["resumed_from"]:
+        print(f"Resumed after row {stats['resumed_from']}")
+    print(f"Imported {stats['imported']} {args.kind} rows ({stats['skipped']} skipped, "
+          f"{stats['unresolved']} unknown ingredients) in {stats['seconds']:.1f} s, "
+          f"{stats['rows_per_sec']:,.0f} rows/sec")
+    return 0
+
+
+def export_history(args):
+    datasets = args.only.split(",") if args.only else None
+    try:
+        stats = exporter.export_profile(args.profile, args.out_dir, fmt=args.format, datasets=datasets,
+                                        start=args.start, end=args.end, chunk_size=args.chunk_size)
+    except (OSError, ValueError, ImportError) as e:
+        print("Export failed:", e)
+        return 1
+    for name in exporter.DATASETS:
+        if name in stats:
+            print(f"{name}: {stats[name]} rows")
+    print(f"Exported to {args.out_dir} in {stats['seconds']:.1f} s, {stats['rows_per_sec']:,.0f} rows/sec")
+    return 0
+
+
+def build_ui(args):
+    for filename, status in ui_cache.build_all(args.cache_dir):
+        print(f"{filename}: {status}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="cli.py", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    backfill = commands.add_parser("backfill-totals", help="rebuild the daily_totals rollup from recipe_ingredients")
+    backfill.set_defaults(func=backfill_totals)
+
+    imports = commands.add_parser("import", help="import meal or workout history from a CSV or JSON export")
+    imports.add_argument("kind", choices=importer.KINDS)
+    imports.add_argument("path")
+    imports.add_argument("--profile", type=int, required=True, help="id of the profile to import into")
+    imports.add_argument("--format", choices=("csv", "json"), help="default: from the file extension")
+    imports.add_argument("--chunk-size", type=int, default=importer.CHUNK_SIZE, help="rows per transaction")
+    imports.add_argument("--restart", action="store_true", help="start from the first row, ignoring earlier progress")
+    imports.add_argument("--quiet", action="store_true", help="only print the summary")
+    imports.set_defaults(func=import_history)
+
+    export = commands.add_parser("export", help="export a profile's meals, workouts and goals")
+    export.add_argument("out_dir", help="directory to write one file per dataset into")
+    export.add_argument("--profile", type=int, required=True, help="id of the profile to export")
+    export.add_argument("--format", choices=exporter.FORMATS, default=exporter.CSV)
+    export.add_argument("--from", dest="start", help="first date to include (YYYY-MM-DD)")
+    export.add_argument("--to", dest="end", help="last date to include (YYYY-MM-DD)")
+    export.add_argument("--only", help=f"comma-separated datasets out of {','.join(exporter.DATASETS)}")
+    export.add_argument("--chunk-size", type=int, default=exporter.CHUNK_SIZE, help="rows fetched per read")
+    export.set_defaults(func=export_history)
+
+    build = commands.add_parser("build-ui", help="compile the .ui forms into the generated-code cache")
+    build.add_argument("--cache-dir", help="where to write the generated modules (default ~/nutrifit/ui_cache)")
+    build.set_defaults(func=build_ui)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+import atexit
+import os
+import sqlite3
+
+from migrations import migrate
+from utils import get_db_path
+
+STATEMENT_CACHE_SIZE = 256
+
+_connections = {}
+
+
+def get_connection(db_filename):
+    """Returns the long-lived connection for one of the app databases.
+
+    Connections are opened once per file and kept for the life of the
+    process, in WAL mode with synchronous=NORMAL, so callers should use
+    ``with conn:`` around writes instead of committing and closing. The
+    schema is migrated to the latest version when the file is first opened.
+    """
+    path = get_db_path(db_filename)
+    conn = _connections.get(path)
+    if conn is None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = sqlite3.connect(path, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        migrate(conn, db_filename)
+        _connections[path] = conn
+    return conn
+
+
+def close_all():
+    while _connections:
+        _, conn = _connections.popitem()
+        conn.close()
+
+
+atexit.register(close_all)
@@ -1,7 +1,5 @@
-import sqlite3
-conn = sqlite3.connect("recipes.db")
-curr = conn.cursor()
+from db import get_connection
+curr = get_connection("recipes.db").cursor()
 curr.execute("SELECT * FROM recipe_ingredients")
 rows = curr.fetchall()
-conn.close()
 print(rows)
@@ -1,38 +1,66 @@
-from PyQt6.QtWidgets import QWidget, QApplication, QListWidgetItem
-from PyQt6 import uic
-from PyQt6.QtCore import Qt, QDate
-import sqlite3
+from PyQt6.QtWidgets import QWidget, QApplication
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
 import sys 
-from utils import resource_path,get_db_path
+from ui_cache import load_ui
+from store import recipe_history_page
+
+PAGE_SIZE = 100
+
+
+class RecipeHistoryModel(QAbstractListModel):
+    """A profile's recipes with their ingredients, fetched a page at a time as the view scrolls.
+
+    Pages are keyed by the last recipe name shown, so fetching the next page
+    costs the same at any depth, and display text is only built for rows the
+    view asks for.
+    """
+
+    def __init__(self, profile_id, page_size=PAGE_SIZE, parent=None):
+        super().__init__(parent)
+        self.profile_id = profile_id
+        self.page_size = page_size
+        self.rows = []
+        self.exhausted = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and role == Qt.ItemDataRole.DisplayRole:
+            recipe_name, ingredients = self.rows[index.row()]
+            return f"{recipe_name}:\n{ingredients}"
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.exhausted:
+            return
+        after = self.rows[-1][0] if self.rows else ""
+        page = recipe_history_page(self.profile_id, after, self.page_size)
+        if len(page) < self.page_size:
+            self.exhausted = True
+        if not page:
+            return
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(page) - 1)
+        self.rows.extend(page)
+        self.endInsertRows()
+
 
 class RecipeLoad(QWidget):
     def __init__(self, profile_id):
         super().__init__()
-        uic.loadUi(resource_path("existing_recipes.ui"),self)
+        load_ui("existing_recipes.ui", self)
         self.profile_id = profile_id
         self.load_the_recipes()
         
     def load_the_recipes(self):
-        conn = sqlite3.connect(get_db_path("recipes.db"))
-        curr = conn.cursor()
-        curr.execute("""SELECT DISTINCT recipe_name, ingredient FROM recipe_ingredients 
-                     WHERE profile_id=? ORDER BY recipe_name""", (self.profile_id,))
-        rows = curr.fetchall()
-        conn.close()
-
-        recipes_dict = {}
-        for recipe_name, ingredients in rows:
-            if recipe_name not in recipes_dict:
-                recipes_dict[recipe_name] = []
-            recipes_dict[recipe_name].append(ingredients)
-
-        self.display_recipes.clear()
-
-        for recipe_name, ingredient_list in recipes_dict.items():
-            ingredient_str = ", ".join(ingredient_list)
-            display_text = f"{recipe_name}:\n{ingredient_str}"
-            item = QListWidgetItem(display_text)
-            self.display_recipes.addItem(item)
+        self.recipes = RecipeHistoryModel(self.profile_id, parent=self)
+        self.display_recipes.setUniformItemSizes(True)
+        self.display_recipes.setModel(self.recipes)
+        if self.recipes.canFetchMore():
+            self.recipes.fetchMore()
 
 
 if __name__=="__main__":
@@ -0,0 +1,197 @@
+"""Streaming export of a profile's history.
+
+Each dataset is read with one cursor a chunk at a time (``fetchmany``) and
+written as it arrives, so memory stays flat however long the history is.
+The date-range filters use the (profile_id, date) indexes. The meals and
+workouts files use the column names ``importer`` reads, so an export can be
+imported into another profile or install.
+
+Datasets, one file each in the output directory:
+    profile       the profile's details and daily goals
+    meals         one row per logged ingredient with its macros
+    daily_totals  macro totals per day
+    workouts      one row per logged exercise
+"""
+import csv
+import json
+import os
+import time
+
+from db import get_connection
+
+CSV = "csv"
+JSONL = "jsonl"
+PARQUET = "parquet"
+FORMATS = (CSV, JSONL, PARQUET)
+EXTENSIONS = {CSV: ".csv", JSONL: ".jsonl", PARQUET: ".parquet"}
+CHUNK_SIZE = 5000
+
+# name: (database, table, [(column, type)], date column or None, ORDER BY)
+# The profile form stores what was typed, so its measurements and goals are REAL.
+DATASETS = {
+    "profile": ("entries.db", "entries", [
+        ("name", "TEXT"), ("age", "INTEGER"), ("weight", "REAL"), ("goal_weight", "REAL"),
+        ("height", "REAL"), ("cal_goal", "REAL"), ("prot_goal", "REAL"),
+        ("carb_goal", "REAL"), ("fat_goal", "REAL"),
+    ], None, None),
+    "meals": ("recipes.db", "recipe_ingredients", [
+        ("date", "TEXT"), ("recipe_name", "TEXT"), ("ingredient", "TEXT"), ("calories", "REAL"),
+        ("protein", "REAL"), ("carbs", "REAL"), ("fat", "REAL"),
+    ], "date", "date, recipe_name"),
+    "daily_totals": ("recipes.db", "daily_totals", [
+        ("date", "TEXT"), ("cal", "REAL"), ("prot", "REAL"), ("carbs", "REAL"), ("fat", "REAL"),
+    ], "date", "date"),
+    "workouts": ("workout_data.db", "workouts", [
+        ("date", "TEXT"), ("workout_name", "TEXT"), ("exercise_name", "TEXT"), ("sets", "INTEGER"),
+        ("reps", "INTEGER"), ("weight", "REAL"),
+    ], "date", "date, workout_name"),
+}
+
+
+def dataset_query(name, start=None, end=None):
+    """SQL and parameters for one dataset of a profile (bound as the first parameter later)."""
+    _, table, columns, date_column, order = DATASETS[name]
+    key = "id" if table == "entries" else "profile_id"
+    sql = f"SELECT {', '.join(column for column, _ in columns)} FROM {table} WHERE {key} = ?"
+    params = []
+    if date_column is not None:
+        if start is not None:
+            sql += f" AND {date_column} >= ?"
+            params.append(start)
+        if end is not None:
+            sql += f" AND {date_column} <= ?"
+            params.append(end)
+    if order is not None:
+        sql += f" ORDER BY {order}"
+    return sql, params
+
+
+def iter_chunks(name, profile_id, start=None, end=None, chunk_size=CHUNK_SIZE):
+    """Yields lists of up to ``chunk_size`` row tuples from one cursor."""
+    sql, params = dataset_query(name, start, end)
+    cursor = get_connection(DATASETS[name][0]).execute(sql, [profile_id, *params])
+    try:
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield rows
+    finally:
+        cursor.close()
+
+
+class CsvWriter:
+    def __init__(self, path, columns):
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([column for column, _ in columns])
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class JsonLinesWriter:
+    def __init__(self, path, columns):
+        self.file = open(path, "w", encoding="utf-8")
+        self.names = [column for column, _ in columns]
+
+    def write(self, rows):
+        names = self.names
+        self.file.write("".join(json.dumps(dict(zip(names, row)), ensure_ascii=False) + "\n" for row in rows))
+
+    def close(self):
+        self.file.close()
+
+
+def fit(value, kind):
+    """``value`` as the column type, or None when it does not fit (e.g. text in a number column)."""
+    if value is None:
+        return None
+    if kind == "TEXT":
+        return str(value)
+    if isinstance(value, str):
+        try:
+            value = float(value)
+        except ValueError:
+            return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if kind == "INTEGER":
+        return int(value) if float(value).is_integer() else None
+    return float(value)
+
+
+class ParquetWriter:
+    """Writes each chunk as a row group; needs pyarrow, which is only imported here.
+
+    SQLite columns can hold any type, so a column whose values do not all
+    convert is written with the misfits as nulls instead of failing.
+    """
+
+    def __init__(self, path, columns):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export needs pyarrow (pip install pyarrow)") from None
+        types = {"TEXT": pa.string(), "INTEGER": pa.int64(), "REAL": pa.float64()}
+        self.pa = pa
+        self.kinds = [kind for _, kind in columns]
+        self.schema = pa.schema([(column, types[kind]) for column, kind in columns])
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def array(self, values, kind, field):
+        try:
+            return self.pa.array(values, type=field.type)
+        except (self.pa.ArrowInvalid, self.pa.ArrowTypeError, OverflowError):
+            return self.pa.array([fit(value, kind) for value in values], type=field.type)
+
+    def write(self, rows):
+        columns = list(zip(*rows))
+        arrays = [self.array(values, kind, field) for values, kind, field in zip(columns, self.kinds, self.schema)]
+        self.writer.write_table(self.pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+WRITERS = {CSV: CsvWriter, JSONL: JsonLinesWriter, PARQUET: ParquetWriter}
+
+
+def export_profile(profile_id, out_dir, fmt=CSV, datasets=None, start=None, end=None, chunk_size=CHUNK_SIZE):
+    """Writes a profile's datasets to ``out_dir`` as <dataset>.<format>.
+
+    ``start`` and ``end`` are inclusive ISO dates that limit the dated
+    datasets. Returns {dataset: rows written} plus "seconds" and
+    "rows_per_sec" for the whole export.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown export format {fmt!r}")
+    datasets = list(datasets or DATASETS)
+    unknown = [name for name in datasets if name not in DATASETS]
+    if unknown:
+        raise ValueError(f"unknown dataset {unknown[0]!r}; choose from {', '.join(DATASETS)}")
+    if get_connection("entries.db").execute("SELECT 1 FROM entries WHERE id = ?", (profile_id,)).fetchone() is None:
+        raise ValueError(f"no profile with id {profile_id}")
+    os.makedirs(out_dir, exist_ok=True)
+    stats = {}
+    began = time.perf_counter()
+    for name in datasets:
+        path = os.path.join(out_dir, name + EXTENSIONS[fmt])
+        writer = WRITERS[fmt](path, DATASETS[name][2])
+        written = 0
+        try:
+            for rows in iter_chunks(name, profile_id, start, end, chunk_size):
+                writer.write(rows)
+                written += len(rows)
+        finally:
+            writer.close()
+        stats[name] = written
+    seconds = time.perf_counter() - began
+    total = sum(stats.values())
+    stats["seconds"] = seconds
+    stats["rows_per_sec"] = total / seconds if seconds else 0.0
+    return stats
@@ -0,0 +1,201 @@
+import os
+import threading
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+from PyQt6.QtCore import QThread
+from PyQt6.QtGui import QImage, QPixmap
+
+DEFAULT_FPS = 30
+
+
+def camera_source(source=None):
+    """Resolves a capture source: a camera index or a video file path.
+
+    Defaults to NUTRIFIT_CAMERA_SOURCE, then camera 0, so the Scanner can be
+    driven from a recorded clip without a webcam.
+    """
+    if source is None:
+        source = os.environ.get("NUTRIFIT_CAMERA_SOURCE", "0")
+    if isinstance(source, str) and source.isdigit():
+        return int(source)
+    return source
+
+
+class CaptureThread(QThread):
+    """Grabs camera frames continuously into a single-slot "latest frame" buffer.
+
+    The GUI calls ``take_latest`` at display rate. A frame that is replaced
+    before the GUI took it counts as dropped, so a slow GUI never builds a
+    backlog. Three preallocated buffers rotate between the capture thread,
+    the latest slot and the frame the GUI is showing, so the frame returned by
+    ``take_latest`` stays untouched until the next call.
+
+    File sources are paced at ``target_fps`` and loop at the end.
+    """
+
+    def __init__(self, source=None, target_fps=DEFAULT_FPS):
+        super().__init__()
+        self.source = camera_source(source)
+        self.target_fps = target_fps
+        self.buffers = [None, None, None]
+        self._latest = None
+        self._current = None
+        self._lock = threading.Lock()
+        self.captured = 0
+        self.displayed = 0
+        self.dropped = 0
+
+    @property
+    def is_file(self):
+        return isinstance(self.source, str)
+
+    @property
+    def current(self):
+        """The frame most recently handed to the GUI."""
+        return self.buffers[self._current] if self._current is not None else None
+
+    def stats(self):
+        return {"captured": self.captured, "displayed": self.displayed, "dropped": self.dropped}
+
+    def take_latest(self):
+        """Returns the newest frame not shown yet, or None if nothing new arrived."""
+        with self._lock:
+            if self._latest is None:
+                return None
+            self._current, self._latest = self._latest, None
+            self.displayed += 1
+            return self.buffers[self._current]
+
+    def _write_slot(self):
+        with self._lock:
+            for slot in range(len(self.buffers)):
+                if slot != self._latest and slot != self._current:
+                    return slot
+
+    def _publish(self, slot):
+        with self._lock:
+            if self._latest is not None:
+                self.dropped += 1
+            self._latest = slot
+            self.captured += 1
+
+    def grab(self, cap):
+        """Reads one frame from ``cap`` into a free buffer and publishes it; returns False when the read failed."""
+        slot = self._write_slot()
+        ret, frame = cap.read(self.buffers[slot]) if self.buffers[slot] is not None else cap.read()
+        if not ret:
+            return False
+        self.buffers[slot] = frame
+        self._publish(slot)
+        return True
+
+    def stop(self):
+        # An interruption request made before run() gets going is still seen by its loop.
+        self.requestInterruption()
+        self.wait()
+
+    def run(self):
+        cap = cv2.VideoCapture(self.source)
+        if not self.is_file and self.target_fps:
+            cap.set(cv2.CAP_PROP_FPS, self.target_fps)
+        interval = 1.0 / self.target_fps if self.target_fps else 0.0
+        next_due = time.perf_counter()
+        try:
+            while not self.isInterruptionRequested():
+                if not self.grab(cap):
+                    if self.is_file and cap.get(cv2.CAP_PROP_FRAME_COUNT) > 0:
+                        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                        continue
+                    time.sleep(0.05)
+                    continue
+                if self.is_file and interval:
+                    next_due += interval
+                    delay = next_due - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        next_due = time.perf_counter()
+        finally:
+            cap.release()
+
+
+def frame_to_image(frame):
+    """Wraps a BGR (or grayscale) frame in a QImage without converting or copying it."""
+    h, w = frame.shape[:2]
+    if frame.ndim == 2:
+        return QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_Grayscale8)
+    return QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_BGR888)
+
+
+class PreviewRenderer:
+    """Scales frames into one reused display-sized buffer and wraps it as a pixmap.
+
+    Only the display-sized image is converted and uploaded, and the BGR data
+    goes to Qt as-is instead of through a cvtColor to RGB.
+    """
+
+    def __init__(self):
+        self.buffer = None
+
+    def render(self, frame, size):
+        w, h = max(1, size.width()), max(1, size.height())
+        if (frame.shape[1], frame.shape[0]) == (w, h):
+            return QPixmap.fromImage(frame_to_image(frame))
+        shape = (h, w) + frame.shape[2:]
+        if self.buffer is None or self.buffer.shape != shape:
+            self.buffer = np.empty(shape, dtype=frame.dtype)
+        cv2.resize(frame, (w, h), dst=self.buffer, interpolation=cv2.INTER_LINEAR)
+        return QPixmap.fromImage(frame_to_image(self.buffer))
+
+
+class FrameStats:
+    """Per-frame time and, when tracing is on, Python/NumPy bytes allocated per frame.
+
+    Tracing uses tracemalloc and slows every allocation down, so it is only
+    enabled with ``trace_allocations=True`` or NUTRIFIT_FRAME_STATS=1.
+    """
+
+    def __init__(self, trace_allocations=None):
+        if trace_allocations is None:
+            trace_allocations = os.environ.get("NUTRIFIT_FRAME_STATS") == "1"
+        self.trace_allocations = trace_allocations
+        if trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.reset()
+
+    def reset(self):
+        self.frames = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.total_allocated = 0
+        self._start = None
+        self._baseline = 0
+
+    def begin(self):
+        if self.trace_allocations:
+            tracemalloc.reset_peak()
+            self._baseline = tracemalloc.get_traced_memory()[0]
+        self._start = time.perf_counter()
+
+    def end(self):
+        if self._start is None:
+            return
+        elapsed = time.perf_counter() - self._start
+        self._start = None
+        self.frames += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        if self.trace_allocations:
+            self.total_allocated += tracemalloc.get_traced_memory()[1] - self._baseline
+
+    def summary(self):
+        if not self.frames:
+            return "no frames"
+        text = (f"{self.frames} frames, {self.total_time / self.frames * 1e3:.2f} ms/frame "
+                f"(max {self.max_time * 1e3:.2f} ms)")
+        if self.trace_allocations:
+            text += f", {self.total_allocated / self.frames / 1024:.0f} KiB allocated/frame"
+        return text
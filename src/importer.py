@@ -0,0 +1,294 @@
+"""Bulk import of meal and workout history exported from other trackers.
+
+Records stream from a CSV, JSON Lines or JSON array file through a chain of
+generators (read, normalize, chunk), so only one chunk is in memory at a
+time. Each chunk is written in one transaction together with the file's row
+in ``import_progress``, and running the same import again after an
+interruption picks up after the last committed chunk.
+
+Meal rows need a date, a recipe name and an ingredient. Macros are taken
+from the row when it has calories; otherwise the ingredient is looked up in
+the nutrition table and scaled by the quantity (servings, default 1).
+Workout rows need a date, a workout name and an exercise. Rows missing
+those, or with an unknown ingredient, are counted and skipped.
+"""
+import csv
+import hashlib
+import itertools
+import json
+import os
+import re
+import time
+from datetime import date
+
+import numpy as np
+
+from db import get_connection
+from store import INSERT_RECIPE_ROW, INSERT_WORKOUT_ROW
+
+MEALS = "meals"
+WORKOUTS = "workouts"
+KINDS = (MEALS, WORKOUTS)
+TARGET_DB = {MEALS: "recipes.db", WORKOUTS: "workout_data.db"}
+CHUNK_SIZE = 5000
+FINGERPRINT_BYTES = 1 << 20
+JSON_READ_BYTES = 1 << 16
+SEPARATORS = re.compile(r"[\s,]*")
+
+# Accepted column names per field, first match wins; matching ignores case.
+FIELDS = {
+    MEALS: {
+        "date": ("date", "day", "logged_on"),
+        "recipe_name": ("recipe_name", "recipe", "meal"),
+        "ingredient": ("ingredient", "food", "item", "name"),
+        "quantity": ("quantity", "servings", "qty"),
+        "calories": ("calories", "cal", "kcal"),
+        "protein": ("protein", "prot"),
+        "carbs": ("carbs", "carbohydrates"),
+        "fat": ("fat", "fats"),
+    },
+    WORKOUTS: {
+        "date": ("date", "day", "logged_on"),
+        "workout_name": ("workout_name", "workout", "routine"),
+        "exercise_name": ("exercise_name", "exercise"),
+        "sets": ("sets",),
+        "reps": ("reps",),
+        "weight": ("weight", "weight_kg", "load"),
+    },
+}
+
+UPSERT_PROGRESS = """
+    INSERT INTO import_progress (fingerprint, profile_id, source, rows_done, finished, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (fingerprint, profile_id) DO UPDATE SET
+        source = excluded.source,
+        rows_done = excluded.rows_done,
+        finished = excluded.finished,
+        updated_at = excluded.updated_at
+"""
+
+
+def fingerprint(path):
+    """Identifies an export by its size and the SHA-256 of its whole content.
+
+    The path is not part of it, so a moved or renamed file still resumes,
+    while a re-export with rows appended or changed is a new import.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(FINGERPRINT_BYTES), b""):
+            digest.update(block)
+    return f"{os.path.getsize(path)}:{digest.hexdigest()}"
+
+
+def detect_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".json", ".jsonl", ".ndjson"):
+        return "json"
+    raise ValueError(f"cannot tell the format of {path!r}; pass csv or json")
+
+
+def iter_csv(path):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        yield from csv.DictReader(f)
+
+
+def iter_json(path):
+    """Yields the objects of a JSON array, or of a JSON Lines file, one at a time."""
+    with open(path, encoding="utf-8-sig") as f:
+        buffer = f.read(JSON_READ_BYTES).lstrip()
+        if not buffer.startswith("["):
+            f.seek(0)
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+            return
+        decoder = json.JSONDecoder()
+        buffer, pos = buffer[1:], 0
+        while True:
+            pos = SEPARATORS.match(buffer, pos).end()
+            # Keep at least one read's worth ahead so a record is never cut off mid-way.
+            if len(buffer) - pos < JSON_READ_BYTES:
+                more = f.read(JSON_READ_BYTES)
+                if more:
+                    buffer, pos = buffer[pos:] + more, 0
+                    continue
+            if pos >= len(buffer) or buffer[pos] == "]":
+                return
+            try:
+                record, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                more = f.read(JSON_READ_BYTES)
+                if not more:
+                    raise
+                buffer, pos = buffer[pos:] + more, 0
+                continue
+            yield record
+
+
+def read_records(path, fmt=None):
+    fmt = fmt or detect_format(path)
+    if fmt == "csv":
+        return iter_csv(path)
+    if fmt == "json":
+        return iter_json(path)
+    raise ValueError(f"unknown import format {fmt!r}")
+
+
+def normalize(records, kind):
+    """Renames each record's columns to our field names; missing fields are None."""
+    aliases = FIELDS[kind]
+    mappings = {}
+    for record in records:
+        keys = tuple(record)
+        mapping = mappings.get(keys)
+        if mapping is None:
+            lower = {str(key).strip().lower(): key for key in keys}
+            mapping = mappings[keys] = [
+                (field, next((lower[name] for name in names if name in lower), None))
+                for field, names in aliases.items()]
+        yield {field: record.get(key) if key is not None else None for field, key in mapping}
+
+
+def chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _text(value):
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def _number(value, default=0.0):
+    text = _text(value)
+    return float(text) if text else default
+
+
+def _day(value):
+    text = _text(value)[:10]
+    return date.fromisoformat(text).isoformat() if text else None
+
+
+def meal_rows(records, profile_id, index):
+    """Turns one chunk of meal records into INSERT_RECIPE_ROW parameters.
+
+    Ingredients without macros in the file are resolved against the
+    nutrition table in one batch. Only exact (case-insensitive) names are
+    taken; anything else counts as unresolved rather than importing the
+    macros of whatever food ranks first. Returns (rows, skipped, unresolved).
+    """
+    rows, lookups, skipped = [], [], 0
+    for record in records:
+        try:
+            day = _day(record["date"])
+            recipe, ingredient = _text(record["recipe_name"]), _text(record["ingredient"])
+            if not (day and recipe and ingredient):
+                raise ValueError("missing field")
+            if _text(record["calories"]):
+                rows.append((recipe, ingredient, _number(record["calories"]), _number(record["protein"]),
+                             _number(record["carbs"]), _number(record["fat"]), day, profile_id))
+            else:
+                lookups.append((recipe, ingredient, _number(record["quantity"], 1.0), day))
+        except (TypeError, ValueError):
+            skipped += 1
+    if not lookups:
+        return rows, skipped, 0
+    found = index.resolve([ingredient for _, ingredient, _, _ in lookups])
+    hits = found >= 0
+    quantities = np.fromiter((qty for _, _, qty, _ in lookups), dtype=np.float64, count=len(lookups))
+    macros = np.asarray(index.macros)[found[hits]] * quantities[hits, None]
+    for (recipe, _, _, day), row, values in zip(itertools.compress(lookups, hits), found[hits], macros.tolist()):
+        rows.append((recipe, index.names[row], *values, day, profile_id))
+    return rows, skipped, int((~hits).sum())
+
+
+def workout_rows(records, profile_id, index=None):
+    """Turns one chunk of workout records into INSERT_WORKOUT_ROW parameters; returns (rows, skipped, 0)."""
+    rows, skipped = [], 0
+    for record in records:
+        try:
+            day = _day(record["date"])
+            workout, exercise = _text(record["workout_name"]), _text(record["exercise_name"])
+            if not (day and workout and exercise):
+                raise ValueError("missing field")
+            rows.append((workout, exercise, int(_number(record["sets"])), int(_number(record["reps"])),
+                         _number(record["weight"]), day, profile_id))
+        except (TypeError, ValueError):
+            skipped += 1
+    return rows, skipped, 0
+
+
+BUILD_ROWS = {MEALS: (meal_rows, INSERT_RECIPE_ROW), WORKOUTS: (workout_rows, INSERT_WORKOUT_ROW)}
+
+
+def import_progress(kind, path, profile_id, key=None):
+    """(rows already imported, finished) for an export, or (0, False) if it was never imported.
+
+    ``key`` is the export's ``fingerprint`` when the caller already has it.
+    """
+    row = get_connection(TARGET_DB[kind]).execute(
+        "SELECT rows_done, finished FROM import_progress WHERE fingerprint = ? AND profile_id = ?",
+        (key or fingerprint(path), profile_id)).fetchone()
+    return (row[0], bool(row[1])) if row else (0, False)
+
+
+def import_file(path, kind, profile_id, fmt=None, chunk_size=CHUNK_SIZE, restart=False, table=None, progress=None):
+    """Imports a meal or workout export into a profile's history.
+
+    Resumes after the last committed chunk of an earlier run of the same
+    file, and does nothing if that run finished; ``restart`` starts from the
+    first row again (rows already imported are then imported twice).
+    ``progress`` is called with the running stats after every chunk.
+    Returns the stats: rows read this run, imported, skipped and unresolved
+    rows, the row it resumed from, seconds and rows per second.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"unknown import kind {kind!r}")
+    if get_connection("entries.db").execute("SELECT 1 FROM entries WHERE id = ?", (profile_id,)).fetchone() is None:
+        raise ValueError(f"no profile with id {profile_id}")
+    build_rows, insert = BUILD_ROWS[kind]
+    if kind == MEALS and table is None:
+        from nutrition_table import get_nutrition_table
+        table = get_nutrition_table()
+    index = table.index if table is not None else None
+
+    key = fingerprint(path)
+    source = os.path.abspath(path)
+    done, finished = (0, False) if restart else import_progress(kind, path, profile_id, key)
+    stats = {"rows": 0, "imported": 0, "skipped": 0, "unresolved": 0, "resumed_from": done,
+             "finished": finished, "seconds": 0.0, "rows_per_sec": 0.0}
+    if finished:
+        return stats
+
+    conn = get_connection(TARGET_DB[kind])
+    start = time.perf_counter()
+    records = normalize(itertools.islice(read_records(path, fmt), done, None), kind)
+    for chunk in chunks(records, chunk_size):
+        rows, skipped, unresolved = build_rows(chunk, profile_id, index)
+        done += len(chunk)
+        with conn:
+            conn.executemany(insert, rows)
+            conn.execute(UPSERT_PROGRESS, (key, profile_id, source, done, 0, time.time()))
+        stats["rows"] += len(chunk)
+        stats["imported"] += len(rows)
+        stats["skipped"] += skipped
+        stats["unresolved"] += unresolved
+        stats["seconds"] = time.perf_counter() - start
+        stats["rows_per_sec"] = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+        if progress is not None:
+            progress(stats)
+    with conn:
+        conn.execute(UPSERT_PROGRESS, (key, profile_id, source, done, 1, time.time()))
+    stats["finished"] = True
+    stats["seconds"] = time.perf_counter() - start
+    stats["rows_per_sec"] = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
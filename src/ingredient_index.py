@@ -0,0 +1,187 @@
+import numpy as np
+
+MACRO_COLUMNS = ("Calories", "Protein", "Carbs", "Fat")
+MACRO_KEYS = ("cal", "prot", "carbs", "fat")
+
+# Candidate lists shorter than this are verified directly instead of being
+# intersected with the remaining trigram posting lists.
+VERIFY_THRESHOLD = 256
+
+
+def clean_name(name):
+    return str(name).replace('"', '').strip()
+
+
+def trigram_codes(codes):
+    """Packs each run of three code points into one int64 key (21 bits each)."""
+    return (codes[:-2] << 42) | (codes[1:-1] << 21) | codes[2:]
+
+
+def gram_codes(codes, n):
+    """Packs each run of ``n`` (1 to 3) code points into one int64 key."""
+    if n == 3:
+        return trigram_codes(codes)
+    if n == 2:
+        return (codes[:-1] << 21) | codes[1:]
+    return codes
+
+
+def text_codes(text):
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+
+
+class IngredientIndex:
+    """Substring index over the nutrition table, built once per table.
+
+    Names are normalized up front, every trigram maps to a sorted posting list
+    of row numbers and the macros live in one contiguous (n, 4) float array,
+    so a lookup never touches pandas. Queries of one or two characters use
+    unigram and bigram posting lists instead; they are built with the
+    trigrams, or on the first short query when loaded without them.
+    """
+
+    def __init__(self, names, macros, trigrams=None, short_grams=None):
+        self.names = [clean_name(n) for n in names]
+        self.keys = [n.lower() for n in self.names]
+        self.macros = np.ascontiguousarray(macros, dtype=np.float64).reshape(len(self.names), len(MACRO_KEYS))
+        self._sorted_keys = None
+        self._short = dict(short_grams or {})
+        if trigrams is None:
+            self._build_trigrams()
+            self._short = {size: self._build_postings(size) for size in (1, 2)}
+        else:
+            self._grams, self._offsets, self._postings = trigrams
+
+    @classmethod
+    def from_dataframe(cls, df):
+        return cls(df["Ingredient"].tolist(), df[list(MACRO_COLUMNS)].to_numpy(dtype=np.float64))
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def trigrams(self):
+        """(grams, offsets, postings) arrays, enough to rebuild the index without rescanning names."""
+        return self._grams, self._offsets, self._postings
+
+    @property
+    def short_grams(self):
+        """{1: unigram table, 2: bigram table}, each (grams, offsets, postings) like ``trigrams``."""
+        for size in (1, 2):
+            if size not in self._short:
+                self._short[size] = self._build_postings(size)
+        return self._short
+
+    def _build_trigrams(self):
+        self._grams, self._offsets, self._postings = self._build_postings(3)
+
+    def _build_postings(self, size):
+        """(grams, offsets, postings) for every run of ``size`` characters."""
+        n = len(self.keys)
+        lengths = np.fromiter((len(k) for k in self.keys), dtype=np.int64, count=n)
+        # "\0" separates names so no gram spans two rows.
+        codes = text_codes("\0".join(self.keys) + "\0")
+        rows = np.repeat(np.arange(n, dtype=np.int64), lengths + 1)
+        if len(codes) < size:
+            return np.empty(0, dtype=np.int64), np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int32)
+        valid = np.ones(len(codes) - size + 1, dtype=bool)
+        for shift in range(size):
+            valid &= codes[shift:len(codes) - size + 1 + shift] != 0
+        grams = gram_codes(codes, size)[valid]
+        gram_rows = rows[:len(codes) - size + 1][valid]
+
+        row_bits = max(1, n.bit_length())
+        if 21 * size + row_bits <= 63:
+            # Gram and row fit in one int64, so a single sort orders and dedupes both.
+            packed = np.sort((grams << row_bits) | gram_rows)
+            packed = packed[np.concatenate(([True], packed[1:] != packed[:-1]))]
+            grams, gram_rows = packed >> row_bits, packed & ((1 << row_bits) - 1)
+        else:
+            order = np.lexsort((gram_rows, grams))
+            grams = grams[order]
+            gram_rows = gram_rows[order]
+            keep = np.ones(len(grams), dtype=bool)
+            keep[1:] = (grams[1:] != grams[:-1]) | (gram_rows[1:] != gram_rows[:-1])
+            grams, gram_rows = grams[keep], gram_rows[keep]
+
+        starts = np.flatnonzero(np.concatenate(([True], grams[1:] != grams[:-1])))
+        return grams[starts], np.append(starts, len(grams)).astype(np.int64), gram_rows.astype(np.int32)
+
+    def _posting(self, gram, table=None):
+        grams, offsets, postings = table or self.trigrams
+        pos = np.searchsorted(grams, gram)
+        if pos >= len(grams) or grams[pos] != gram:
+            return None
+        return postings[offsets[pos]:offsets[pos + 1]]
+
+    def _verify(self, candidates, query, limit):
+        hits = []
+        keys = self.keys
+        for i in candidates:
+            if query in keys[i]:
+                hits.append(int(i))
+                if limit is not None and len(hits) >= limit:
+                    break
+        return hits
+
+    def search(self, text, limit=1):
+        """Returns row numbers whose name contains ``text``, in table order."""
+        query = text.strip().lower()
+        if not query:
+            return []
+        if len(query) < 3:
+            # Every row in a unigram or bigram posting list contains the whole query.
+            table = self._short.get(len(query))
+            if table is None:
+                table = self._short[len(query)] = self._build_postings(len(query))
+            posting = self._posting(gram_codes(text_codes(query), len(query))[0], table)
+            if posting is None:
+                return []
+            return posting[:limit].tolist() if limit is not None else posting.tolist()
+        postings = []
+        for gram in np.unique(trigram_codes(text_codes(query))):
+            posting = self._posting(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = postings[0]
+        for other in postings[1:]:
+            if len(candidates) <= VERIFY_THRESHOLD:
+                break
+            candidates = candidates[np.isin(candidates, other, assume_unique=True)]
+        return self._verify(candidates, query, limit)
+
+    def find(self, text):
+        """Returns (name, macros) for the first match, or None."""
+        hits = self.search(text, limit=1)
+        if not hits:
+            return None
+        return self.names[hits[0]], self.macros_for(hits[0])
+
+    def resolve(self, names):
+        """Row numbers for a batch of names, -1 where no name matches exactly.
+
+        Names are compared case-insensitively with one vectorized binary
+        search over the sorted keys. There is no fuzzy fallback, so a bulk
+        import never takes the macros of a merely similar food.
+        """
+        if self._sorted_keys is None:
+            keys = np.array(self.keys, dtype=str) if self.keys else np.empty(0, dtype="<U1")
+            order = np.argsort(keys, kind="stable")
+            self._sorted_keys = (keys[order], order)
+        sorted_keys, order = self._sorted_keys
+        query = np.char.lower(np.char.strip(np.char.replace(np.asarray(names, dtype=str), '"', '')))
+        rows = np.full(len(query), -1, dtype=np.int64)
+        if len(sorted_keys) and len(query):
+            pos = np.minimum(np.searchsorted(sorted_keys, query), len(sorted_keys) - 1)
+            exact = sorted_keys[pos] == query
+            rows[exact] = order[pos[exact]]
+        return rows
+
+    def macros_for(self, row):
+        values = self.macros[row]
+        return {key: float(values[i]) for i, key in enumerate(MACRO_KEYS)}
+
+    def completions(self, text, limit=50):
+        return list(dict.fromkeys(self.names[i] for i in self.search(text, limit=limit)))
@@ -1,24 +1,34 @@
 from PyQt6.QtWidgets import QApplication, QLabel, QWidget, QVBoxLayout
 from PyQt6.QtCore import pyqtProperty, QPropertyAnimation, QEasingCurve, QObject
-from PyQt6.QtGui import QColor
+from PyQt6.QtGui import QColor, QPainter
 import sys
+from animation_clock import reduced_motion
 
 class ColorLabel(QLabel):
     def __init__(self, text):
         super().__init__(text)
         self._color = QColor(255, 0, 0) # Start Red
-        self.setStyleSheet(f"font-size: 30px; font-weight: bold; color: {self._color.name()}")
+        font = self.font()
+        font.setPixelSize(30)
+        font.setBold(True)
+        self.setFont(font)
 
     # 1. Define a 'getter'
     @pyqtProperty(QColor)
     def color(self):
         return self._color
 
-    # 2. Define a 'setter' that updates the style
+    # 2. Define a 'setter' that only repaints (no stylesheet re-parse per frame)
     @color.setter
     def color(self, value):
         self._color = value
-        self.setStyleSheet(f"font-size: 30px; font-weight: bold; color: {self._color.name()}")
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setPen(self._color)
+        painter.setFont(self.font())
+        painter.drawText(self.contentsRect(), int(self.alignment().value), self.text())
 
 class Window(QWidget):
     def __init__(self):
@@ -34,7 +44,10 @@ class Window(QWidget):
         self.anim.setStartValue(QColor(255, 0, 0))   # Red
         self.anim.setEndValue(QColor(0, 0, 255))     # Blue
         self.anim.setLoopCount(-1) # Loop forever
-        self.anim.start()
+        if reduced_motion():
+            self.label.color = QColor(0, 0, 255)
+        else:
+            self.anim.start()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -1,27 +1,36 @@
-from PyQt6.QtWidgets import QMainWindow, QCompleter, QVBoxLayout, QButtonGroup, QLabel, QMessageBox
-from PyQt6 import uic
+from PyQt6.QtWidgets import QMainWindow, QVBoxLayout, QButtonGroup, QListView, QMessageBox, QAbstractItemView, QFrame
 from PyQt6.QtCore import Qt, QDate
-import pandas as pd
+from PyQt6 import sip
 import sqlite3
-import os
 from datetime import date
 
-from ui_components import HoverButton
-from widgets import IngredientAdd, WorkoutAdd
-from scanner import Scanner
-from workout_display import DisplayWorkout
-from existing_recipes import RecipeLoad
-from stopwatch import Stopwatch
-from utils import resource_path,get_db_path
+from ui_components import HoverButton, DashboardListModel, DashboardItemDelegate
+from widgets import IngredientAdd, WorkoutAdd, IngredientCompleter
+from nutrition_table import get_nutrition_table
+from ui_cache import load_ui
+from db import get_connection
+from store import save_recipe_rows, daily_totals, INSERT_WORKOUT_ROW
 
 
 class MainWindow(QMainWindow):
+    _shared = None
+
+    @classmethod
+    def shared(cls, profile_id):
+        """The app's one dashboard window, switched to ``profile_id``; built on first use."""
+        window = cls._shared
+        if window is None or sip.isdeleted(window):
+            window = cls._shared = cls(profile_id)
+        else:
+            window.set_profile(profile_id)
+        return window
+
     def __init__(self, profile_id):
         super().__init__()
-        uic.loadUi(resource_path("Main.ui"), self)
+        load_ui("Main.ui", self)
         self.setGeometry(300,0,890,1000)
-        self.df = pd.read_csv(resource_path("cleaned_indian_food_nutrition.csv"))
-        ingredients = self.df['Ingredient']
+        self.nutrition = get_nutrition_table()
+        self.index = self.nutrition.index
         self.active_profile_id = profile_id
 
         self.daily_cal_goal = 0 
@@ -29,9 +38,8 @@ class MainWindow(QMainWindow):
         self.daily_carb_goal = 0 
         self.daily_fat_goal = 0
 
-        self.completer = QCompleter(set(ingredients))
+        self.completer = IngredientCompleter(self.index, self)
         self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self.completer.setFilterMode(Qt.MatchFlag.MatchContains)
         self.meditation_btn.clicked.connect(self.open_meditation)
         popup = self.completer.popup()
         popup.setMinimumWidth(400)
@@ -70,12 +78,8 @@ class MainWindow(QMainWindow):
         #self.meditation_btn.setChecked(False)
         self.tabWidget.setCurrentIndex(0)
         self.tabWidget.tabBar().hide()
-        self.today = QDate.currentDate()
-        self.date_text = self.today.toString("dddd, MMMM d, yyyy")
         self.day_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.prog_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        if hasattr(self, "day_lbl"):
-            self.day_lbl.setText(self.date_text)
         self.cal_counter.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.prot_counter.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.carbs_counter.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -131,10 +135,8 @@ class MainWindow(QMainWindow):
         recipe_t.hide()
         self.recipe_t.show()
         #self.show_recipe_btn.clicked.connect(self.show_recipes)
-        self.load_profile()
         self.recipe_t.clicked.connect(self.show_recipes)
         self.exercise_rows = []
-        self.workout_db()
         self.muscle_groups = {"Chest": [
     "• Bench Press",
     "• Incline Dumbbell Press",
@@ -262,6 +264,9 @@ class MainWindow(QMainWindow):
             self.workouts_layout.setSpacing(10)
         else:
             self.workouts_layout = self.workouts_container.layout()
+        self.dashboard_delegate = DashboardItemDelegate(self)
+        self.workouts_model = DashboardListModel("No workouts logged in today", self)
+        self.workouts_layout.addWidget(self.dashboard_view(self.workouts_model))
         self.workouts_scroll.setWidgetResizable(True)
         self.scrollAreaWidgetContents.setMinimumHeight(1160)
         self.workouts_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -290,6 +295,12 @@ class MainWindow(QMainWindow):
         self.save_workout_button.clicked.connect(self.save_workout)
 
         self.meals_layout = self.scroll_contents.layout()
+        for i in reversed(range(self.meal_log.count())):
+            item = self.meal_log.takeAt(i)
+            if item.widget() is not None:
+                item.widget().setParent(None)
+        self.meals_model = DashboardListModel("No recipes logged today", self)
+        self.meal_log.addWidget(self.dashboard_view(self.meals_model))
 
 
         view_workouts_button = self.view_workouts_button
@@ -302,16 +313,7 @@ class MainWindow(QMainWindow):
         view_workouts_button.hide()
         self.view_workouts_button.show()
         self.view_workouts_button.clicked.connect(self.display_workout)
-        
-        self.init_recipe_db()
-        self.workout_db()
-        
-        self.load_profile()
-        self.load_todays_workouts()
-        self.load_today_meals()
-        #self.update_totals()
-        self.load_profile_items()
-                
+
         delete_profile_btn = self.delete_profile_btn
         self.delete_profile_btn = HoverButton(delete_profile_btn.text(), delete_profile_btn.parent())
         self.delete_profile_btn.setGeometry(delete_profile_btn.geometry())
@@ -322,52 +324,55 @@ class MainWindow(QMainWindow):
         delete_profile_btn.hide()
         self.delete_profile_btn.show()
         self.delete_profile_btn.clicked.connect(self.delete_profile)
-    
+        self.set_profile(profile_id)
+
+    def dashboard_view(self, model):
+        view = QListView()
+        view.setModel(model)
+        view.setItemDelegate(self.dashboard_delegate)
+        view.setUniformItemSizes(True)
+        view.setSpacing(5)
+        view.setFrameShape(QFrame.Shape.NoFrame)
+        view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        view.setStyleSheet("QListView{background-color:transparent; border:none;}")
+        return view
+
+    def set_profile(self, profile_id):
+        """Shows ``profile_id`` in this window, reloading only the profile's own data.
+
+        Unsaved ingredient and exercise rows are dropped, and recipe or workout
+        history windows opened for another profile are closed.
+        """
+        self.active_profile_id = profile_id
+        for child in (getattr(self, "window", None), getattr(self, "work_diplay", None)):
+            if getattr(child, "profile_id", profile_id) != profile_id:
+                child.close()
+        for row in self.rows:
+            self.ingredients_layout.removeWidget(row)
+            row.deleteLater()
+        self.rows = []
+        self.clear_exercise_rows()
+        self.search_bar.clear()
+        self.recipe_name_input.clear()
+        self.workout_group_input.clear()
+        for label in (self.name_lbl, self.age_lbl, self.goal_lbl, self.weight_lbl, self.height_lbl):
+            label.clear()
+        self.daily_cal_goal = self.daily_prot_goal = self.daily_carb_goal = self.daily_fat_goal = 0
+        self.today = QDate.currentDate()
+        self.date_text = self.today.toString("dddd, MMMM d, yyyy")
+        self.day_lbl.setText(self.date_text)
+        self.dashboard_btn.setChecked(True)
+        self.tabWidget.setCurrentIndex(0)
+        self.load_profile()
+        self.load_todays_workouts()
+        self.load_today_meals()
+
     def open_meditation(self):
+        from stopwatch import Stopwatch
         self.window = Stopwatch()
         self.window.show()
 
-    def init_recipe_db(self):
-        """Initializes the recipe database table."""
-        conn = sqlite3.connect(get_db_path("recipes.db"))
-        curr = conn.cursor()
-        curr.execute("""
-            CREATE TABLE IF NOT EXISTS recipe_ingredients (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                profile_id INTEGER,
-                recipe_name TEXT,
-                ingredient TEXT,
-                calories REAL,
-                protein REAL,
-                carbs REAL,
-                fat REAL,
-                date TEXT DEFAULT (DATE('now'))
-           )
-        """)
-        conn.commit()
-        conn.close()
-        conn = sqlite3.connect(get_db_path("entries.db"))
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                           CREATE TABLE IF NOT EXISTS entries(
-                                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                                name TEXT,
-                                age INTEGER,
-                                weight INTEGER,
-                                goal_weight INTEGER,
-                                height INTEGER,
-                                cal_goal INTEGER,
-                                prot_goal INTEGER,
-                                carb_goal INTEGER,
-                                fat_goal INTEGER)
-                           """)
-            conn.commit()
-        except sqlite3.Error as e:
-            print(e)
-        finally:
-            conn.close()
-
     def counters(self):
         self.rows = []
         self.calories = 0
@@ -379,24 +384,12 @@ class MainWindow(QMainWindow):
         name = self.search_bar.text().strip().lower()
         if name == "":
             return
-        self.df["Ingredient_clean"] = (
-            self.df["Ingredient"]
-            .str.replace('"', '', regex=False)
-            .str.strip()
-            .str.lower()
-        )
-        data = self.df[self.df["Ingredient_clean"].str.contains(name, regex=False)]
-        if data.empty:
+        match = self.index.find(name)
+        if match is None:
             print("Ingredient not found")
             return
-        row = data.iloc[0]
-        macros = {
-            "cal": float(row["Calories"]),
-            "prot": float(row["Protein"]),
-            "carbs": float(row["Carbs"]),
-            "fat": float(row["Fat"])
-        }
-        self.add_ingr(row["Ingredient"].replace('"', '').strip(), macros)
+        ingredient_name, macros = match
+        self.add_ingr(ingredient_name, macros)
         self.search_bar.clear()
 
 
@@ -445,15 +438,21 @@ class MainWindow(QMainWindow):
         if recipe_name == "":
             QMessageBox.warning(self, "Error", "Enter recipe name")
             return
+        recipe_rows = []
         for row in self.rows:
             macros = row.macros
             qty = row.qty.value()
-            self.save_to_db(recipe_name, row.name,{
+            recipe_rows.append((row.name, {
                 "cal": float(macros["cal"])*qty,
                 "prot": float(macros["prot"])*qty,
                 "carbs": float(macros["carbs"])*qty,
                 "fat": float(macros["fat"])*qty
-            })
+            }))
+        try:
+            save_recipe_rows(self.active_profile_id, recipe_name, recipe_rows)
+        except sqlite3.Error as e:
+            QMessageBox.warning(self, "Error", f"Could not save recipe: {e}")
+            return
         self.load_today_meals()
         print("Recipe saved")
     
@@ -492,79 +491,23 @@ class MainWindow(QMainWindow):
             self.left_fat.setText(f"FATS LEFT: {rem_fat:.1f}g")
 
     def save_to_db(self,recipe_name,name,macros):
-        conn = sqlite3.connect(get_db_path("recipes.db"))
-        curr = conn.cursor()
-        curr.execute("""
-            INSERT INTO recipe_ingredients
-                      (recipe_name, ingredient, calories, protein, carbs, fat, date, profile_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (recipe_name,
-             name,
-             macros["cal"], macros["prot"], macros["carbs"], macros["fat"], date.today().isoformat(), self.active_profile_id)
-             )
-        conn.commit()
-        conn.close()
+        save_recipe_rows(self.active_profile_id, recipe_name, [(name, macros)])
 
     def load_recipe(self, recipe_name):
-        conn = sqlite3.connect(get_db_path("recipes.db"))
-        curr = conn.cursor()
+        curr = get_connection("recipes.db").cursor()
         curr.execute("SELECT ingredient, calories, protein, carbs, fat FROM recipe_ingredients WHERE recipe_name=?", (recipe_name,))
-        rows = curr.fetchall()
-        conn.close()
-        return rows 
+        return curr.fetchall()
     
     def load_today_meals(self):
-        layout = self.meal_log
-        for i in reversed(range(layout.count())):
-            item = layout.itemAt(i)
-            widget = item.widget()
-            if widget is not None:
-                widget.setParent(None)
-            else:
-                layout.removeItem(item)
-        conn = sqlite3.connect(get_db_path("recipes.db"))
-        curr = conn.cursor()
+        curr = get_connection("recipes.db").cursor()
         today = date.today().isoformat()
         curr.execute("""
             SELECT DISTINCT recipe_name 
             FROM recipe_ingredients 
             WHERE date = ? AND profile_id = ?
         """, (today, self.active_profile_id))
-        recipes = curr.fetchall()
-        if not recipes:
-            placeholder = QLabel("No recipes logged today")
-            placeholder.setStyleSheet("font-size: 18px; padding: 6px; color: gray;")
-            layout.addWidget(placeholder)
-        else:
-            for recipe in recipes:
-                name = recipe[0]
-                label = QLabel(name)
-                label.setStyleSheet("""
-                    QWidget{
-                font: 400 20px "Epilogue";
-                color:#1d1d1d;
-                border-radius:10px;
-                background-color:rgb(242, 242, 242);
-                border:1px solid #c0c0c0
-                }
-                """)
-                layout.addWidget(label)
-        curr.execute("""
-            SELECT SUM(calories), SUM(protein), SUM(carbs), SUM(fat)
-            FROM recipe_ingredients
-            WHERE date = ? AND profile_id = ?
-        """, (today, self.active_profile_id))
-        row = curr.fetchone()
-        conn.close()
-        cal_sum = row[0] if row[0] is not None else 0
-        prot_sum = row[1] if row[1] is not None else 0
-        carb_sum = row[2] if row[2] is not None else 0
-        fat_sum = row[3] if row[3] is not None else 0
-        self.total_cal = cal_sum
-        self.total_prot = prot_sum
-        self.total_carbs = carb_sum
-        self.total_fat = fat_sum
+        self.meals_model.set_items(name for (name,) in curr.fetchall())
+        self.total_cal, self.total_prot, self.total_carbs, self.total_fat = daily_totals(self.active_profile_id, today)
         self.cal_counter.setText(f"{self.total_cal:.0f} kcal")
         self.prot_counter.setText(f"{self.total_prot:.1f} g")
         self.carbs_counter.setText(f"{self.total_carbs:.1f} g")
@@ -582,93 +525,36 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'left_fat'):
             self.left_fat.setText(f"FATS LEFT: {rem_fat:.1f}g")
 
-    def workout_db(self):
-        print("USING DB:", os.path.abspath("workout_data.db"))
-        conn = sqlite3.connect(get_db_path("workout_data.db"))
-        cursor = conn.cursor()
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS workouts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            profile_id INTEGER,
-            workout_name TEXT,
-            exercise_name TEXT,
-            sets INTEGER,    
-            reps INTEGER,
-            weight REAL,
-            cal_goal INTEGER,
-            prot_goal INTEGER,
-            fat_goal INTEGER,
-            carb_goal INTEGER,
-            date TEXT
-        )
-    """)
-        conn.commit()
-        conn.close()
-
     def load_todays_workouts(self):
-        layout = self.workouts_layout
-        for i in reversed(range(layout.count())):
-            item = layout.itemAt(i)
-            widget = item.widget()
-            if widget:
-                widget.setParent(None)
-            else:
-                layout.removeItem(item)
-        conn = sqlite3.connect(get_db_path("workout_data.db"))
-        curr = conn.cursor()
+        curr = get_connection("workout_data.db").cursor()
         today = date.today().isoformat()
         curr.execute("SELECT DISTINCT workout_name FROM workouts WHERE date=? AND profile_id=? ", (today,self.active_profile_id))
-        workouts = curr.fetchall()
-        conn.close()
-        if not workouts:
-            placeholder = QLabel("No workouts logged in today")
-            placeholder.setStyleSheet("font:400 18px 'Epilogue'; padding:6px; color:#1d1d1d")
-            layout.addWidget(placeholder)
-            return
-        for w in workouts:
-            label = QLabel(w[0])    
-            label.setStyleSheet("""
-            font: 400 20px "Epilogue";
-            color:#1d1d1d;
-            border-radius:10px;
-            background-color:rgb(242, 242, 242);
-            border:1px solid #c0c0c0;
-            padding: 6px;
-        """)
-            layout.addWidget(label)
+        self.workouts_model.set_items(name for (name,) in curr.fetchall())
 
     def load_profile(self):
         try:
-            connection = sqlite3.connect(get_db_path("entries.db"))
-            if connection:
-                cursor = connection.cursor()
-                cursor.execute("""SELECT name, age, goal_weight, weight, height,
-                                cal_goal, prot_goal, carb_goal, fat_goal
-                                FROM entries where id=?""", 
-                                (self.active_profile_id,))
-                row = cursor.fetchone()
-                if not row:
-                    print("No profile found, returning without inserting.")
-                    return
-                connection.close()
-                if row:
-                    name, age, goal_weight, weight, height, c_goal, p_goal, cb_goal, f_goal = row
-                    self.name_lbl.setText(f"{name}")
-                    self.age_lbl.setText(f"{age}")
-                    self.goal_lbl.setText(f"{goal_weight}")
-                    self.weight_lbl.setText(f"{weight}")
-                    self.height_lbl.setText(f"{height}")
-
-                    self.daily_cal_goal = c_goal if c_goal else 0 
-                    self.daily_prot_goal = p_goal if p_goal else 0 
-                    self.daily_carb_goal = cb_goal if cb_goal else 0 
-                    self. daily_fat_goal = f_goal if f_goal else 0
-            else:
-                print("problem w connection")
+            cursor = get_connection("entries.db").cursor()
+            cursor.execute("""SELECT name, age, goal_weight, weight, height,
+                            cal_goal, prot_goal, carb_goal, fat_goal
+                            FROM entries where id=?""", 
+                            (self.active_profile_id,))
+            row = cursor.fetchone()
+            if not row:
+                print("No profile found, returning without inserting.")
+                return
+            name, age, goal_weight, weight, height, c_goal, p_goal, cb_goal, f_goal = row
+            self.name_lbl.setText(f"{name}")
+            self.age_lbl.setText(f"{age}")
+            self.goal_lbl.setText(f"{goal_weight}")
+            self.weight_lbl.setText(f"{weight}")
+            self.height_lbl.setText(f"{height}")
+
+            self.daily_cal_goal = c_goal if c_goal else 0 
+            self.daily_prot_goal = p_goal if p_goal else 0 
+            self.daily_carb_goal = cb_goal if cb_goal else 0 
+            self. daily_fat_goal = f_goal if f_goal else 0
         except sqlite3.Error as e:
             print("DB Error is:", e)
-        finally:
-            connection.close()
         
     def load_exercises_for_muscle(self, muscle):
         self.exercise_list.clear()
@@ -692,44 +578,48 @@ class MainWindow(QMainWindow):
         self.exercise_rows.remove(row)
         row.deleteLater()
 
+    def clear_exercise_rows(self):
+        for row in self.exercise_rows:
+            self.workouts_layout.removeWidget(row)
+            row.deleteLater()
+        self.exercise_rows = []
+
     def save_workout(self):
         workout_group = self.workout_group_input.text().strip()
         if workout_group == "":
             QMessageBox.warning(self, "Error", "Enter workout group name")
             return
-        connection = sqlite3.connect(get_db_path("workout_data.db"))
-        cursor = connection.cursor()
-        for row in self.exercise_rows:
-            sets_val = row.sets_input.value()
-            reps_val = row.reps_input.value()
-            weight_val = row.weight_input.value()
-            cursor.execute("""
-                INSERT INTO workouts (workout_name, exercise_name, sets, reps, weight, date, profile_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (workout_group, row.exercise_name, sets_val, reps_val , weight_val, date.today().isoformat(), self.active_profile_id))
-
-        connection.commit()
-        connection.close()
+        with get_connection("workout_data.db") as connection:
+            for row in self.exercise_rows:
+                sets_val = row.sets_input.value()
+                reps_val = row.reps_input.value()
+                weight_val = row.weight_input.value()
+                connection.execute(INSERT_WORKOUT_ROW,
+                (workout_group, row.exercise_name, sets_val, reps_val , weight_val, date.today().isoformat(), self.active_profile_id))
+
         QMessageBox.information(self, "Saved", "Workout saved!")
+        self.clear_exercise_rows()
         self.load_todays_workouts()
 
     def open_Scanner(self):
+        # cv2 and the Gemini client are only loaded once the scanner is first opened
+        from scanner import Scanner
         self.window = Scanner()
         self.window.show()
         self.hide()
 
     def display_workout(self):
+        from workout_display import DisplayWorkout
         self.work_diplay = DisplayWorkout(self.active_profile_id)
         self.work_diplay.show()
     
     def show_recipes(self):
+        from existing_recipes import RecipeLoad
         self.window = RecipeLoad(self.active_profile_id)
         self.window.show()
     
     def load_profile_items(self):
-        conn = sqlite3.connect(get_db_path("entries.db"))
-        curr = conn.cursor()
+        curr = get_connection("entries.db").cursor()
         curr.execute("""SELECT DISTINCT name, age, weight, goal_weight, height 
                      FROM entries WHERE id=?""",(self.active_profile_id,))
         rows = curr.fetchone()
@@ -747,16 +637,13 @@ class MainWindow(QMainWindow):
                                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                conn = sqlite3.connect(get_db_path("entries.db"))
-                curr = conn.cursor()
-                curr.execute("DELETE FROM entries WHERE id=?",(self.active_profile_id,))
-                conn.commit()
-                conn.close()
+                with get_connection("entries.db") as conn:
+                    conn.execute("DELETE FROM entries WHERE id=?",(self.active_profile_id,))
                 QMessageBox.information(self, "Deleted", "Profile removed successfully.")
                 
                 from auth import Profile 
 
-                self.window = Profile()
+                self.window = Profile.shared()
                 self.window.show()
                 self.close()
             except sqlite3.Error as e:
@@ -0,0 +1,252 @@
+"""Versioned schema for the app databases.
+
+Each database has an ordered list of migrations; migration N brings the file
+to ``PRAGMA user_version = N``. Append new steps to the end, never edit old ones.
+"""
+
+BACKFILL_DAILY_TOTALS = (
+    "DELETE FROM daily_totals",
+    """INSERT INTO daily_totals (profile_id, date, cal, prot, carbs, fat)
+       SELECT profile_id, date, IFNULL(SUM(calories), 0), IFNULL(SUM(protein), 0),
+              IFNULL(SUM(carbs), 0), IFNULL(SUM(fat), 0)
+       FROM recipe_ingredients
+       WHERE profile_id IS NOT NULL AND date IS NOT NULL
+       GROUP BY profile_id, date""",
+)
+
+BACKFILL_WORKOUT_CATALOG = (
+    "DELETE FROM workout_catalog",
+    """INSERT INTO workout_catalog (profile_id, workout_name, entries, last_date)
+       SELECT profile_id, workout_name, COUNT(*), MAX(date)
+       FROM workouts
+       WHERE profile_id IS NOT NULL AND workout_name IS NOT NULL
+       GROUP BY profile_id, workout_name""",
+)
+
+# Bulk imports commit this row in the same transaction as each chunk they write,
+# so an interrupted import resumes right after the last committed chunk.
+CREATE_IMPORT_PROGRESS = """CREATE TABLE IF NOT EXISTS import_progress (
+    fingerprint TEXT NOT NULL,
+    profile_id INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    rows_done INTEGER NOT NULL DEFAULT 0,
+    finished INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL,
+    PRIMARY KEY (fingerprint, profile_id)) WITHOUT ROWID"""
+
+MIGRATIONS = {
+    "entries.db": [
+        (
+            """CREATE TABLE IF NOT EXISTS entries(
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT,
+                age INTEGER,
+                weight INTEGER,
+                goal_weight INTEGER,
+                height INTEGER,
+                cal_goal INTEGER,
+                prot_goal INTEGER,
+                carb_goal INTEGER,
+                fat_goal INTEGER)""",
+        ),
+    ],
+    "recipes.db": [
+        (
+            """CREATE TABLE IF NOT EXISTS recipe_ingredients (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                profile_id INTEGER,
+                recipe_name TEXT,
+                ingredient TEXT,
+                calories REAL,
+                protein REAL,
+                carbs REAL,
+                fat REAL,
+                date TEXT DEFAULT (DATE('now')))""",
+        ),
+        (
+            # Dashboard: today's recipe names and macro sums per profile.
+            """CREATE INDEX IF NOT EXISTS idx_recipe_ingredients_profile_date
+               ON recipe_ingredients(profile_id, date, recipe_name, calories, protein, carbs, fat)""",
+            # Recipe history: recipes and their ingredients per profile.
+            """CREATE INDEX IF NOT EXISTS idx_recipe_ingredients_profile_recipe
+               ON recipe_ingredients(profile_id, recipe_name, ingredient)""",
+        ),
+        (
+            # One row of macro totals per profile and day, kept in sync by triggers
+            # so the dashboard never aggregates raw ingredient rows.
+            """CREATE TABLE IF NOT EXISTS daily_totals (
+                profile_id INTEGER NOT NULL,
+                date TEXT NOT NULL,
+                cal REAL NOT NULL DEFAULT 0,
+                prot REAL NOT NULL DEFAULT 0,
+                carbs REAL NOT NULL DEFAULT 0,
+                fat REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (profile_id, date)) WITHOUT ROWID""",
+            """CREATE TRIGGER IF NOT EXISTS trg_daily_totals_insert
+               AFTER INSERT ON recipe_ingredients
+               WHEN NEW.profile_id IS NOT NULL AND NEW.date IS NOT NULL
+               BEGIN
+                   INSERT INTO daily_totals (profile_id, date, cal, prot, carbs, fat)
+                   VALUES (NEW.profile_id, NEW.date, IFNULL(NEW.calories, 0), IFNULL(NEW.protein, 0),
+                           IFNULL(NEW.carbs, 0), IFNULL(NEW.fat, 0))
+                   ON CONFLICT (profile_id, date) DO UPDATE SET
+                       cal = cal + excluded.cal,
+                       prot = prot + excluded.prot,
+                       carbs = carbs + excluded.carbs,
+                       fat = fat + excluded.fat;
+               END""",
+            """CREATE TRIGGER IF NOT EXISTS trg_daily_totals_delete
+               AFTER DELETE ON recipe_ingredients
+               WHEN OLD.profile_id IS NOT NULL AND OLD.date IS NOT NULL
+               BEGIN
+                   UPDATE daily_totals SET
+                       cal = cal - IFNULL(OLD.calories, 0),
+                       prot = prot - IFNULL(OLD.protein, 0),
+                       carbs = carbs - IFNULL(OLD.carbs, 0),
+                       fat = fat - IFNULL(OLD.fat, 0)
+                   WHERE profile_id = OLD.profile_id AND date = OLD.date;
+               END""",
+            """CREATE TRIGGER IF NOT EXISTS trg_daily_totals_update
+               AFTER UPDATE OF profile_id, date, calories, protein, carbs, fat ON recipe_ingredients
+               BEGIN
+                   UPDATE daily_totals SET
+                       cal = cal - IFNULL(OLD.calories, 0),
+                       prot = prot - IFNULL(OLD.protein, 0),
+                       carbs = carbs - IFNULL(OLD.carbs, 0),
+                       fat = fat - IFNULL(OLD.fat, 0)
+                   WHERE profile_id = OLD.profile_id AND date = OLD.date;
+                   INSERT INTO daily_totals (profile_id, date, cal, prot, carbs, fat)
+                   SELECT NEW.profile_id, NEW.date, IFNULL(NEW.calories, 0), IFNULL(NEW.protein, 0),
+                          IFNULL(NEW.carbs, 0), IFNULL(NEW.fat, 0)
+                   WHERE NEW.profile_id IS NOT NULL AND NEW.date IS NOT NULL
+                   ON CONFLICT (profile_id, date) DO UPDATE SET
+                       cal = cal + excluded.cal,
+                       prot = prot + excluded.prot,
+                       carbs = carbs + excluded.carbs,
+                       fat = fat + excluded.fat;
+               END""",
+            *BACKFILL_DAILY_TOTALS,
+        ),
+        (
+            CREATE_IMPORT_PROGRESS,
+        ),
+    ],
+    "workout_data.db": [
+        (
+            """CREATE TABLE IF NOT EXISTS workouts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                profile_id INTEGER,
+                workout_name TEXT,
+                exercise_name TEXT,
+                sets INTEGER,
+                reps INTEGER,
+                weight REAL,
+                cal_goal INTEGER,
+                prot_goal INTEGER,
+                fat_goal INTEGER,
+                carb_goal INTEGER,
+                date TEXT)""",
+        ),
+        (
+            # Dashboard: today's workout names per profile.
+            """CREATE INDEX IF NOT EXISTS idx_workouts_profile_date
+               ON workouts(profile_id, date, workout_name)""",
+            # Workout history: every set logged under a workout name, newest first.
+            """CREATE INDEX IF NOT EXISTS idx_workouts_profile_name
+               ON workouts(profile_id, workout_name, date, exercise_name, sets, reps, weight)""",
+        ),
+        (
+            # Workout history pages newest first by (date, id); id is part of the key
+            # so a page cursor resumes inside a session without sorting.
+            "DROP INDEX IF EXISTS idx_workouts_profile_name",
+            """CREATE INDEX IF NOT EXISTS idx_workouts_profile_name_date_id
+               ON workouts(profile_id, workout_name, date, id, exercise_name, sets, reps, weight)""",
+            # The distinct workout names of each profile, kept in sync by triggers so
+            # the history window never scans logged sets to list them.
+            """CREATE TABLE IF NOT EXISTS workout_catalog (
+                profile_id INTEGER NOT NULL,
+                workout_name TEXT NOT NULL,
+                entries INTEGER NOT NULL DEFAULT 0,
+                last_date TEXT,
+                PRIMARY KEY (profile_id, workout_name)) WITHOUT ROWID""",
+            """CREATE TRIGGER IF NOT EXISTS trg_workout_catalog_insert
+               AFTER INSERT ON workouts
+               WHEN NEW.profile_id IS NOT NULL AND NEW.workout_name IS NOT NULL
+               BEGIN
+                   INSERT INTO workout_catalog (profile_id, workout_name, entries, last_date)
+                   VALUES (NEW.profile_id, NEW.workout_name, 1, NEW.date)
+                   ON CONFLICT (profile_id, workout_name) DO UPDATE SET
+                       entries = entries + 1,
+                       last_date = COALESCE(MAX(last_date, excluded.last_date), last_date, excluded.last_date);
+               END""",
+            """CREATE TRIGGER IF NOT EXISTS trg_workout_catalog_delete
+               AFTER DELETE ON workouts
+               WHEN OLD.profile_id IS NOT NULL AND OLD.workout_name IS NOT NULL
+               BEGIN
+                   UPDATE workout_catalog SET
+                       entries = entries - 1,
+                       last_date = (SELECT MAX(date) FROM workouts
+                                    WHERE profile_id = OLD.profile_id AND workout_name = OLD.workout_name)
+                   WHERE profile_id = OLD.profile_id AND workout_name = OLD.workout_name;
+                   DELETE FROM workout_catalog
+                   WHERE profile_id = OLD.profile_id AND workout_name = OLD.workout_name AND entries <= 0;
+               END""",
+            """CREATE TRIGGER IF NOT EXISTS trg_workout_catalog_update
+               AFTER UPDATE OF profile_id, workout_name, date ON workouts
+               BEGIN
+                   UPDATE workout_catalog SET
+                       entries = entries - 1,
+                       last_date = (SELECT MAX(date) FROM workouts
+                                    WHERE profile_id = OLD.profile_id AND workout_name = OLD.workout_name)
+                   WHERE profile_id = OLD.profile_id AND workout_name = OLD.workout_name;
+                   DELETE FROM workout_catalog
+                   WHERE profile_id = OLD.profile_id AND workout_name = OLD.workout_name AND entries <= 0;
+                   INSERT INTO workout_catalog (profile_id, workout_name, entries, last_date)
+                   SELECT NEW.profile_id, NEW.workout_name, 1, NEW.date
+                   WHERE NEW.profile_id IS NOT NULL AND NEW.workout_name IS NOT NULL
+                   ON CONFLICT (profile_id, workout_name) DO UPDATE SET
+                       entries = entries + 1,
+                       last_date = COALESCE(MAX(last_date, excluded.last_date), last_date, excluded.last_date);
+               END""",
+            *BACKFILL_WORKOUT_CATALOG,
+        ),
+        (
+            CREATE_IMPORT_PROGRESS,
+        ),
+    ],
+    "scan_cache.db": [
+        (
+            # Scanner answers keyed by a 64-bit perceptual hash of the scanned frame,
+            # stored as a signed integer.
+            """CREATE TABLE IF NOT EXISTS recognitions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                hash INTEGER NOT NULL,
+                text TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL)""",
+        ),
+    ],
+}
+
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn, db_filename, target=None):
+    """Applies every pending migration for ``db_filename``, one transaction each."""
+    steps = MIGRATIONS.get(db_filename, [])
+    target = len(steps) if target is None else target
+    version = schema_version(conn)
+    while version < target:
+        conn.execute("BEGIN")
+        try:
+            for statement in steps[version]:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version + 1}")
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+        version += 1
+    return version
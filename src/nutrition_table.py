@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+from ingredient_index import IngredientIndex, MACRO_COLUMNS, clean_name
+from utils import resource_path, get_db_path
+
+CSV_NAME = "cleaned_indian_food_nutrition.csv"
+CACHE_DIR_NAME = "nutrition_cache"
+CACHE_VERSION = 2
+MANIFEST = "manifest.json"
+# Files that make up one compiled table, all stored as .npy so they can be memory-mapped.
+NAMES_FILE = "names.npy"
+MACROS_FILE = "macros.npy"
+GRAMS_FILE = "grams.npy"
+OFFSETS_FILE = "offsets.npy"
+POSTINGS_FILE = "postings.npy"
+# Unigram and bigram tables for one- and two-character queries, per size.
+SHORT_FILES = {size: (f"grams{size}.npy", f"offsets{size}.npy", f"postings{size}.npy") for size in (1, 2)}
+INDEX_FILES = (NAMES_FILE, MACROS_FILE, GRAMS_FILE, OFFSETS_FILE, POSTINGS_FILE,
+               *(name for files in SHORT_FILES.values() for name in files))
+
+_shared = {}
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class NutritionTable:
+    """Ingredient names and macros loaded from the compiled binary cache."""
+
+    def __init__(self, names, macros, trigrams, short_grams=None):
+        self.names = names
+        self.macros = macros
+        self.index = IngredientIndex(names, macros, trigrams, short_grams)
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def open(cls, cache_dir):
+        """Maps a compiled cache directory into memory."""
+        def load(name):
+            return np.load(os.path.join(cache_dir, name), mmap_mode="r")
+
+        blob = load(NAMES_FILE)
+        names = blob.tobytes().decode("utf-8").split("\0") if len(blob) else []
+        trigrams = (load(GRAMS_FILE), load(OFFSETS_FILE), load(POSTINGS_FILE))
+        short_grams = {size: tuple(load(name) for name in files) for size, files in SHORT_FILES.items()}
+        return cls(names, load(MACROS_FILE), trigrams, short_grams)
+
+
+def _read_manifest(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, MANIFEST)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != CACHE_VERSION:
+        return None
+    if not all(os.path.exists(os.path.join(cache_dir, name)) for name in INDEX_FILES):
+        return None
+    return manifest
+
+
+def _write_manifest(cache_dir, manifest):
+    tmp_path = os.path.join(cache_dir, MANIFEST + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, os.path.join(cache_dir, MANIFEST))
+
+
+def compile_table(csv_path, cache_dir, digest=None):
+    """Parses the CSV once and writes names, macros and the n-gram index as .npy files."""
+    import pandas as pd
+
+    stat = os.stat(csv_path)
+    df = pd.read_csv(csv_path)
+    names = [clean_name(n) for n in df["Ingredient"].tolist()]
+    macros = df[list(MACRO_COLUMNS)].to_numpy(dtype=np.float64)
+    index = IngredientIndex(names, macros)
+    grams, offsets, postings = index.trigrams
+
+    tmp_dir = f"{cache_dir}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    blob = np.frombuffer("\0".join(names).encode("utf-8"), dtype=np.uint8)
+    np.save(os.path.join(tmp_dir, NAMES_FILE), blob)
+    np.save(os.path.join(tmp_dir, MACROS_FILE), np.ascontiguousarray(macros))
+    np.save(os.path.join(tmp_dir, GRAMS_FILE), grams)
+    np.save(os.path.join(tmp_dir, OFFSETS_FILE), offsets)
+    np.save(os.path.join(tmp_dir, POSTINGS_FILE), postings)
+    for size, files in SHORT_FILES.items():
+        for name, array in zip(files, index.short_grams[size]):
+            np.save(os.path.join(tmp_dir, name), array)
+    _write_manifest(tmp_dir, {
+        "version": CACHE_VERSION,
+        "source": os.path.abspath(csv_path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest or file_sha256(csv_path),
+        "rows": len(names),
+    })
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    os.replace(tmp_dir, cache_dir)
+
+
+def load_nutrition_table(csv_path=None, cache_dir=None):
+    """Loads the nutrition table, compiling the CSV only when it has changed.
+
+    An unchanged size and mtime reuse the cache straight away; otherwise the
+    CSV is hashed, and a matching hash (e.g. after a fresh checkout) only
+    refreshes the manifest instead of recompiling.
+    """
+    csv_path = csv_path or resource_path(CSV_NAME)
+    cache_dir = cache_dir or get_db_path(CACHE_DIR_NAME)
+    os.makedirs(os.path.dirname(os.path.abspath(cache_dir)), exist_ok=True)
+    stat = os.stat(csv_path)
+    manifest = _read_manifest(cache_dir)
+    if manifest is None or manifest["size"] != stat.st_size or manifest["mtime_ns"] != stat.st_mtime_ns:
+        digest = file_sha256(csv_path)
+        if manifest is not None and manifest["sha256"] == digest:
+            manifest.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            _write_manifest(cache_dir, manifest)
+        else:
+            compile_table(csv_path, cache_dir, digest)
+    return NutritionTable.open(cache_dir)
+
+
+def get_nutrition_table(csv_path=None):
+    """Returns the table shared by every window in this process."""
+    csv_path = os.path.abspath(csv_path or resource_path(CSV_NAME))
+    if csv_path not in _shared:
+        _shared[csv_path] = load_nutrition_table(csv_path)
+    return _shared[csv_path]
@@ -0,0 +1,268 @@
+import collections
+import itertools
+import re
+import threading
+import time
+
+import cv2
+from PyQt6.QtCore import QObject, Qt, QThreadPool, pyqtSignal
+
+PROMPT = ("Identify the food item and list only macros (calories, protein, carbs, fats) if possible. in the format: "
+          "The item is: item_name \n Calories: \n Protein: \n Carbs: \n Fats:")
+BATCH_PROMPT = ("You are given {count} photos, numbered 1 to {count} in the order they are attached. For each photo, "
+                "identify the food item and list only macros (calories, protein, carbs, fats) if possible. Start the "
+                "answer for photo N with a line 'Item N:' followed by the format: "
+                "The item is: item_name \n Calories: \n Protein: \n Carbs: \n Fats:")
+ITEM_HEADER = re.compile(r"^[\s*#>_]*item\s*(\d+)\s*[:.)][*_ \t]*", re.IGNORECASE | re.MULTILINE)
+DEFAULT_TIMEOUT = 30.0
+BATCH_SIZE = 5
+MAX_PENDING_FRAMES = 20
+REQUEST_THREADS = 4
+MAX_EDGE = 1024
+JPEG_QUALITY = 85
+MIN_JPEG_QUALITY = 40
+MAX_UPLOAD_BYTES = 150_000
+
+_request_pool = None
+
+
+def request_pool():
+    """Thread pool for model requests, sized for waiting on the network rather than for CPU cores."""
+    global _request_pool
+    if _request_pool is None:
+        _request_pool = QThreadPool()
+        _request_pool.setMaxThreadCount(REQUEST_THREADS)
+    return _request_pool
+
+
+def crop_to_subject(frame, min_fraction=0.05, margin=0.08):
+    """Crops ``frame`` to the bounding box of its largest edge contour, usually the plate.
+
+    Contours are found on a small grayscale copy so this stays cheap at 4K.
+    Returns the frame unchanged when nothing big enough stands out.
+    """
+    h, w = frame.shape[:2]
+    scale = min(1.0, 320 / max(h, w))
+    small = cv2.resize(frame, (max(1, round(w * scale)), max(1, round(h * scale))), interpolation=cv2.INTER_AREA)
+    gray = small if small.ndim == 2 else cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    edges = cv2.Canny(cv2.GaussianBlur(gray, (5, 5), 0), 50, 150)
+    edges = cv2.dilate(edges, None, iterations=2)
+    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    if not contours:
+        return frame
+    x, y, bw, bh = cv2.boundingRect(max(contours, key=cv2.contourArea))
+    if bw * bh < min_fraction * gray.shape[0] * gray.shape[1]:
+        return frame
+    pad_x, pad_y = bw * margin, bh * margin
+    x0, y0 = max(0, int((x - pad_x) / scale)), max(0, int((y - pad_y) / scale))
+    x1, y1 = min(w, int((x + bw + pad_x) / scale) + 1), min(h, int((y + bh + pad_y) / scale) + 1)
+    return frame[y0:y1, x0:x1]
+
+
+def downscale(frame, max_edge=MAX_EDGE):
+    h, w = frame.shape[:2]
+    if not max_edge or max(h, w) <= max_edge:
+        return frame
+    scale = max_edge / max(h, w)
+    return cv2.resize(frame, (max(1, round(w * scale)), max(1, round(h * scale))), interpolation=cv2.INTER_AREA)
+
+
+def encode_jpeg(frame, quality=JPEG_QUALITY, max_bytes=None, min_quality=MIN_JPEG_QUALITY):
+    """Encodes a BGR frame straight to JPEG bytes.
+
+    With ``max_bytes`` the quality is stepped down until the image fits or
+    ``min_quality`` is reached.
+    """
+    while True:
+        ok, data = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not ok:
+            raise ValueError("could not encode frame as JPEG")
+        if max_bytes is None or data.size <= max_bytes or quality <= min_quality:
+            return data.tobytes()
+        quality = max(min_quality, quality - 10)
+
+
+def prepare_image(frame, max_edge=MAX_EDGE, quality=JPEG_QUALITY, max_bytes=MAX_UPLOAD_BYTES, crop=True):
+    """Crop, downscale and encode a frame for upload; returns the JPEG bytes."""
+    if crop:
+        frame = crop_to_subject(frame)
+    return encode_jpeg(downscale(frame, max_edge), quality, max_bytes)
+
+
+def split_batch_response(text, count):
+    """Splits a BATCH_PROMPT answer into one text per photo; missing answers are None."""
+    answers = [None] * count
+    parts = ITEM_HEADER.split(text)
+    for number, answer in zip(parts[1::2], parts[2::2]):
+        index = int(number) - 1
+        if 0 <= index < count and answer.strip():
+            answers[index] = answer.strip()
+    return answers
+
+
+def clean_markdown(text):
+    text = re.sub(r"\*\*(.*?)\*\*", r"\1", text)
+    text = re.sub(r"[*#`>-]", "", text)
+    return text.strip()
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """Offline stand-in for ``genai.GenerativeModel``.
+
+    Answers after ``latency`` seconds plus ``per_image`` seconds for every
+    attached image, and numbers its answers when given several images.
+    """
+
+    def __init__(self, latency=2.0, text="The item is: Masala dosa \n Calories: 168 \n Protein: 3.9 \n Carbs: 29 \n Fats: 3.7",
+                 per_image=0.0):
+        self.latency = latency
+        self.text = text
+        self.per_image = per_image
+        self.calls = 0
+        self.bytes_received = 0
+
+    def generate_content(self, contents, request_options=None):
+        self.calls += 1
+        images = [part for part in contents if isinstance(part, dict)]
+        self.bytes_received += sum(len(part["data"]) for part in images)
+        latency = self.latency + self.per_image * len(images)
+        timeout = (request_options or {}).get("timeout")
+        if timeout is not None and latency > timeout:
+            time.sleep(timeout)
+            raise TimeoutError(f"fake model timed out after {timeout}s")
+        time.sleep(latency)
+        if len(images) > 1:
+            return FakeResponse("\n".join(f"Item {n}:\n{self.text}" for n in range(1, len(images) + 1)))
+        return FakeResponse(self.text)
+
+
+class RecognitionService(QObject):
+    """Runs food recognition requests on the shared ``request_pool``.
+
+    ``submit`` queues one frame and ``submit_batch`` several; both return
+    request ids, and results come back per id through ``recognized`` /
+    ``failed`` on the GUI thread. A batch is sent as multi-image requests of
+    up to ``batch_size`` frames, at most ``max_workers`` requests at a time.
+    ``max_pending`` caps the number of queued frames: beyond it the oldest
+    frames are dropped and fail with "dropped", delivered through the event
+    loop like every other result so a caller can register the ids
+    ``submit_batch`` returned first. Cancelled ids never emit, even if the
+    model call already started. Frames are cropped, downscaled and encoded
+    by ``prepare_image`` on the worker thread with the service's
+    ``max_edge``, ``quality`` and ``max_bytes``.
+    """
+    recognized = pyqtSignal(int, str)
+    failed = pyqtSignal(int, str)
+    _dropped = pyqtSignal(int, str)
+
+    def __init__(self, model, timeout=DEFAULT_TIMEOUT, max_pending=MAX_PENDING_FRAMES,
+                 max_edge=MAX_EDGE, quality=JPEG_QUALITY, max_bytes=MAX_UPLOAD_BYTES,
+                 batch_size=BATCH_SIZE, max_workers=2):
+        super().__init__()
+        self.model = model
+        self.timeout = timeout
+        self.max_pending = max_pending
+        self.max_edge = max_edge
+        self.quality = quality
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self._pending = collections.deque()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._cancelled = set()
+        self._in_flight = set()
+        self._workers = 0
+        self._dropped.connect(self.failed, Qt.ConnectionType.QueuedConnection)
+
+    def submit(self, frame):
+        return self.submit_batch([frame])[0]
+
+    def submit_batch(self, frames):
+        items = [(next(self._ids), frame) for frame in frames]
+        jobs = [items[i:i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+        dropped = []
+        with self._lock:
+            self._pending.extend(jobs)
+            waiting = sum(len(job) for job in self._pending)
+            while waiting > self.max_pending:
+                job = self._pending[0]
+                dropped.append(job.pop(0)[0])
+                waiting -= 1
+                if not job:
+                    self._pending.popleft()
+            start = max(0, min(self.max_workers - self._workers, len(self._pending)))
+            self._workers += start
+        for request_id in dropped:
+            self._dropped.emit(request_id, "dropped: too many pending scans")
+        for _ in range(start):
+            request_pool().start(self._drain)
+        return [request_id for request_id, _ in items]
+
+    def pending(self):
+        with self._lock:
+            return sum(len(job) for job in self._pending) + len(self._in_flight)
+
+    def cancel(self, request_id=None):
+        """Cancels one request, or every queued and running request when no id is given.
+
+        A queued request is removed from its job; a running one is marked so
+        its result is not emitted. Unknown or finished ids are ignored.
+        """
+        with self._lock:
+            if request_id is None:
+                self._pending.clear()
+                self._cancelled.update(self._in_flight)
+            elif request_id in self._in_flight:
+                self._cancelled.add(request_id)
+            else:
+                for job in self._pending:
+                    for index, (queued_id, _) in enumerate(job):
+                        if queued_id == request_id:
+                            del job[index]
+                            return
+
+    def _next_job(self):
+        with self._lock:
+            while self._pending:
+                job = self._pending.popleft()
+                if job:
+                    self._in_flight.update(request_id for request_id, _ in job)
+                    return job
+            self._workers -= 1
+            return None
+
+    def _recognize(self, job):
+        """Sends one request for every frame in ``job``; returns (request_id, text, error) per frame."""
+        try:
+            images = [{"mime_type": "image/jpeg", "data": prepare_image(frame, self.max_edge, self.quality, self.max_bytes)}
+                      for _, frame in job]
+            prompt = PROMPT if len(job) == 1 else BATCH_PROMPT.format(count=len(job))
+            response = self.model.generate_content([prompt, *images], request_options={"timeout": self.timeout})
+            texts = [response.text] if len(job) == 1 else split_batch_response(response.text, len(job))
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            return [(request_id, None, error) for request_id, _ in job]
+        return [(request_id, text, None if text else "no answer for this item")
+                for (request_id, _), text in zip(job, texts)]
+
+    def _drain(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            for request_id, text, error in self._recognize(job):
+                with self._lock:
+                    self._in_flight.discard(request_id)
+                    if request_id in self._cancelled:
+                        self._cancelled.discard(request_id)
+                        continue
+                if error is None:
+                    self.recognized.emit(request_id, text)
+                else:
+                    self.failed.emit(request_id, error)
@@ -0,0 +1,108 @@
+import time
+
+import cv2
+import numpy as np
+
+from db import get_connection
+
+HASH_BITS = 64
+
+
+def dhash(frame, size=8):
+    """Difference hash of a BGR frame: one bit per horizontally adjacent pixel pair."""
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+    small = cv2.resize(gray, (size + 1, size), interpolation=cv2.INTER_AREA)
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def to_signed(value):
+    return value - (1 << HASH_BITS) if value >= 1 << (HASH_BITS - 1) else value
+
+
+def to_unsigned(value):
+    return value + (1 << HASH_BITS) if value < 0 else value
+
+
+class RecognitionCache:
+    """Persistent cache of recognition answers keyed by the frame's dHash.
+
+    A lookup hits when a stored hash is within ``max_distance`` bits
+    (Hamming distance) of the frame's hash. Entries expire ``ttl`` seconds
+    after they were recognized and the least recently used ones are evicted
+    past ``max_entries``.
+    """
+
+    def __init__(self, db_filename="scan_cache.db", max_distance=6, max_entries=500, ttl=7 * 24 * 3600):
+        self.db_filename = db_filename
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.conn = get_connection(db_filename)
+        with self.conn:
+            self.conn.execute("DELETE FROM recognitions WHERE created_at < ?", (time.time() - ttl,))
+        # id -> [hash, text, created_at, last_used]
+        self.entries = {
+            row_id: [to_unsigned(h), text, created_at, last_used]
+            for row_id, h, text, created_at, last_used in self.conn.execute(
+                "SELECT id, hash, text, created_at, last_used FROM recognitions")
+        }
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, frame_hash):
+        """Returns the cached answer closest to ``frame_hash``, or None on a miss."""
+        now = time.time()
+        best_id, best_distance = None, self.max_distance + 1
+        expired = []
+        for row_id, (h, _, created_at, _) in self.entries.items():
+            if now - created_at > self.ttl:
+                expired.append(row_id)
+                continue
+            distance = (h ^ frame_hash).bit_count()
+            if distance < best_distance:
+                best_id, best_distance = row_id, distance
+        if expired:
+            self._delete(expired)
+        if best_id is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry = self.entries[best_id]
+        entry[3] = now
+        with self.conn:
+            self.conn.execute("UPDATE recognitions SET last_used = ? WHERE id = ?", (now, best_id))
+        return entry[1]
+
+    def store(self, frame_hash, text):
+        now = time.time()
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO recognitions (hash, text, created_at, last_used) VALUES (?, ?, ?, ?)",
+                (to_signed(frame_hash), text, now, now))
+        self.entries[cursor.lastrowid] = [frame_hash, text, now, now]
+        if len(self.entries) > self.max_entries:
+            by_age = sorted(self.entries, key=lambda row_id: self.entries[row_id][3])
+            self._delete(by_age[:len(self.entries) - self.max_entries])
+
+    def _delete(self, row_ids):
+        with self.conn:
+            self.conn.executemany("DELETE FROM recognitions WHERE id = ?", [(row_id,) for row_id in row_ids])
+        for row_id in row_ids:
+            del self.entries[row_id]
+
+    def clear(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM recognitions")
+        self.entries.clear()
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate, "entries": len(self.entries)}
@@ -1,71 +1,148 @@
 from PyQt6.QtWidgets import QMainWindow, QLabel, QListWidgetItem
-from PyQt6.QtGui import QPixmap, QImage
 from PyQt6.QtCore import QTimer
-from PyQt6 import uic
-import cv2
-import google.generativeai as genai
-from PIL import Image
-import re
-import numpy as np
-from utils import resource_path,get_db_path
+import os
+from recognition import RecognitionService, FakeModel, clean_markdown
+from recognition_cache import RecognitionCache, dhash
+from frame_pipeline import CaptureThread, DEFAULT_FPS, FrameStats, PreviewRenderer
+from ui_cache import load_ui
 
 
 class Scanner(QMainWindow):
-    def __init__(self):
+    def __init__(self, model=None, source=None, target_fps=DEFAULT_FPS):
         super().__init__()
-        uic.loadUi(resource_path("Scanner.ui"), self)
+        load_ui("Scanner.ui", self)
         self.window = QMainWindow()
-        genai.configure(api_key="  ")
-        self.model = genai.GenerativeModel("gemini-2.5-pro")
+        self.model = model if model is not None else self.create_model()
+        self.recognizer = RecognitionService(self.model)
+        self.recognizer.recognized.connect(self.show_recognition)
+        self.recognizer.failed.connect(self.show_recognition_error)
+        self.cache = RecognitionCache()
+        self.pending_scans = {}
+        self.scan_queue = []
         self.video_label = QLabel(self.cam_frame)
         self.video_label.setGeometry(0, 0, self.cam_frame.width(), self.cam_frame.height())
-        self.cap = cv2.VideoCapture(0)
+        self.preview = PreviewRenderer()
+        self.frame_stats = FrameStats()
+        # Camera reads happen on their own thread; the timer only shows the newest frame.
+        self.capture = CaptureThread(source, target_fps)
+        self.capture.start()
+        self.capture_stats_label = QLabel()
+        self.statusBar().addPermanentWidget(self.capture_stats_label)
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_frame)
-        self.timer.start(30)
+        self.timer.start(max(1, round(1000 / target_fps)))
+        self.stats_timer = QTimer()
+        self.stats_timer.timeout.connect(self.show_capture_stats)
+        self.stats_timer.start(1000)
         self.last_request_time = 0
         self.search_btn.clicked.connect(self.freeze_and_scan)
+        self.queue_btn.clicked.connect(self.queue_frame)
+        self.scan_queue_btn.clicked.connect(self.scan_queued)
+
+    @staticmethod
+    def create_model():
+        # NUTRIFIT_FAKE_MODEL_LATENCY=<seconds> swaps Gemini for a local fake, e.g. to test offline.
+        latency = os.environ.get("NUTRIFIT_FAKE_MODEL_LATENCY")
+        if latency is not None:
+            return FakeModel(float(latency))
+        import google.generativeai as genai
+        genai.configure(api_key="  ")
+        return genai.GenerativeModel("gemini-2.5-pro")
+
+    @property
+    def last_frame(self):
+        return self.capture.current
 
     def freeze_and_scan(self):
+        # Frozen means the camera is no longer read either; the shown frame stays in its buffer.
         self.timer.stop()
+        self.capture.stop()
+        if self.last_frame is not None:
+            # Capture buffers get reused, so the scanned frame is the one copy we make.
+            self.recognize_object(self.last_frame.copy())
+
+    def queue_frame(self):
+        """Keeps a copy of the current frame for the next "Scan meal"; the preview keeps running.
+
+        A meal holds at most as many frames as the recognizer keeps pending,
+        so scanning it never drops the meal's own first frames.
+        """
+        if len(self.scan_queue) >= self.recognizer.max_pending:
+            self.statusBar().showMessage(
+                f"A meal can have up to {self.recognizer.max_pending} items; scan this one first", 5000)
+            return
         if self.last_frame is not None:
-            self.recognize_object(self.last_frame)
+            self.scan_queue.append(self.last_frame.copy())
+            self.scan_queue_btn.setText(f"Scan meal ({len(self.scan_queue)})")
+
+    def scan_queued(self):
+        frames, self.scan_queue = self.scan_queue, []
+        self.scan_queue_btn.setText("Scan meal")
+        if frames:
+            self.recognize_objects(frames)
 
     def update_frame(self):
-        ret, frame = self.cap.read()
-        if ret:
-            self.last_frame = frame.copy()
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = frame_rgb.shape
-            bytes_per_line = ch * w
-            img_qt = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-            pixmap = QPixmap.fromImage(img_qt)
-            self.video_label.setPixmap(pixmap.scaled(self.video_label.width(), self.video_label.height()))
+        frame = self.capture.take_latest()
+        if frame is not None:
+            self.frame_stats.begin()
+            self.video_label.setPixmap(self.preview.render(frame, self.video_label.size()))
+            self.frame_stats.end()
+            if self.frame_stats.trace_allocations and self.frame_stats.frames % 100 == 0:
+                print("Frame stats:", self.frame_stats.summary())
 
     def recognize_object(self, frame):
-        try:
-            pil_image = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-            import io
-            img_bytes = io.BytesIO()
-            pil_image.save(img_bytes, format="JPEG")
-            img_bytes.seek(0)
-            response = self.model.generate_content(
-                [
-                    "Identify the food item and list only macros (calories, protein, carbs, fats) if possible. in the format: The item is: item_name \n Calories: \n Protein: \n Carbs: \n Fats:",
-                    {"mime_type": "image/jpeg", "data": img_bytes.read()},
-                ]
-            )
-            print("Gemini:", response.text)
-            cleaned = self.clean_markdown(response.text)
-            self.listWidget.addItem(cleaned)
-        
-        except Exception as e:
-            print("Gemini Error:", e)
-
-    def clean_markdown(self, text):
-        text = re.sub(r"\*\*(.*?)\*\*", r"\1", text) 
-        text = re.sub(r"[*#`>-]", "", text)          
-        return text.strip()
+        return self.recognize_objects([frame])[0]
+
+    def recognize_objects(self, frames):
+        """Adds one listWidget row per frame, answered from the cache when a
+        near-identical frame was already recognized. The other frames go to
+        the recognizer as one batch; returns a request id per frame, None for
+        cache hits."""
+        misses, request_ids = [], []
+        for frame in frames:
+            frame_hash = dhash(frame)
+            cached = self.cache.lookup(frame_hash)
+            if cached is not None:
+                self.listWidget.addItem(clean_markdown(cached))
+                request_ids.append(None)
+            else:
+                item = QListWidgetItem("Scanning...")
+                self.listWidget.addItem(item)
+                misses.append((frame, frame_hash, item))
+                request_ids.append(len(misses) - 1)
+        self.show_cache_stats()
+        submitted = self.recognizer.submit_batch([frame for frame, _, _ in misses]) if misses else []
+        for request_id, (_, frame_hash, item) in zip(submitted, misses):
+            self.pending_scans[request_id] = (frame_hash, item)
+        return [None if index is None else submitted[index] for index in request_ids]
+
+    def show_recognition(self, request_id, text):
+        print("Gemini:", text)
+        scan = self.pending_scans.pop(request_id, None)
+        if scan is None:
+            return
+        frame_hash, item = scan
+        self.cache.store(frame_hash, text)
+        item.setText(clean_markdown(text))
+
+    def show_recognition_error(self, request_id, error):
+        scan = self.pending_scans.pop(request_id, None)
+        print("Gemini Error:", error)
+        if scan is not None:
+            scan[1].setText(f"Could not recognize this item ({error})")
+
+    def show_cache_stats(self):
+        stats = self.cache.stats()
+        self.statusBar().showMessage(
+            f"Scan cache: {stats['hits']} hits / {stats['misses']} misses ({stats['hit_rate']:.0%})")
+
+    def show_capture_stats(self):
+        stats = self.capture.stats()
+        self.capture_stats_label.setText(
+            f"Captured {stats['captured']} / displayed {stats['displayed']} / dropped {stats['dropped']}")
 
     def closeEvent(self, event):
-        self.cap.release()
\ No newline at end of file
+        self.recognizer.cancel()
+        self.stats_timer.stop()
+        self.timer.stop()
+        self.capture.stop()
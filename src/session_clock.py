@@ -0,0 +1,98 @@
+from PyQt6.QtCore import QElapsedTimer, QObject, Qt, QTimer, pyqtSignal
+
+
+class SessionClock(QObject):
+    """Elapsed time, breath phase and cycle count of a session from one monotonic clock.
+
+    Everything is computed from the time elapsed while running, so late
+    timer ticks never add up to drift. The clock wakes once per visible
+    change (the next whole second or phase boundary) and emits only what
+    changed. ``now`` returns milliseconds and defaults to a QElapsedTimer;
+    pass another source to drive the clock from a simulated time.
+    """
+    second_changed = pyqtSignal(int)
+    phase_changed = pyqtSignal(int)
+    cycle_changed = pyqtSignal(int)
+
+    def __init__(self, phase_ms=4000, phases=3, now=None, parent=None):
+        super().__init__(parent)
+        self.phase_ms = phase_ms
+        self.phases = phases
+        if now is None:
+            source = QElapsedTimer()
+            source.start()
+            now = source.elapsed
+        self.now = now
+        self.wakeups = 0
+        self._offset = 0
+        self._started_at = None
+        self._last = (0, 0, 0)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._on_timeout)
+
+    @property
+    def running(self):
+        return self._started_at is not None
+
+    @property
+    def cycle_ms(self):
+        return self.phase_ms * self.phases
+
+    def elapsed(self):
+        if self._started_at is None:
+            return self._offset
+        return self._offset + self.now() - self._started_at
+
+    def state(self, elapsed=None):
+        """(whole seconds, breath phase, completed cycles) at ``elapsed`` ms, now by default."""
+        elapsed = self.elapsed() if elapsed is None else elapsed
+        return elapsed // 1000, (elapsed // self.phase_ms) % self.phases, elapsed // self.cycle_ms
+
+    def start(self):
+        """Starts from zero, also when the clock is already running."""
+        self._offset = 0
+        self._started_at = None
+        self._last = (0, 0, 0)
+        self.resume()
+
+    def pause(self):
+        if self._started_at is not None:
+            self._offset = self.elapsed()
+            self._started_at = None
+        self.timer.stop()
+
+    def resume(self):
+        if self._started_at is None:
+            self._started_at = self.now()
+        self._schedule()
+
+    def reset(self):
+        self.pause()
+        self._offset = 0
+        self._last = (0, 0, 0)
+
+    def _schedule(self):
+        elapsed = self.elapsed()
+        delay = min(1000 - elapsed % 1000, self.phase_ms - elapsed % self.phase_ms)
+        self.timer.start(max(1, delay))
+
+    def _on_timeout(self):
+        if not self.running:
+            return
+        self.wakeups += 1
+        self.update()
+        self._schedule()
+
+    def update(self):
+        """Emits whatever changed since the last update."""
+        second, phase, cycle = self.state()
+        last_second, last_phase, last_cycle = self._last
+        self._last = (second, phase, cycle)
+        if second != last_second:
+            self.second_changed.emit(second)
+        if phase != last_phase:
+            self.phase_changed.emit(phase)
+        if cycle != last_cycle:
+            self.cycle_changed.emit(cycle)
@@ -1,17 +1,14 @@
 from PyQt6.QtWidgets import QMainWindow, QVBoxLayout
-from PyQt6 import uic
 from PyQt6.QtCore import Qt, QPropertyAnimation, QPoint, QEasingCurve
 
 from ui_components import HoverButton
-from auth import Profile
-from stopwatch import Stopwatch
-from utils import resource_path, get_db_path
+from ui_cache import load_ui
 
 
 class StartScreen(QMainWindow):
     def __init__(self):
         super().__init__()
-        uic.loadUi(resource_path("HomeScreen.ui"),self)
+        load_ui("HomeScreen.ui", self)
         #self.lbl1.animate_text("Nutrifit Tracker", speed=60)
         start_btn = self.start_btn
         self.start_btn = HoverButton(start_btn.text(), start_btn.parent())
@@ -41,10 +38,13 @@ class StartScreen(QMainWindow):
         self.show()
 
     def show_meditation_page(self):
+        from stopwatch import Stopwatch
         self.window = Stopwatch()
         self.window.show()
 
     def profile_info(self):
-        self.win = Profile()
+        # Imported here so the profile and dashboard modules load after the start screen is up
+        from auth import Profile
+        self.win = Profile.shared()
         self.win.show()
         self.hide()
\ No newline at end of file
@@ -0,0 +1,109 @@
+from datetime import date
+
+from db import get_connection
+from migrations import BACKFILL_DAILY_TOTALS
+
+INSERT_RECIPE_ROW = """
+    INSERT INTO recipe_ingredients
+              (recipe_name, ingredient, calories, protein, carbs, fat, date, profile_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+INSERT_WORKOUT_ROW = """
+    INSERT INTO workouts
+              (workout_name, exercise_name, sets, reps, weight, date, profile_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def save_recipe_rows(profile_id, recipe_name, rows, day=None):
+    """Writes all (ingredient, macros) rows of a recipe in one transaction.
+
+    Nothing is written if any row fails; the sqlite3 error is re-raised.
+    """
+    day = day or date.today().isoformat()
+    params = [
+        (recipe_name, name, macros["cal"], macros["prot"], macros["carbs"], macros["fat"], day, profile_id)
+        for name, macros in rows
+    ]
+    with get_connection("recipes.db") as conn:
+        conn.executemany(INSERT_RECIPE_ROW, params)
+
+
+def daily_totals(profile_id, day=None):
+    """Returns (cal, prot, carbs, fat) logged by a profile on ``day``, today by default."""
+    day = day or date.today().isoformat()
+    row = get_connection("recipes.db").execute(
+        "SELECT cal, prot, carbs, fat FROM daily_totals WHERE profile_id = ? AND date = ?",
+        (profile_id, day),
+    ).fetchone()
+    return row if row is not None else (0, 0, 0, 0)
+
+
+# One page of a profile's recipe history: the next ``limit`` recipe names after
+# ``after`` with their distinct ingredients. The inner bound keeps the grouping
+# to the rows of this page, so every page costs the same however long the history.
+RECIPE_HISTORY_PAGE = """
+    SELECT recipe_name, group_concat(ingredient, ', ') FROM (
+        SELECT DISTINCT recipe_name, ingredient FROM recipe_ingredients
+        WHERE profile_id = :profile AND recipe_name > :after AND recipe_name <= (
+            SELECT MAX(recipe_name) FROM (
+                SELECT DISTINCT recipe_name FROM recipe_ingredients
+                WHERE profile_id = :profile AND recipe_name > :after
+                ORDER BY recipe_name LIMIT :limit))
+        ORDER BY recipe_name, ingredient)
+    GROUP BY recipe_name ORDER BY recipe_name
+"""
+
+
+def recipe_history_page(profile_id, after="", limit=100):
+    """Returns [(recipe_name, "ingredient, ingredient, ...")] for the recipes named after ``after``."""
+    return get_connection("recipes.db").execute(
+        RECIPE_HISTORY_PAGE, {"profile": profile_id, "after": after, "limit": limit}).fetchall()
+
+
+def workout_names(profile_id):
+    """The distinct workout names a profile has logged, from the trigger-maintained catalog."""
+    rows = get_connection("workout_data.db").execute(
+        "SELECT workout_name FROM workout_catalog WHERE profile_id = ? ORDER BY workout_name",
+        (profile_id,)).fetchall()
+    return [name for (name,) in rows]
+
+
+def workout_history_page(profile_id, workout_name, before=None, limit=200):
+    """Returns up to ``limit`` [(id, date, exercise, sets, reps, weight)] of a workout, newest first.
+
+    ``before`` is the (date, id) of the last row already shown; the page
+    continues right after it.
+    """
+    conn = get_connection("workout_data.db")
+    if before is None:
+        return conn.execute("""
+            SELECT id, date, exercise_name, sets, reps, weight FROM workouts
+            WHERE profile_id = ? AND workout_name = ?
+            ORDER BY date DESC, id DESC LIMIT ?""", (profile_id, workout_name, limit)).fetchall()
+    return conn.execute("""
+        SELECT id, date, exercise_name, sets, reps, weight FROM workouts
+        WHERE profile_id = ? AND workout_name = ? AND (date, id) < (?, ?)
+        ORDER BY date DESC, id DESC LIMIT ?""", (profile_id, workout_name, *before, limit)).fetchall()
+
+
+def workout_sessions(profile_id, workout_name, first, last):
+    """Returns {date: (entries, volume)} for the sessions of a workout dated ``first`` to ``last``.
+
+    Volume is the sum of sets x reps x weight over the session.
+    """
+    rows = get_connection("workout_data.db").execute("""
+        SELECT date, COUNT(*), IFNULL(SUM(sets * reps * weight), 0) FROM workouts
+        WHERE profile_id = ? AND workout_name = ? AND date BETWEEN ? AND ?
+        GROUP BY date""", (profile_id, workout_name, first, last)).fetchall()
+    return {day: (entries, volume) for day, entries, volume in rows}
+
+
+def backfill_daily_totals():
+    """Rebuilds daily_totals from every logged ingredient row; returns the number of days."""
+    with get_connection("recipes.db") as conn:
+        for statement in BACKFILL_DAILY_TOTALS:
+            conn.execute(statement)
+        return conn.execute("SELECT COUNT(*) FROM daily_totals").fetchone()[0]
@@ -0,0 +1,108 @@
+import hashlib
+import importlib.util
+import io
+import os
+
+from utils import resource_path, get_db_path
+
+CACHE_DIR_NAME = "ui_cache"
+HEADER = "# nutrifit-ui-sha256: "
+
+_forms = {}
+
+
+def cache_dir():
+    return get_db_path(CACHE_DIR_NAME)
+
+
+def module_path(ui_path, directory=None):
+    stem = os.path.splitext(os.path.basename(ui_path))[0]
+    return os.path.join(directory or cache_dir(), f"ui_{stem}.py")
+
+
+def _cached_digest(path):
+    try:
+        with open(path) as f:
+            line = f.readline()
+    except OSError:
+        return None
+    return line[len(HEADER):].strip() if line.startswith(HEADER) else None
+
+
+def compile_form(ui_path, directory=None):
+    """Compiles ``ui_path`` into the cache unless the cached module matches its XML.
+
+    Returns (module path, True if it was regenerated). The module's first line
+    records the SHA-256 of the XML it was generated from.
+    """
+    with open(ui_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    path = module_path(ui_path, directory)
+    if _cached_digest(path) == digest:
+        return path, False
+    from PyQt6 import uic
+    source = io.StringIO()
+    uic.compileUi(ui_path, source)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        f.write(HEADER + digest + "\n")
+        f.write(source.getvalue())
+    os.replace(tmp_path, path)
+    return path, True
+
+
+def form_class(ui_path):
+    """The generated ``Ui_*`` class for ``ui_path``, compiled and imported once per process."""
+    form = _forms.get(ui_path)
+    if form is not None:
+        return form
+    path, _ = compile_form(ui_path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    form = next(value for key, value in vars(module).items() if key.startswith("Ui_"))
+    _forms[ui_path] = form
+    return form
+
+
+def load_ui(filename, widget):
+    """Builds the form in ``filename`` onto ``widget``, like ``uic.loadUi(resource_path(filename), widget)``.
+
+    The form comes from Python code generated once per change to the .ui
+    file, so no XML is parsed while the window is constructed. Named child
+    widgets become attributes of ``widget``, as with loadUi. If the form
+    cannot be compiled or imported the window is built with loadUi instead.
+    """
+    ui_path = resource_path(filename)
+    try:
+        form = form_class(ui_path)
+    except Exception as e:
+        print("UI cache error:", e)
+        from PyQt6 import uic
+        return uic.loadUi(ui_path, widget)
+    ui = form()
+    ui.setupUi(widget)
+    for name, value in vars(ui).items():
+        setattr(widget, name, value)
+    return widget
+
+
+def build_all(directory=None):
+    """Compiles every .ui file shipped with the app.
+
+    Returns [(ui filename, status)], the status being "compiled", "up to date"
+    or the error that kept the form from compiling.
+    """
+    base = os.path.normpath(resource_path("."))
+    results = []
+    for filename in sorted(os.listdir(base)):
+        if not filename.endswith(".ui"):
+            continue
+        try:
+            _, regenerated = compile_form(os.path.join(base, filename), directory)
+            results.append((filename, "compiled" if regenerated else "up to date"))
+        except Exception as e:
+            results.append((filename, f"failed ({type(e).__name__}: {e})"))
+    return results
@@ -1,5 +1,11 @@
-from PyQt6.QtWidgets import QPushButton
-from PyQt6.QtCore import QPropertyAnimation
+import difflib
+
+from PyQt6.QtWidgets import QPushButton, QStyledItemDelegate
+from PyQt6.QtCore import QPropertyAnimation, QAbstractListModel, QModelIndex, QRectF, QSize, Qt
+from PyQt6.QtGui import QColor, QFont, QPen
+from animation_clock import reduced_motion
+
+PLACEHOLDER_ROLE = Qt.ItemDataRole.UserRole + 1
 
 class HoverButton(QPushButton):
     def __init__(self, *args):
@@ -7,6 +13,9 @@ class HoverButton(QPushButton):
         self.base_geometry = None
 
     def enterEvent(self, event):
+        if reduced_motion():
+            super().enterEvent(event)
+            return
         if self.base_geometry is None:
             self.base_geometry = self.geometry()
 
@@ -18,9 +27,99 @@ class HoverButton(QPushButton):
         super().enterEvent(event)
 
     def leaveEvent(self, event):
+        if reduced_motion():
+            if self.base_geometry is not None:
+                self.setGeometry(self.base_geometry)
+            super().leaveEvent(event)
+            return
         self.anim = QPropertyAnimation(self, b"geometry")
         self.anim.setDuration(150)
         self.anim.setStartValue(self.geometry())
         self.anim.setEndValue(self.base_geometry)
         self.anim.start()
-        super().leaveEvent(event)
\ No newline at end of file
+        super().leaveEvent(event)
+
+
+class DashboardListModel(QAbstractListModel):
+    """Names shown in a dashboard panel, with ``placeholder`` shown when there are none.
+
+    ``set_items`` diffs the new names against the shown ones and emits only
+    the row inserts, removals and changes in between, so a view keeps its
+    painted rows and only lays out what changed.
+    """
+
+    def __init__(self, placeholder, parent=None):
+        super().__init__(parent)
+        self.placeholder = placeholder
+        self.items = []
+        self.rows = [(placeholder, True)]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        text, placeholder = self.rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return text
+        if role == PLACEHOLDER_ROLE:
+            return placeholder
+        return None
+
+    def set_items(self, items):
+        self.items = list(items)
+        rows = [(item, False) for item in self.items] or [(self.placeholder, True)]
+        opcodes = difflib.SequenceMatcher(None, self.rows, rows, autojunk=False).get_opcodes()
+        # Applied from the end so the row numbers of earlier opcodes stay valid.
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == "equal":
+                continue
+            if tag == "replace" and i2 - i1 == j2 - j1:
+                self.rows[i1:i2] = rows[j1:j2]
+                self.dataChanged.emit(self.index(i1), self.index(i2 - 1))
+                continue
+            if i2 > i1:
+                self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                del self.rows[i1:i2]
+                self.endRemoveRows()
+            if j2 > j1:
+                self.beginInsertRows(QModelIndex(), i1, i1 + j2 - j1 - 1)
+                self.rows[i1:i1] = rows[j1:j2]
+                self.endInsertRows()
+
+
+class DashboardItemDelegate(QStyledItemDelegate):
+    """Paints dashboard rows as the rounded grey cards the panels used to build from styled QLabels."""
+    HEIGHT = 44
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.font = QFont("Epilogue")
+        self.font.setPixelSize(20)
+        self.placeholder_font = QFont("Epilogue")
+        self.placeholder_font.setPixelSize(18)
+        self.background = QColor(242, 242, 242)
+        self.border = QPen(QColor("#c0c0c0"))
+        self.text_color = QColor("#1d1d1d")
+        self.placeholder_color = QColor("gray")
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.HEIGHT)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        rect = QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5)
+        text_rect = option.rect.adjusted(6, 0, -6, 0)
+        if index.data(PLACEHOLDER_ROLE):
+            painter.setFont(self.placeholder_font)
+            painter.setPen(self.placeholder_color)
+        else:
+            painter.setPen(self.border)
+            painter.setBrush(self.background)
+            painter.drawRoundedRect(rect, 10, 10)
+            painter.setFont(self.font)
+            painter.setPen(self.text_color)
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, index.data())
+        painter.restore()
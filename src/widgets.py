@@ -1,5 +1,5 @@
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QSpinBox, QPushButton
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QSpinBox, QPushButton, QCompleter
+from PyQt6.QtCore import pyqtSignal, QStringListModel
 
 class IngredientAdd(QWidget):
     change = pyqtSignal()
@@ -94,4 +94,20 @@ class WorkoutAdd(QWidget):
         self.rem_btn.clicked.connect(lambda: self.removed.emit(self))
         self.rem_btn.setStyleSheet(common_style)
         self.rem_btn.setMaximumHeight(25)
-        layout.addWidget(self.rem_btn)
\ No newline at end of file
+        layout.addWidget(self.rem_btn)
+
+
+class IngredientCompleter(QCompleter):
+    """Completer that asks the ingredient index for matches instead of
+    filtering every name in the table itself."""
+    def __init__(self, index, parent=None, limit=50):
+        super().__init__(parent)
+        self.index = index
+        self.limit = limit
+        self.names_model = QStringListModel(self)
+        self.setModel(self.names_model)
+        self.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+
+    def splitPath(self, path):
+        self.names_model.setStringList(self.index.completions(path, self.limit))
+        return [""]
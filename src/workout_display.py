@@ -1,51 +1,111 @@
 from PyQt6.QtWidgets import QWidget
-from PyQt6 import uic
-import sqlite3
-from utils import resource_path,get_db_path
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PyQt6.QtGui import QColor, QFont
+from ui_cache import load_ui
+from store import workout_names, workout_history_page, workout_sessions
+
+PAGE_SIZE = 200
+
+
+class WorkoutHistoryModel(QAbstractListModel):
+    """The logged sets of one workout, newest first, under a header row per session date.
+
+    Rows are fetched a page at a time by (date, id) cursor as the view
+    scrolls, and each header shows the whole session's exercise count and
+    volume even when the session spans pages.
+    """
+
+    def __init__(self, profile_id, page_size=PAGE_SIZE, parent=None):
+        super().__init__(parent)
+        self.profile_id = profile_id
+        self.page_size = page_size
+        self.header_font = QFont()
+        self.header_font.setBold(True)
+        self.header_background = QColor(242, 242, 242)
+        self.set_workout(None)
+
+    def set_workout(self, workout_name):
+        self.beginResetModel()
+        self.workout_name = workout_name
+        self.rows = []
+        self.cursor = None
+        self.exhausted = workout_name is None
+        self.endResetModel()
+        if self.canFetchMore():
+            self.fetchMore()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        header = row[0] == "session"
+        if role == Qt.ItemDataRole.DisplayRole:
+            if header:
+                _, day, entries, volume = row
+                noun = "exercise" if entries == 1 else "exercises"
+                return f"{day} | {entries} {noun} | volume {volume:,.0f} kg"
+            _, exercise, sets, reps, weight = row
+            return f"{exercise}: {sets} sets x {reps} reps ({weight} kg)"
+        if header and role == Qt.ItemDataRole.FontRole:
+            return self.header_font
+        if header and role == Qt.ItemDataRole.BackgroundRole:
+            return self.header_background
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.exhausted:
+            return
+        page = workout_history_page(self.profile_id, self.workout_name, self.cursor, self.page_size)
+        if len(page) < self.page_size:
+            self.exhausted = True
+        if not page:
+            return
+        sessions = workout_sessions(self.profile_id, self.workout_name, page[-1][1], page[0][1])
+        last_day = self.cursor[0] if self.cursor else object()
+        rows = []
+        for set_id, day, exercise, sets, reps, weight in page:
+            if day != last_day:
+                rows.append(("session", day, *sessions.get(day, (0, 0))))
+                last_day = day
+            rows.append(("set", exercise, sets, reps, weight))
+        self.cursor = (page[-1][1], page[-1][0])
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
 
 
 class DisplayWorkout(QWidget):
     def __init__(self, profile_id):
         super().__init__()
-        uic.loadUi(resource_path("workouts.ui"), self)
+        load_ui("workouts.ui", self)
         self.profile_id = profile_id
+        self.history = WorkoutHistoryModel(profile_id, parent=self)
+        self.workout_disp_widget.setUniformItemSizes(True)
+        self.workout_disp_widget.setModel(self.history)
         self.load_workout_in_new_window()
         self.workout_name_list.currentIndexChanged.connect(self.load_names_of_exercises)
         self.load_names_of_exercises()
         self.goback_btn.clicked.connect(self.hide)
 
     def load_workout_in_new_window(self):
-        conn = sqlite3.connect(get_db_path("workout_data.db"))
-        curr1 = conn.cursor()
-        curr1.execute("SELECT DISTINCT workout_name FROM workouts WHERE profile_id=?", (self.profile_id,))
-        workout= curr1.fetchall()
-        conn.close()
+        workout = workout_names(self.profile_id)
         self.workout_name_list.clear()
         if not workout:
             self.workout_name_list.addItem("No workouts found")
             self.workout_name_list.setEnabled(False)
         else:
             self.workout_name_list.setEnabled(True)
-            for (name,) in workout:
-                self.workout_name_list.addItem(name)
+            self.workout_name_list.addItems(workout)
 
     def load_names_of_exercises(self):
         name = self.workout_name_list.currentText()
-        if not name or name == "workouts not found":
-            self.workout_disp_widget.clear()
+        if not name or not self.workout_name_list.isEnabled():
+            self.history.set_workout(None)
             return
-        conn = sqlite3.connect(get_db_path("workout_data.db"))
-        curr2 = conn.cursor()
-        print(name)
-        curr2.execute("""
-            SELECT exercise_name, sets, reps, weight, date 
-            FROM workouts 
-            WHERE workout_name=? AND profile_id=?
-            ORDER BY date DESC
-        """, (name, self.profile_id))
-        data = curr2.fetchall()
-        conn.close()
-        self.workout_disp_widget.clear()
-        for exercise, sets, reps, weight, date_str in data:
-            display_text = f"{date_str} | {exercise}: {sets} sets x {reps} reps ({weight} kg)"
-            self.workout_disp_widget.addItem(display_text)
\ No newline at end of file
+        self.history.set_workout(name)
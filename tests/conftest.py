@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# The app runs from src/ and imports its modules by name.
+sys.path.insert(0, SRC)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """A scratch home directory, since databases and the UI cache live under ~/nutrifit.
+
+    Also runs the test from src/, where the windows find their .ui files.
+    """
+    (tmp_path / "nutrifit").mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(SRC)
+    yield tmp_path
+    import db
+    db.close_all()
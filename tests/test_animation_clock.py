@@ -0,0 +1,50 @@
+from PyQt6.QtCore import QPoint
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication, QPushButton, QVBoxLayout, QWidget
+
+app = QApplication.instance() or QApplication([])
+
+import animation_clock  # noqa: E402
+from animation_clock import AnimationClock, LEVELS, PAINT_BUDGET  # noqa: E402
+from aurora_bg import AuroraBackground  # noqa: E402
+
+
+def shown_background():
+    window = QWidget()
+    layout = QVBoxLayout(window)
+    background = AuroraBackground()
+    layout.addWidget(background)
+    layout.addWidget(QPushButton("button"))
+    window.resize(400, 300)
+    window.show()
+    QTest.qWaitForWindowExposed(window)
+    return window, background
+
+
+def test_over_budget_at_cheapest_level_holds_still():
+    window, background = shown_background()
+    clock = AnimationClock.instance()
+    clock.set_level(len(LEVELS) - 1)
+    clock.timer.stop()  # so no tick runs the governor while the window fills
+    clock.window.restart()
+    QTest.qWait(animation_clock.GOVERNOR_WINDOW_MS + 50)
+    clock.paint_time = PAINT_BUDGET * 10
+    clock.govern()
+    assert clock.held
+    clock.wake()
+    assert not clock.timer.isActive()
+    clock.release()
+    assert not clock.held
+    assert clock.timer.isActive()
+    window.close()
+
+
+def test_input_anywhere_in_the_window_counts_as_activity():
+    window, background = shown_background()
+    clock = AnimationClock.instance()
+    clock.paused = True
+    clock.timer.stop()
+    QTest.mouseMove(window.windowHandle(), QPoint(200, 290))
+    assert not clock.paused
+    assert clock.timer.isActive()
+    window.close()
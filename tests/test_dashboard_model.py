@@ -0,0 +1,72 @@
+import random
+
+from PyQt6.QtWidgets import QApplication
+
+from ui_components import PLACEHOLDER_ROLE, DashboardListModel
+
+app = QApplication.instance() or QApplication([])
+
+PLACEHOLDER = "No recipes logged today"
+
+
+def shown(model):
+    return [model.data(model.index(row)) for row in range(model.rowCount())]
+
+
+class Mirror:
+    """Rebuilds the rows from the model's change signals, the way a view sees them."""
+
+    def __init__(self, model):
+        self.model = model
+        self.rows = shown(model)
+        self.signals = []
+        model.rowsInserted.connect(self.inserted)
+        model.rowsRemoved.connect(self.removed)
+        model.dataChanged.connect(self.changed)
+        model.modelReset.connect(lambda: self.signals.append("reset"))
+
+    def inserted(self, parent, first, last):
+        self.signals.append("inserted")
+        self.rows[first:first] = [self.model.data(self.model.index(row)) for row in range(first, last + 1)]
+
+    def removed(self, parent, first, last):
+        self.signals.append("removed")
+        del self.rows[first:last + 1]
+
+    def changed(self, top_left, bottom_right):
+        self.signals.append("changed")
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self.rows[row] = self.model.data(self.model.index(row))
+
+
+def test_rows_follow_every_list_set_in_sequence():
+    model = DashboardListModel(PLACEHOLDER)
+    mirror = Mirror(model)
+    rng = random.Random(3)
+    sequences = [["a"], ["a", "b", "c"], [], ["c", "a"], ["x", "y", "z", "a"], [], [], ["a", "a", "b"]]
+    sequences += [rng.choices("abcdefg", k=rng.randint(0, 12)) for _ in range(200)]
+    for items in sequences:
+        model.set_items(items)
+        expected = items or [PLACEHOLDER]
+        assert shown(model) == expected
+        assert mirror.rows == expected
+        assert model.data(model.index(0), PLACEHOLDER_ROLE) == (not items)
+    assert "reset" not in mirror.signals
+
+
+def test_appending_one_item_inserts_one_row():
+    model = DashboardListModel(PLACEHOLDER)
+    model.set_items(["oats", "dal"])
+    mirror = Mirror(model)
+    model.set_items(["oats", "dal", "chai"])
+    assert mirror.signals == ["inserted"]
+    assert shown(model) == ["oats", "dal", "chai"]
+
+
+def test_empty_list_shows_only_the_placeholder():
+    model = DashboardListModel(PLACEHOLDER)
+    assert shown(model) == [PLACEHOLDER]
+    model.set_items(["oats"])
+    model.set_items([])
+    assert shown(model) == [PLACEHOLDER]
+    assert model.data(model.index(0), PLACEHOLDER_ROLE) is True
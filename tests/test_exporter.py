@@ -0,0 +1,110 @@
+import csv
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import cli
+import exporter
+import importer
+from ingredient_index import IngredientIndex
+
+MEALS = "SELECT date, recipe_name, ingredient, calories, protein, carbs, fat FROM recipe_ingredients WHERE profile_id = ?"
+WORKOUTS = "SELECT date, workout_name, exercise_name, sets, reps, weight FROM workouts WHERE profile_id = ?"
+
+
+def add_profile(name="export test", weight=70, height=175):
+    import db
+    with db.get_connection("entries.db") as conn:
+        return conn.execute("INSERT INTO entries (name, age, weight, goal_weight, height, cal_goal) "
+                            "VALUES (?, 30, ?, 65, ?, 2200)", (name, weight, height)).lastrowid
+
+
+def add_history(profile_id, days=30):
+    import db
+    import store
+    with db.get_connection("recipes.db") as conn:
+        conn.executemany(store.INSERT_RECIPE_ROW, [
+            (f"Meal {i % 3}", f"food {i}", 100.0 + i, 5.5, 12.0, 3.25, f"2024-05-{i % days + 1:02d}", profile_id)
+            for i in range(3 * days)])
+    with db.get_connection("workout_data.db") as conn:
+        conn.executemany(store.INSERT_WORKOUT_ROW, [
+            ("Push", f"exercise {i}", 3, 8 + i % 4, 40.0 + i / 2, f"2024-05-{i % days + 1:02d}", profile_id)
+            for i in range(2 * days)])
+
+
+def rows(db_filename, sql, profile_id):
+    import db
+    return sorted(db.get_connection(db_filename).execute(sql, (profile_id,)).fetchall())
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_csv_and_jsonl_hold_every_dataset(home, tmp_path):
+    profile_id = add_profile()
+    add_history(profile_id)
+    add_history(add_profile("someone else"))
+    for fmt, read in ((exporter.CSV, read_csv), (exporter.JSONL, read_jsonl)):
+        out = tmp_path / fmt
+        stats = exporter.export_profile(profile_id, out, fmt=fmt, chunk_size=7)
+        assert {name: stats[name] for name in exporter.DATASETS} == {
+            "profile": 1, "meals": 90, "daily_totals": 30, "workouts": 60}
+        profile = read(out / f"profile.{fmt}")
+        assert [row["name"] for row in profile] == ["export test"]
+        meals = read(out / f"meals.{fmt}")
+        assert list(meals[0]) == [column for column, _ in exporter.DATASETS["meals"][2]]
+        assert [row["date"] for row in meals] == sorted(row["date"] for row in meals)
+        assert len(read(out / f"workouts.{fmt}")) == 60
+
+
+def test_from_and_to_limit_the_dated_datasets(home, tmp_path, capsys):
+    profile_id = add_profile()
+    add_history(profile_id)
+    out = tmp_path / "may"
+    assert cli.main(["export", str(out), "--profile", str(profile_id), "--from", "2024-05-10",
+                     "--to", "2024-05-12", "--only", "profile,meals,workouts"]) == 0
+    assert "meals: 9 rows" in capsys.readouterr().out
+    assert {row["date"] for row in read_csv(out / "meals.csv")} == {"2024-05-10", "2024-05-11", "2024-05-12"}
+    assert {row["date"] for row in read_csv(out / "workouts.csv")} == {"2024-05-10", "2024-05-11", "2024-05-12"}
+    assert len(read_csv(out / "profile.csv")) == 1
+    assert not (out / "daily_totals.csv").exists()
+
+
+def test_export_imports_back_into_another_profile(home, tmp_path):
+    source = add_profile()
+    add_history(source)
+    for fmt, ext in ((exporter.CSV, "csv"), (exporter.JSONL, "json")):
+        out = tmp_path / fmt
+        exporter.export_profile(source, out, fmt=fmt, datasets=["meals", "workouts"])
+        copy = add_profile(f"copy from {fmt}")
+        table = SimpleNamespace(index=IngredientIndex(["Dal"], [[120.0, 7.0, 18.0, 2.0]]))
+        meals = importer.import_file(out / f"meals.{fmt}", importer.MEALS, copy, fmt=ext, table=table)
+        workouts = importer.import_file(out / f"workouts.{fmt}", importer.WORKOUTS, copy, fmt=ext)
+        assert (meals["imported"], meals["skipped"], workouts["imported"], workouts["skipped"]) == (90, 0, 60, 0)
+        assert rows("recipes.db", MEALS, copy) == rows("recipes.db", MEALS, source)
+        assert rows("workout_data.db", WORKOUTS, copy) == rows("workout_data.db", WORKOUTS, source)
+
+
+def test_parquet_keeps_fractions_and_nulls_what_does_not_fit(home, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    typed = add_profile(weight=70.5, height="172.5")
+    untyped = add_profile(weight="seventy", height="")
+    add_history(typed)
+    stats = exporter.export_profile(typed, tmp_path / "typed", fmt=exporter.PARQUET, chunk_size=7)
+    profile = pq.read_table(tmp_path / "typed" / "profile.parquet").to_pylist()
+    assert (profile[0]["weight"], profile[0]["height"], profile[0]["age"]) == (70.5, 172.5, 30)
+    workouts = pq.read_table(tmp_path / "typed" / "workouts.parquet")
+    assert workouts.num_rows == stats["workouts"] == 60
+    assert str(workouts.schema.field("weight").type) == "double"
+
+    exporter.export_profile(untyped, tmp_path / "untyped", fmt=exporter.PARQUET, datasets=["profile"])
+    profile = pq.read_table(tmp_path / "untyped" / "profile.parquet").to_pylist()
+    assert (profile[0]["name"], profile[0]["weight"], profile[0]["height"]) == ("export test", None, None)
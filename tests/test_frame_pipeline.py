@@ -0,0 +1,57 @@
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from frame_pipeline import CaptureThread
+
+WIDTH, HEIGHT, FRAMES = 64, 48, 10
+
+
+@pytest.fixture
+def clip(tmp_path):
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 30, (WIDTH, HEIGHT))
+    for i in range(FRAMES):
+        writer.write(np.full((HEIGHT, WIDTH, 3), i * 20, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_capture_publishes_latest_frame_and_counts_drops(clip):
+    capture = CaptureThread(clip, target_fps=200)
+    capture.start()
+    try:
+        wait_for(lambda: capture.captured >= 3)
+        frame = capture.take_latest()
+        assert frame is not None and frame.shape == (HEIGHT, WIDTH, 3)
+        assert capture.current is frame
+        # Not taking frames for a while makes the thread replace unread ones.
+        wait_for(lambda: capture.dropped >= 5)
+    finally:
+        capture.stop()
+    assert capture.isFinished()
+    stats = capture.stats()
+    pending = 1 if capture._latest is not None else 0
+    assert stats["displayed"] == 1
+    assert stats["captured"] == stats["displayed"] + stats["dropped"] + pending
+    assert (capture.take_latest() is not None) == bool(pending)
+    assert capture.take_latest() is None
+
+
+def test_stop_ends_capture(clip):
+    capture = CaptureThread(clip, target_fps=200)
+    capture.start()
+    wait_for(lambda: capture.captured >= 1)
+    capture.stop()
+    captured = capture.captured
+    time.sleep(0.1)
+    assert capture.captured == captured
@@ -0,0 +1,97 @@
+import csv
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import importer
+from ingredient_index import IngredientIndex
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["date", "workout", "exercise", "sets", "reps", "weight"])
+        writer.writerows(rows)
+
+
+def test_fingerprint_changes_with_same_size_and_head(tmp_path):
+    path = tmp_path / "workouts.csv"
+    rows = [["2024-01-01", "Push", "Bench", 3, 8, 60]] * 5000
+    write_csv(path, rows + [["2024-01-02", "Pull", "Row", 3, 8, 50]])
+    before = importer.fingerprint(path)
+    write_csv(path, rows + [["2024-01-02", "Pull", "Row", 3, 8, 55]])
+    assert importer.fingerprint(path) != before
+
+
+def test_resolve_takes_only_exact_names():
+    index = IngredientIndex(["Cheese sandwich", "Paneer tikka"], [[300, 12, 30, 14], [250, 18, 6, 16]])
+    assert index.resolve(["paneer TIKKA", "cheese", "Cheese sandwich "]).tolist() == [1, -1, 0]
+
+
+class Interrupted(Exception):
+    pass
+
+
+def add_profile():
+    import db
+    with db.get_connection("entries.db") as conn:
+        return conn.execute("INSERT INTO entries (name) VALUES ('import test')").lastrowid
+
+
+def test_interrupted_import_resumes_without_duplicates(home, tmp_path):
+    import db
+    path = tmp_path / "meals.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["date", "meal", "food", "servings", "calories", "protein", "carbs", "fat"])
+        for i in range(1000):
+            day = f"2024-05-{i % 20 + 1:02d}"
+            if i % 10 == 0:
+                writer.writerow([day, "Lunch", "dal", 2, "", "", "", ""])
+            else:
+                writer.writerow([day, "Lunch", f"food {i}", "", 100 + i, 5, 12, 3])
+    table = SimpleNamespace(index=IngredientIndex(["Dal"], [[120.0, 7.0, 18.0, 2.0]]))
+    profile_id = add_profile()
+    chunk_size, stop_after = 150, 3
+
+    def interrupt(stats):
+        if stats["rows"] >= stop_after * chunk_size:
+            raise Interrupted
+
+    with pytest.raises(Interrupted):
+        importer.import_file(str(path), importer.MEALS, profile_id, chunk_size=chunk_size, table=table,
+                             progress=interrupt)
+    assert importer.import_progress(importer.MEALS, str(path), profile_id) == (stop_after * chunk_size, False)
+
+    stats = importer.import_file(str(path), importer.MEALS, profile_id, chunk_size=chunk_size, table=table)
+    assert stats["resumed_from"] == stop_after * chunk_size
+    assert stats["rows"] == 1000 - stop_after * chunk_size
+    assert stats["finished"]
+
+    conn = db.get_connection("recipes.db")
+    counts = conn.execute("""SELECT COUNT(*), COUNT(DISTINCT ingredient) FROM recipe_ingredients
+                             WHERE profile_id = ?""", (profile_id,)).fetchone()
+    assert counts == (1000, 901)  # 900 distinct foods plus "Dal", resolved 100 times
+    totals = conn.execute("SELECT date, cal, prot, carbs, fat FROM daily_totals WHERE profile_id = ? ORDER BY date",
+                          (profile_id,)).fetchall()
+    expected = conn.execute("""SELECT date, SUM(calories), SUM(protein), SUM(carbs), SUM(fat)
+                               FROM recipe_ingredients WHERE profile_id = ? GROUP BY date ORDER BY date""",
+                            (profile_id,)).fetchall()
+    assert [(day, *map(pytest.approx, values)) for day, *values in totals] == expected
+    assert importer.import_file(str(path), importer.MEALS, profile_id, table=table)["rows"] == 0
+
+
+def test_json_array_streams_records_larger_than_a_read(tmp_path):
+    records = [{"date": "2024-01-01", "workout": "Push", "exercise": f"ex {i}", "sets": 3} for i in range(50)]
+    records[20]["notes"] = "x" * (importer.JSON_READ_BYTES * 3)
+    path = tmp_path / "workouts.json"
+    path.write_text(json.dumps(records, indent=2))
+    assert list(importer.iter_json(str(path))) == records
+
+
+def test_json_lines_input(tmp_path):
+    records = [{"date": "2024-01-01", "workout": "Push", "exercise": f"ex {i}"} for i in range(5)]
+    path = tmp_path / "workouts.jsonl"
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n\n")
+    assert list(importer.read_records(str(path))) == records
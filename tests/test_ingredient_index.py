@@ -0,0 +1,29 @@
+import numpy as np
+
+from ingredient_index import IngredientIndex
+from nutrition_table import load_nutrition_table
+
+NAMES = ["Chai", "Masala chai", "Dal", "a", "ch", "Aloo gobi", "Paneer tikka", "Pav bhaji"]
+
+
+def scan(names, text, limit):
+    query = text.strip().lower()
+    hits = [row for row, name in enumerate(names) if query in name.lower()]
+    return hits if limit is None else hits[:limit]
+
+
+def test_short_queries_match_a_full_scan():
+    index = IngredientIndex(NAMES, np.zeros((len(NAMES), 4)))
+    for text in ["a", "ch", "CH", " i", "ai", "q", "zq", "é"]:
+        for limit in (1, 3, None):
+            assert index.search(text, limit=limit) == scan(NAMES, text, limit)
+
+
+def test_cached_table_answers_short_queries(tmp_path):
+    csv_path = tmp_path / "food.csv"
+    csv_path.write_text("Ingredient,Calories,Protein,Carbs,Fat\n" + "".join(f"{name},1,2,3,4\n" for name in NAMES))
+    table = load_nutrition_table(str(csv_path), str(tmp_path / "cache"))
+    reopened = load_nutrition_table(str(csv_path), str(tmp_path / "cache"))
+    for index in (table.index, reopened.index):
+        assert index.search("ch", limit=None) == scan(NAMES, "ch", None)
+        assert index.search("a", limit=None) == scan(NAMES, "a", None)
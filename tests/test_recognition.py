@@ -0,0 +1,49 @@
+import numpy as np
+from PyQt6.QtCore import QCoreApplication
+
+from recognition import FakeModel, RecognitionService
+
+
+def frames(count):
+    return [np.zeros((8, 8, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def idle_service(**kwargs):
+    # No workers, so submitted frames stay queued where the test can inspect them.
+    return RecognitionService(FakeModel(latency=0), max_workers=0, **kwargs)
+
+
+def test_cancel_removes_queued_request():
+    service = idle_service()
+    first, second = service.submit_batch(frames(2))
+    service.cancel(first)
+    assert service.pending() == 1
+    assert service._cancelled == set()
+    assert [request_id for request_id, _ in service._next_job()] == [second]
+
+
+def test_cancel_ignores_unknown_ids():
+    service = idle_service()
+    service.submit_batch(frames(1))
+    service.cancel(12345)
+    assert service._cancelled == set()
+    assert service.pending() == 1
+
+
+def test_max_pending_counts_frames():
+    QCoreApplication.instance() or QCoreApplication([])
+    service = idle_service(max_pending=3, batch_size=5)
+    ids = service.submit_batch(frames(5))
+    assert service.pending() == 3
+    assert [request_id for request_id, _ in service._next_job()] == ids[2:]
+
+
+def test_dropped_frames_fail_after_submit_returns():
+    app = QCoreApplication.instance() or QCoreApplication([])
+    service = idle_service(max_pending=1)
+    failures = []
+    service.failed.connect(lambda request_id, error: failures.append(request_id))
+    ids = service.submit_batch(frames(3))
+    assert failures == []
+    app.processEvents()
+    assert failures == ids[:2]
@@ -0,0 +1,74 @@
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+OPEN_AND_CLOSE = """
+import sys
+from PyQt6.QtWidgets import QApplication
+from recognition import FakeModel
+from scanner import Scanner
+
+app = QApplication(sys.argv)
+for _ in range(20):
+    Scanner(model=FakeModel(latency=0), source="missing.mp4").close()
+"""
+
+
+def test_scanner_closed_right_after_opening_returns(tmp_path):
+    # Runs in a child process so a capture thread that never stops fails the test instead of hanging it.
+    (tmp_path / "nutrifit").mkdir()
+    env = dict(os.environ, HOME=str(tmp_path), QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run([sys.executable, "-c", OPEN_AND_CLOSE], cwd=SRC, env=env, timeout=60,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def running_scanner(tmp_path):
+    import cv2
+    import numpy as np
+    from PyQt6.QtWidgets import QApplication
+    from recognition import FakeModel
+    from scanner import Scanner
+
+    app = QApplication.instance() or QApplication([])
+    clip = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(clip, cv2.VideoWriter_fourcc(*"MJPG"), 30, (64, 48))
+    for i in range(10):
+        writer.write(np.full((48, 64, 3), i * 20, dtype=np.uint8))
+    writer.release()
+
+    scanner = Scanner(model=FakeModel(latency=0), source=clip, target_fps=100)
+    while scanner.last_frame is None:
+        app.processEvents()
+    return app, scanner
+
+
+def test_freeze_stops_reading_the_camera(home, tmp_path):
+    app, scanner = running_scanner(tmp_path)
+    scanner.freeze_and_scan()
+    assert not scanner.capture.isRunning()
+    captured = scanner.capture.captured
+    for _ in range(20):
+        app.processEvents()
+    assert scanner.capture.captured == captured
+    assert scanner.last_frame is not None
+    scanner.close()
+
+
+def test_meal_queue_holds_at_most_the_pending_limit(home, tmp_path):
+    app, scanner = running_scanner(tmp_path)
+    limit = scanner.recognizer.max_pending
+    for _ in range(limit + 3):
+        scanner.queue_frame()
+    assert len(scanner.scan_queue) == limit
+    assert str(limit) in scanner.statusBar().currentMessage()
+    failures = []
+    scanner.recognizer.failed.connect(lambda request_id, error: failures.append(error))
+    scanner.recognizer.max_workers = 0  # keep the meal queued so nothing but a drop could fail it
+    scanner.scan_queued()
+    app.processEvents()
+    assert failures == []
+    assert scanner.recognizer.pending() == limit
+    scanner.close()
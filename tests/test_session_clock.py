@@ -0,0 +1,58 @@
+import random
+
+from PyQt6.QtWidgets import QApplication
+
+from session_clock import SessionClock
+
+app = QApplication.instance() or QApplication([])
+
+
+class FakeTime:
+    """Monotonic millisecond source the test moves by hand."""
+
+    def __init__(self):
+        self.ms = 0
+
+    def __call__(self):
+        return self.ms
+
+
+def shown_values(clock):
+    shown = {"second": 0, "phase": 0, "cycle": 0}
+    clock.second_changed.connect(lambda value: shown.__setitem__("second", value))
+    clock.phase_changed.connect(lambda value: shown.__setitem__("phase", value))
+    clock.cycle_changed.connect(lambda value: shown.__setitem__("cycle", value))
+    return shown
+
+
+def test_start_restarts_a_running_clock():
+    now = FakeTime()
+    clock = SessionClock(now=now)
+    clock.start()
+    now.ms += 7000
+    assert clock.elapsed() == 7000
+    clock.start()
+    assert clock.elapsed() == 0
+    now.ms += 500
+    assert clock.elapsed() == 500
+
+
+def test_no_drift_with_late_ticks_and_pauses():
+    rng = random.Random(0)
+    now = FakeTime()
+    clock = SessionClock(phase_ms=4000, phases=3, now=now)
+    shown = shown_values(clock)
+    clock.start()
+    running_ms = 0
+    while running_ms < 30 * 60_000:
+        if rng.random() < 0.01:
+            clock.pause()
+            now.ms += rng.randint(500, 20_000)
+            clock.resume()
+        step = clock.timer.interval() + rng.choice([0, 0, 0, rng.randint(1, 50), rng.randint(50, 700)])
+        now.ms += step
+        running_ms += step
+        clock._on_timeout()
+        # Expected values come from the fake source's running time, not from the clock.
+        expected = {"second": running_ms // 1000, "phase": running_ms // 4000 % 3, "cycle": running_ms // 12_000}
+        assert shown == expected, f"drift after {running_ms} ms"
@@ -0,0 +1,32 @@
+from PyQt6.QtWidgets import QApplication
+
+app = QApplication.instance() or QApplication([])
+
+
+class FakeTime:
+    def __init__(self):
+        self.ms = 0
+
+    def __call__(self):
+        return self.ms
+
+
+def test_session_ends_after_the_chosen_cycles_of_the_session_clock(home):
+    from stopwatch import Stopwatch
+    stopwatch = Stopwatch()
+    now = FakeTime()
+    stopwatch.session.now = now
+    stopwatch.spinBox_2.setValue(1)
+    stopwatch.start1()
+    cycle_ms = stopwatch.session.cycle_ms
+    for _ in range(4 * 3):
+        now.ms += stopwatch.session.phase_ms
+        stopwatch.session._on_timeout()
+    assert stopwatch.cycles == 4
+    assert not stopwatch.is_timer_stopped
+    now.ms = 5 * cycle_ms
+    stopwatch.session._on_timeout()
+    assert stopwatch.is_timer_stopped
+    assert not stopwatch.session.running
+    assert stopwatch.ready_go_done.text() == "Done"
+    assert stopwatch.cycle_counter_label.text() == "Number of Cycles completed: 05"
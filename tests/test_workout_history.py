@@ -0,0 +1,92 @@
+import random
+import sqlite3
+
+from PyQt6.QtWidgets import QApplication
+
+from migrations import migrate
+
+app = QApplication.instance() or QApplication([])
+
+CATALOG = "SELECT profile_id, workout_name, entries, last_date FROM workout_catalog ORDER BY 1, 2"
+GROUPED = """SELECT profile_id, workout_name, COUNT(*), MAX(date) FROM workouts
+             WHERE profile_id IS NOT NULL AND workout_name IS NOT NULL
+             GROUP BY profile_id, workout_name ORDER BY 1, 2"""
+INSERT = "INSERT INTO workouts (workout_name, exercise_name, sets, reps, weight, date, profile_id) VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+
+def random_rows(rng, count):
+    return [(rng.choice(["Push", "Pull", "Legs"]), f"ex {rng.randint(0, 5)}", 3, 8, 40.0,
+             f"2024-0{rng.randint(1, 9)}-{rng.randint(10, 28)}", rng.choice([1, 2])) for _ in range(count)]
+
+
+def workout_db(tmp_path, target=None):
+    conn = sqlite3.connect(tmp_path / "workout_data.db")
+    migrate(conn, "workout_data.db", target)
+    return conn
+
+
+def test_catalog_matches_group_by_after_insert_rename_and_delete(tmp_path):
+    rng = random.Random(5)
+    conn = workout_db(tmp_path)
+    with conn:
+        conn.executemany(INSERT, random_rows(rng, 300))
+    assert conn.execute(CATALOG).fetchall() == conn.execute(GROUPED).fetchall()
+    with conn:
+        conn.execute("UPDATE workouts SET workout_name = 'Upper' WHERE workout_name = 'Push' AND id % 2 = 0")
+        conn.execute("UPDATE workouts SET date = '2025-01-01' WHERE id % 7 = 0")
+        conn.execute("UPDATE workouts SET profile_id = 3 WHERE id % 11 = 0")
+    assert conn.execute(CATALOG).fetchall() == conn.execute(GROUPED).fetchall()
+    with conn:
+        conn.execute("DELETE FROM workouts WHERE workout_name = 'Legs' AND profile_id = 1")
+        conn.execute("DELETE FROM workouts WHERE id % 3 = 0")
+    assert conn.execute(CATALOG).fetchall() == conn.execute(GROUPED).fetchall()
+    with conn:
+        conn.execute("DELETE FROM workouts")
+    assert conn.execute(CATALOG).fetchall() == []
+
+
+def test_migration_backfills_catalog_from_existing_rows(tmp_path):
+    conn = workout_db(tmp_path, target=2)
+    with conn:
+        conn.executemany(INSERT, random_rows(random.Random(6), 200))
+    migrate(conn, "workout_data.db")
+    assert conn.execute(CATALOG).fetchall() == conn.execute(GROUPED).fetchall()
+
+
+def test_paging_returns_every_set_once_with_one_header_per_session(home):
+    import db
+    from store import INSERT_WORKOUT_ROW
+    from workout_display import WorkoutHistoryModel
+
+    rng = random.Random(7)
+    rows = []
+    for day in range(1, 21):
+        # Sessions of 1 to 20 sets, so many of them span a page boundary.
+        for n in range(rng.randint(1, 20)):
+            rows.append(("Push", f"ex {n}", rng.randint(1, 5), rng.randint(1, 12), float(rng.randint(0, 100)),
+                         f"2024-03-{day:02d}", 1))
+    rows.append(("Pull", "row", 3, 8, 50.0, "2024-03-05", 1))
+    conn = db.get_connection("workout_data.db")
+    with conn:
+        conn.executemany(INSERT_WORKOUT_ROW, rows)
+    expected = conn.execute("""SELECT date, exercise_name, sets, reps, weight FROM workouts
+                               WHERE profile_id = 1 AND workout_name = 'Push' ORDER BY date DESC, id DESC""").fetchall()
+    totals = dict((day, (entries, volume)) for day, entries, volume in conn.execute(
+        """SELECT date, COUNT(*), SUM(sets * reps * weight) FROM workouts
+           WHERE profile_id = 1 AND workout_name = 'Push' GROUP BY date"""))
+
+    model = WorkoutHistoryModel(1, page_size=7)
+    model.set_workout("Push")
+    while model.canFetchMore():
+        model.fetchMore()
+
+    seen, headers, day = [], [], None
+    for row in model.rows:
+        if row[0] == "session":
+            _, day, entries, volume = row
+            headers.append(day)
+            assert (entries, volume) == totals[day]
+        else:
+            seen.append((day, *row[1:]))
+    assert seen == expected
+    assert headers == sorted(totals, reverse=True)